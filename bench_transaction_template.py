@@ -0,0 +1,39 @@
+import binascii
+import timeit
+from decimal import Decimal
+
+from transaction.generate_payment import _build_transfer, build_transfer_template
+
+SOURCE = 'GAH6333FKTNQGSFSDLCANJIE52N7IGMS7DUIWR6JIMQZE7XKWEQLJQAY'
+TRANSACTION_SOURCE = 'GDSB3JZDYKLYKWZ6NXDPPGPCYJ32ISMTZ2LVF5PYQGY4B4FGNIU2M5BJ'
+DESTINATION = 'GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6'
+AMOUNT = Decimal('5')
+
+
+def build_transfer_xdr(sequence):
+    builder = _build_transfer(TRANSACTION_SOURCE, SOURCE, DESTINATION, AMOUNT, Decimal(0), sequence=sequence)
+    return builder.gen_xdr().decode('utf8'), binascii.hexlify(builder.te.hash_meta()).decode()
+
+
+def build_series_with_builder(count):
+    return [build_transfer_xdr(sequence) for sequence in range(1, count + 1)]
+
+
+def build_series_with_template(count):
+    template = build_transfer_template(TRANSACTION_SOURCE, SOURCE, DESTINATION, AMOUNT, Decimal(0))
+    return [template.build(sequence) for sequence in range(1, count + 1)]
+
+
+def bench():
+    assert build_series_with_builder(100) == build_series_with_template(100)
+    for count in (1000, 10000, 100000):
+        builder_time = timeit.timeit(lambda: build_series_with_builder(count), number=1)
+        template_time = timeit.timeit(lambda: build_series_with_template(count), number=1)
+        print(
+            f'{count} transactions: builder {builder_time:.3f}s, template {template_time:.3f}s, '
+            f'speedup {builder_time / template_time:.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    bench()
@@ -16,4 +16,91 @@ settings['LOG_OPS'] = {
     'SUBMIT': '[SUBMIT]'
 }
 
-settings['SENTRY_ENDPOINT'] = os.getenv('SENTRY_ENDPOINT', False)
\ No newline at end of file
+settings['SENTRY_ENDPOINT'] = os.getenv('SENTRY_ENDPOINT', False)
+
+settings['HORIZON_CONNECTION_LIMIT'] = int(os.getenv('HORIZON_CONNECTION_LIMIT', 100))
+settings['HORIZON_CONNECTION_LIMIT_PER_HOST'] = int(os.getenv('HORIZON_CONNECTION_LIMIT_PER_HOST', 100))
+settings['HORIZON_DNS_CACHE_TTL'] = int(os.getenv('HORIZON_DNS_CACHE_TTL', 300))
+settings['HORIZON_KEEPALIVE_TIMEOUT'] = float(os.getenv('HORIZON_KEEPALIVE_TIMEOUT', 30))
+settings['HORIZON_TIMEOUT'] = float(os.getenv('HORIZON_TIMEOUT', 60))
+
+# Account cache is disabled when ACCOUNT_CACHE_TTL is 0.
+settings['ACCOUNT_CACHE_TTL'] = float(os.getenv('ACCOUNT_CACHE_TTL', 0))
+settings['ACCOUNT_CACHE_SIZE'] = int(os.getenv('ACCOUNT_CACHE_SIZE', 10000))
+
+# Batch wallet lookup resolves at most WALLET_BATCH_CONCURRENCY addresses at the same time.
+settings['WALLET_BATCH_CONCURRENCY'] = int(os.getenv('WALLET_BATCH_CONCURRENCY', 20))
+settings['WALLET_BATCH_MAX_SIZE'] = int(os.getenv('WALLET_BATCH_MAX_SIZE', 500))
+
+# Number of ledger close times which are kept to seek wallet history by date
+settings['LEDGER_INDEX_SIZE'] = int(os.getenv('LEDGER_INDEX_SIZE', 10000))
+
+# Filtered wallet history reads HISTORY_PAGE_SIZE effects per Horizon request and at most
+# HISTORY_MAX_PAGES requests per page, the next link resumes where reading stopped.
+settings['HISTORY_PAGE_SIZE'] = int(os.getenv('HISTORY_PAGE_SIZE', 200))
+settings['HISTORY_MAX_PAGES'] = int(os.getenv('HISTORY_MAX_PAGES', 10))
+
+# Wallet history is served from a local copy of account effects stored at EFFECTS_STORE_PATH,
+# empty path disables the store. Effects newer than the stored ones are read from Horizon
+# at most once per EFFECTS_STORE_MAX_AGE seconds for each account.
+settings['EFFECTS_STORE_PATH'] = os.getenv('EFFECTS_STORE_PATH', '')
+settings['EFFECTS_STORE_MAX_AGE'] = float(os.getenv('EFFECTS_STORE_MAX_AGE', 1))
+# Each request stores at most EFFECTS_STORE_SYNC_MAX_PAGES pages of effects, history of an account is read
+# from Horizon until all of its effects are stored. Sync state is kept for EFFECTS_STORE_MAX_ACCOUNTS accounts.
+settings['EFFECTS_STORE_SYNC_MAX_PAGES'] = int(os.getenv('EFFECTS_STORE_SYNC_MAX_PAGES', 10))
+settings['EFFECTS_STORE_MAX_ACCOUNTS'] = int(os.getenv('EFFECTS_STORE_MAX_ACCOUNTS', 10000))
+
+# Memo index is persisted in SQLite at MEMO_INDEX_PATH, by default next to this package so it doesn't
+# depend on working directory. Empty path keeps the index in memory, it is rebuilt from Horizon after
+# a restart and keeps memos of at most MEMO_INDEX_MAX_ACCOUNTS accounts, the least recently synced first evicted.
+settings['MEMO_INDEX_PATH'] = os.getenv(
+    'MEMO_INDEX_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'memo_index.sqlite3')
+)
+settings['MEMO_INDEX_MAX_ACCOUNTS'] = int(os.getenv('MEMO_INDEX_MAX_ACCOUNTS', 10000))
+
+# Memo filter answers "memo never used" for MEMO_FILTER_MAX_AGE seconds after each sync, 0 disables it.
+settings['MEMO_FILTER_MAX_AGE'] = float(os.getenv('MEMO_FILTER_MAX_AGE', 5))
+settings['MEMO_FILTER_CAPACITY'] = int(os.getenv('MEMO_FILTER_CAPACITY', 100000))
+settings['MEMO_FILTER_FALSE_POSITIVE_RATE'] = float(os.getenv('MEMO_FILTER_FALSE_POSITIVE_RATE', 0.01))
+settings['MEMO_FILTER_MAX_BYTES'] = int(os.getenv('MEMO_FILTER_MAX_BYTES', 131072))
+# Memory of filters of all accounts, the least recently used filter is evicted first.
+settings['MEMO_FILTER_TOTAL_BYTES'] = int(os.getenv('MEMO_FILTER_TOTAL_BYTES', 16777216))
+
+# Transactions are encoded on event loop when BUILD_POOL_SIZE is 0, otherwise transactions which have
+# at least BUILD_OFFLOAD_THRESHOLD operations are encoded in a pool of BUILD_POOL_SIZE processes.
+settings['BUILD_POOL_SIZE'] = int(os.getenv('BUILD_POOL_SIZE', 0))
+settings['BUILD_OFFLOAD_THRESHOLD'] = int(os.getenv('BUILD_OFFLOAD_THRESHOLD', 20))
+
+# Sequence numbers of transaction source accounts are reserved locally for SEQUENCE_LEASE_SECONDS,
+# 0 disables the allocator and every build reads sequence number from Horizon. Sequence numbers of
+# at most SEQUENCE_ALLOCATOR_MAX_ACCOUNTS accounts are kept, accounts without live leases are evicted first.
+settings['SEQUENCE_LEASE_SECONDS'] = float(os.getenv('SEQUENCE_LEASE_SECONDS', 30))
+settings['SEQUENCE_ALLOCATOR_MAX_ACCOUNTS'] = int(os.getenv('SEQUENCE_ALLOCATOR_MAX_ACCOUNTS', 10000))
+
+# Comma separated addresses of channel accounts, a channel is chosen as transaction source
+# when a request doesn't specify transaction_source_address.
+settings['CHANNEL_ACCOUNTS'] = [address for address in os.getenv('CHANNEL_ACCOUNTS', '').split(',') if address]
+
+# Transactions submitted asynchronously are submitted by SUBMIT_CONCURRENCY workers,
+# at most SUBMIT_QUEUE_SIZE transactions wait in the queue, otherwise clients are asked to retry after SUBMIT_RETRY_AFTER seconds.
+settings['SUBMIT_CONCURRENCY'] = int(os.getenv('SUBMIT_CONCURRENCY', 10))
+settings['SUBMIT_QUEUE_SIZE'] = int(os.getenv('SUBMIT_QUEUE_SIZE', 1000))
+settings['SUBMIT_RETRY_AFTER'] = int(os.getenv('SUBMIT_RETRY_AFTER', 1))
+settings['SUBMISSION_REGISTRY_SIZE'] = int(os.getenv('SUBMISSION_REGISTRY_SIZE', 100000))
+# Signed transactions are checked locally before submitting, sequence and signatures are checked for cached accounts.
+settings['TRANSACTION_PREVALIDATION'] = bool(int(os.getenv('TRANSACTION_PREVALIDATION', 1)))
+# Signatures are only rejected against signers which were cached within PREVALIDATION_SIGNERS_MAX_AGE seconds.
+settings['PREVALIDATION_SIGNERS_MAX_AGE'] = float(os.getenv('PREVALIDATION_SIGNERS_MAX_AGE', 1))
+# Batch submission submits at most BATCH_SUBMIT_CONCURRENCY transactions of a batch at the same time.
+settings['BATCH_SUBMIT_CONCURRENCY'] = int(os.getenv('BATCH_SUBMIT_CONCURRENCY', 10))
+settings['BATCH_SUBMIT_MAX_SIZE'] = int(os.getenv('BATCH_SUBMIT_MAX_SIZE', 100))
+# Seconds to look up transaction which is unknown to submission registry on Horizon before submitting it
+settings['DUPLICATE_CHECK_TIMEOUT'] = float(os.getenv('DUPLICATE_CHECK_TIMEOUT', 2))
+
+# Maximum seconds which a request with ?wait=<seconds> waits for its submission or transaction
+settings['LONG_POLL_MAX_WAIT'] = float(os.getenv('LONG_POLL_MAX_WAIT', 30))
+# Confirmed transaction details are cached up to TRANSACTION_CACHE_MAX_BYTES of JSON, 0 disables the cache.
+settings['TRANSACTION_CACHE_MAX_BYTES'] = int(os.getenv('TRANSACTION_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+settings['TRANSACTION_CACHE_MAX_AGE'] = int(os.getenv('TRANSACTION_CACHE_MAX_AGE', 31536000))
+# Seconds between polls of the transaction watcher while requests are waiting for transactions
+settings['TRANSACTION_WATCH_INTERVAL'] = float(os.getenv('TRANSACTION_WATCH_INTERVAL', 1))
@@ -1,15 +1,18 @@
 from decimal import Decimal
 from json import JSONDecodeError
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from aiohttp import web
 from conf import settings
 from escrow.get_escrow_wallet import get_escrow_wallet_detail
+from ndjson import NDJSON_CONTENT_TYPE, is_stream_request, ndjson_line
 from router import reverse
-from transaction.generate_payment import build_unsigned_transfer
+from transaction.generate_payment import build_transfer_template, check_transfer_destination
 from transaction.transaction import (get_current_sequence_number, get_signers,
                                      get_threshold_weight)
 
+PRESIGNED_WINDOW_SIZE = 100
+
 
 async def get_presigned_tx_xdr_from_request(request: web.Request) -> web.Response:
     """AIOHttp Request create account xdr and presigned transaction xdr"""
@@ -21,75 +24,199 @@ async def get_presigned_tx_xdr_from_request(request: web.Request) -> web.Respons
 
     escrow_address = request.match_info.get("escrow_address")
     transaction_source_address = json_response.get('transaction_source_address', escrow_address)
+    start, count, sequence_number = get_window_from_request(request)
     escrow = await get_escrow_wallet_detail(escrow_address)
 
     destination_address = escrow["data"]["destination_address"]
     cost_per_tx = escrow["data"]["cost_per_transaction"]
     balance = escrow['asset'][settings['ASSET_CODE']]
 
+    if is_stream_request(request):
+        return await stream_presigned_tx_xdr(
+            request,
+            escrow_address,
+            transaction_source_address,
+            destination_address,
+            Decimal(balance),
+            Decimal(cost_per_tx),
+            start,
+            count,
+            sequence_number
+        )
+
     result = await get_presigned_tx_xdr(
         escrow_address,
         transaction_source_address,
         destination_address,
         Decimal(balance),
-        Decimal(cost_per_tx)
+        Decimal(cost_per_tx),
+        start,
+        count,
+        sequence_number
     )
 
     return web.json_response(result)
 
 
+def get_window_from_request(request: web.Request) -> Tuple[int, Optional[int], Optional[int]]:
+    """Get start, count and sequence number of requested window of presigned transactions
+
+        Count is None when client doesn't ask for a window, so the whole series would be generated.
+    """
+    try:
+        start = int(request.query.get('start', 0))
+        count = request.query.get('count')
+        if count is None and 'start' in request.query:
+            count = PRESIGNED_WINDOW_SIZE
+        count = int(count) if count is not None else None
+        sequence_number = request.query.get('sequence_number')
+        sequence_number = int(sequence_number) if sequence_number is not None else None
+    except ValueError:
+        raise web.HTTPBadRequest(reason='Invalid. Parameter start, count and sequence_number should be integer.')
+
+    if start < 0 or (count is not None and count <= 0):
+        raise web.HTTPBadRequest(reason='Invalid. Parameter start should not be negative and count should be positive.')
+    return start, count, sequence_number
+
+
+async def stream_presigned_tx_xdr(
+    request: web.Request,
+    escrow_address:str,
+    transaction_source_address:str,
+    destination_address:str,
+    starting_balance:Decimal,
+    cost_per_tx:Decimal,
+    start:int = 0,
+    count:int = None,
+    sequence_number:int = None
+) -> web.StreamResponse:
+    """Write presigned transactions as NDJSON, first line is signers and the others are presigned transactions"""
+
+    header, presigneds = await _get_presigned_tx(
+        escrow_address,
+        transaction_source_address,
+        destination_address,
+        starting_balance,
+        cost_per_tx,
+        start,
+        count,
+        sequence_number
+    )
+
+    response = web.StreamResponse(headers={'Content-Type': NDJSON_CONTENT_TYPE})
+    await response.prepare(request)
+    await response.write(ndjson_line(header))
+    for presigned in presigneds:
+        await response.write(ndjson_line(presigned))
+    await response.write_eof()
+    return response
+
+
 async def get_presigned_tx_xdr(
     escrow_address:str,
     transaction_source_address:str,
     destination_address:str,
     starting_balance:Decimal,
-    cost_per_tx:Decimal
+    cost_per_tx:Decimal,
+    start:int = 0,
+    count:int = None,
+    sequence_number:int = None
 ) -> Dict:
-    """Get XDR presigned transaction of promote deal"""
+    """Get XDR presigned transaction of promote deal
 
-    tx_count = int(starting_balance/cost_per_tx)
-    sequence_number = await get_current_sequence_number(escrow_address)
+        Args:
+            start: index of the first transaction of the window in the series
+            count: number of transactions in the window, the whole series is generated if it is None
+            sequence_number: current sequence number of escrow which the series is based on [optional]
+    """
 
-    async def _get_unsigned_transfer(
-        source_address: str,
+    header, presigneds = await _get_presigned_tx(
+        escrow_address,
         transaction_source_address,
-        destination: str,
-        amount: Decimal,
-        sequence:int
-    ) -> Dict:
-        """Get unsigned transfer transaction and signers
-
-            Args:
-                source_address: Owner of operation
-                destination: address of receiving wallet
-                amount: amount of money that would be transferred
-                sequence: sequence number of escrow account
-        """
-
-        unsigned_xdr, tx_hash = await build_unsigned_transfer(
-            transaction_source_address, source_address, destination, amount, Decimal(0), None, sequence=sequence
-        )
-        host: str = settings['HOST']
-        result = {
-            '@id': reverse('transaction', transaction_hash=tx_hash),
-            'xdr': unsigned_xdr,
-            'sequence_number': sequence + 1,
-            'transaction_hash': tx_hash
-        }
-        return result
-
-    presigneds = []
-    for i in range(0, tx_count):
-        presigneds.append(await _get_unsigned_transfer(
-            escrow_address,
-            transaction_source_address,
-            destination_address,
-            cost_per_tx,
-            sequence=int(sequence_number)+i))
+        destination_address,
+        starting_balance,
+        cost_per_tx,
+        start,
+        count,
+        sequence_number
+    )
+    result = {**header, 'xdr': list(presigneds)}
+    return result
+
+
+async def _get_presigned_tx(
+    escrow_address:str,
+    transaction_source_address:str,
+    destination_address:str,
+    starting_balance:Decimal,
+    cost_per_tx:Decimal,
+    start:int = 0,
+    count:int = None,
+    sequence_number:int = None
+) -> Tuple[Dict, Iterator[Dict]]:
+    """Get signers with cursors of the window and iterator of presigned transactions in the window"""
 
-    result = {
+    tx_count = int(starting_balance/cost_per_tx)
+    if sequence_number is None:
+        sequence_number = int(await get_current_sequence_number(escrow_address))
+
+    presigneds = await get_presigned_tx_iterator(
+        escrow_address,
+        transaction_source_address,
+        destination_address,
+        cost_per_tx,
+        sequence_number,
+        start,
+        tx_count if count is None else min(start + count, tx_count)
+    )
+    header = {
         'min_signer': await get_threshold_weight(escrow_address, 'payment'),
         'signers': await get_signers(escrow_address),
-        'xdr': presigneds
     }
-    return result
+    if count is not None:
+        url = reverse('generate-presigned-transactions', escrow_address=escrow_address)
+        next_window = f'{url}?start={start + count}&count={count}&sequence_number={sequence_number}'
+        previous_window = f'{url}?start={max(start - count, 0)}&count={count}&sequence_number={sequence_number}'
+        header.update({
+            'start': start,
+            'count': count,
+            'total': tx_count,
+            'sequence_number': sequence_number,
+            'next': next_window if start + count < tx_count else None,
+            'previous': previous_window if start > 0 else None,
+        })
+    return header, presigneds
+
+
+async def get_presigned_tx_iterator(
+    escrow_address:str,
+    transaction_source_address:str,
+    destination_address:str,
+    cost_per_tx:Decimal,
+    sequence_number:int,
+    start:int,
+    stop:int
+) -> Iterator[Dict]:
+    """Get iterator which builds presigned transactions from index start to stop of promote deal one by one
+
+        Destination wallet is checked once, then every transaction of the series is made
+        from one transaction template because only sequence number is different between them.
+    """
+
+    if start < stop:
+        await check_transfer_destination(destination_address, cost_per_tx)
+
+    def _build_presigneds() -> Iterator[Dict]:
+        template = build_transfer_template(
+            transaction_source_address, escrow_address, destination_address, cost_per_tx, Decimal(0)
+        )
+        for sequence in range(sequence_number + start, sequence_number + stop):
+            unsigned_xdr, tx_hash = template.build(sequence)
+            yield {
+                '@id': reverse('transaction', transaction_hash=tx_hash),
+                'xdr': unsigned_xdr,
+                'sequence_number': sequence + 1,
+                'transaction_hash': tx_hash
+            }
+
+    return _build_presigneds()
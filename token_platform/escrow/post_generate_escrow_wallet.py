@@ -1,7 +1,7 @@
 import binascii
 from datetime import datetime
 from decimal import ROUND_UP, Decimal, InvalidOperation
-from typing import Dict, List, Tuple, Any
+from typing import Any, Dict, List, Optional, Tuple
 
 from aiohttp import web
 from dateutil import parser
@@ -11,7 +11,8 @@ from stellar_base.utils import DecodeError
 from conf import settings
 from transaction.transaction import get_signers, get_threshold_weight
 from router import reverse
-from stellar.wallet import get_stellar_wallet
+from stellar.build_executor import build_executor
+from stellar.channel_pool import get_transaction_source_address, reserve_channel
 
 
 async def post_generate_escrow_wallet_from_request(request: web.Request) -> web.Response:
@@ -19,7 +20,7 @@ async def post_generate_escrow_wallet_from_request(request: web.Request) -> web.
     body = await request.json()
 
     escrow_address = request.match_info['escrow_address']
-    transaction_source_address = body['transaction_source_address']
+    transaction_source_address = get_transaction_source_address(body)
     provider_address = body['provider_address']
     creator_address = body['creator_address']
     destination_address = body['destination_address']
@@ -61,7 +62,7 @@ async def post_generate_escrow_wallet_from_request(request: web.Request) -> web.
 
 async def generate_escrow_wallet(
     escrow_address: str,
-    transaction_source_address: str,
+    transaction_source_address: Optional[str],
     creator_address: str,
     destination_address: str,
     provider_address: str,
@@ -76,7 +77,7 @@ async def generate_escrow_wallet(
 
         Args:
         * escrow_address: an address of new escrow account.
-        * transaction_source_address an address from wallet pool
+        * transaction_source_address an address from wallet pool, a channel account is chosen when it is not given
         * creator_address: an address of transaction owner.
         * destination_address: an address of transaction owner.
         * provider_address: an address of ,
@@ -89,10 +90,10 @@ async def generate_escrow_wallet(
     number_of_transaction: Decimal = (starting_custom_asset / cost_per_tx_decimal) + 2
     starting_xlm: Decimal = calculate_initial_xlm(Decimal(8), number_of_transaction)
 
-    wallet = await get_stellar_wallet(transaction_source_address)
+    reserved_source_address, sequence = await reserve_channel(transaction_source_address)
     xdr, tx_hash = await build_generate_escrow_wallet_transaction(
         escrow_address=escrow_address,
-        transaction_source_address=transaction_source_address,
+        transaction_source_address=reserved_source_address,
         provider_address=provider_address,
         creator_address=creator_address,
         destination_address=destination_address,
@@ -100,7 +101,7 @@ async def generate_escrow_wallet(
         expiration_date=expiration_date,
         starting_native_asset=starting_xlm,
         starting_custom_asset=starting_custom_asset,
-        sequence=wallet.sequence,
+        sequence=sequence,
     )
 
     host = settings['HOST']
@@ -108,6 +109,7 @@ async def generate_escrow_wallet(
         '@id': reverse('escrow-generate-wallet', escrow_address=escrow_address),
         '@transaction_url': f"{host}{reverse('transaction', transaction_hash=tx_hash)}",
         'signers': [escrow_address, creator_address, provider_address],
+        'transaction_source_address': reserved_source_address,
         'xdr': xdr,
         'transaction_hash': tx_hash,
     }
@@ -216,10 +218,8 @@ async def build_generate_escrow_wallet_transaction(
     )
 
     try:
-        xdr = builder.gen_xdr()
+        xdr, tx_hash = await build_executor.encode(builder)
     except Exception as e:
         raise web.HTTPBadRequest(reason='Bad request, Please ensure parameters are valid.')
 
-    tx_hash = builder.te.hash_meta()
-
     return xdr.decode(), binascii.hexlify(tx_hash).decode()
@@ -1,3 +1,4 @@
+import json
 from decimal import Decimal
 
 from tests.test_utils import BaseTestClass
@@ -53,7 +54,10 @@ class TestGeneratePreSignedTxXDR(BaseTestClass):
             transaction_source_address,
             destination_address,
             balance,
-            cost_per_tx
+            cost_per_tx,
+            0,
+            None,
+            None
         )
 
     @unittest_run_loop
@@ -88,9 +92,10 @@ class TestGeneratePreSignedTxXDR(BaseTestClass):
     @patch('escrow.generate_pre_signed_tx_xdr.get_threshold_weight')
     @patch('escrow.generate_pre_signed_tx_xdr.get_signers')
     @patch('escrow.generate_pre_signed_tx_xdr.get_current_sequence_number')
-    @patch('escrow.generate_pre_signed_tx_xdr.build_unsigned_transfer')
-    async def test_get_presigned_tx_xdr(self, mock_biulder, mock_sequence, mock_signer, mock_threshold):
-        mock_biulder.return_value = ('xdr', 'hash')
+    @patch('escrow.generate_pre_signed_tx_xdr.check_transfer_destination')
+    @patch('escrow.generate_pre_signed_tx_xdr.build_transfer_template')
+    async def test_get_presigned_tx_xdr(self, mock_biulder, mock_check, mock_sequence, mock_signer, mock_threshold):
+        mock_biulder.return_value.build.return_value = ('xdr', 'hash')
         mock_sequence.return_value = '1'
         mock_signer.return_value = []
         mock_threshold.return_value = 2
@@ -121,6 +126,132 @@ class TestGeneratePreSignedTxXDR(BaseTestClass):
             ]
         }
         assert result == expect
+        mock_check.assert_called_once_with('GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6', Decimal('5'))
+
+    @unittest_run_loop
+    @patch('escrow.generate_pre_signed_tx_xdr.get_threshold_weight')
+    @patch('escrow.generate_pre_signed_tx_xdr.get_signers')
+    @patch('escrow.generate_pre_signed_tx_xdr.get_current_sequence_number')
+    @patch('transaction.generate_payment.get_wallet_detail')
+    async def test_get_presigned_tx_xdr_check_destination_once(self, mock_wallet, mock_sequence, mock_signer, mock_threshold):
+        mock_wallet.return_value = {'asset': {settings['ASSET_CODE']: '0'}}
+        mock_sequence.return_value = '1'
+        mock_signer.return_value = []
+        mock_threshold.return_value = 2
+        result = await get_presigned_tx_xdr(
+            'GAH6333FKTNQGSFSDLCANJIE52N7IGMS7DUIWR6JIMQZE7XKWEQLJQAY',
+            'GDSB3JZDYKLYKWZ6NXDPPGPCYJ32ISMTZ2LVF5PYQGY4B4FGNIU2M5BJ',
+            'GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6',
+            Decimal('100'),
+            Decimal('5')
+        )
+
+        mock_wallet.assert_called_once_with('GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6')
+        assert [presigned['sequence_number'] for presigned in result['xdr']] == list(range(2, 22))
+        assert len({presigned['transaction_hash'] for presigned in result['xdr']}) == 20
+
+    @unittest_run_loop
+    @patch('escrow.generate_pre_signed_tx_xdr.get_escrow_wallet_detail')
+    @patch('escrow.generate_pre_signed_tx_xdr.get_threshold_weight')
+    @patch('escrow.generate_pre_signed_tx_xdr.get_signers')
+    @patch('escrow.generate_pre_signed_tx_xdr.get_current_sequence_number')
+    @patch('escrow.generate_pre_signed_tx_xdr.check_transfer_destination')
+    @patch('escrow.generate_pre_signed_tx_xdr.build_transfer_template')
+    async def test_get_presigned_tx_xdr_from_request_as_stream(
+        self, mock_builder, mock_check, mock_sequence, mock_signer, mock_threshold, mock_get_wallet
+    ):
+        escrow_address = "GAH6333FKTNQGSFSDLCANJIE52N7IGMS7DUIWR6JIMQZE7XKWEQLJQAY"
+        mock_builder.return_value.build.return_value = ('xdr', 'hash')
+        mock_sequence.return_value = '1'
+        mock_signer.return_value = []
+        mock_threshold.return_value = 2
+        mock_get_wallet.return_value = {
+            'asset': {'HOT': '10.0000000'},
+            'data': {
+                'destination_address': 'GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6',
+                'cost_per_transaction': '5'
+            }
+        }
+
+        for kwargs in (
+            {'headers': {'Accept': 'application/x-ndjson'}},
+            {'params': {'stream': 'true'}},
+        ):
+            resp = await self.client.request(
+                "POST",
+                reverse('generate-presigned-transactions', escrow_address=escrow_address),
+                json={},
+                **kwargs
+            )
+            assert resp.status == 200
+            assert resp.content_type == 'application/x-ndjson'
+            lines = [json.loads(line) for line in (await resp.text()).splitlines()]
+            assert lines == [
+                {'min_signer': 2, 'signers': []},
+                {'@id': reverse('transaction', transaction_hash='hash'), 'xdr': 'xdr', 'sequence_number': 2, 'transaction_hash': 'hash'},
+                {'@id': reverse('transaction', transaction_hash='hash'), 'xdr': 'xdr', 'sequence_number': 3, 'transaction_hash': 'hash'},
+            ]
+
+    @unittest_run_loop
+    @patch('escrow.generate_pre_signed_tx_xdr.get_threshold_weight')
+    @patch('escrow.generate_pre_signed_tx_xdr.get_signers')
+    @patch('escrow.generate_pre_signed_tx_xdr.get_current_sequence_number')
+    @patch('transaction.generate_payment.get_wallet_detail')
+    async def test_get_presigned_tx_xdr_window(self, mock_wallet, mock_sequence, mock_signer, mock_threshold):
+        escrow_address = 'GAH6333FKTNQGSFSDLCANJIE52N7IGMS7DUIWR6JIMQZE7XKWEQLJQAY'
+        args = (
+            escrow_address,
+            'GDSB3JZDYKLYKWZ6NXDPPGPCYJ32ISMTZ2LVF5PYQGY4B4FGNIU2M5BJ',
+            'GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6',
+            Decimal('100'),
+            Decimal('5')
+        )
+        mock_wallet.return_value = {'asset': {settings['ASSET_CODE']: '0'}}
+        mock_sequence.return_value = '1'
+        mock_signer.return_value = []
+        mock_threshold.return_value = 2
+
+        series = await get_presigned_tx_xdr(*args)
+        window = await get_presigned_tx_xdr(*args, start=5, count=5)
+        last_window = await get_presigned_tx_xdr(*args, start=15, count=10, sequence_number=1)
+
+        url = reverse('generate-presigned-transactions', escrow_address=escrow_address)
+        assert window['xdr'] == series['xdr'][5:10]
+        assert window['total'] == 20
+        assert window['next'] == f'{url}?start=10&count=5&sequence_number=1'
+        assert window['previous'] == f'{url}?start=0&count=5&sequence_number=1'
+        assert last_window['xdr'] == series['xdr'][15:]
+        assert last_window['next'] is None
+        assert mock_sequence.call_count == 2
+
+    @unittest_run_loop
+    @patch('escrow.generate_pre_signed_tx_xdr.get_escrow_wallet_detail')
+    async def test_get_presigned_tx_xdr_from_request_with_invalid_window(self, mock_get_wallet):
+        escrow_address = "GAH6333FKTNQGSFSDLCANJIE52N7IGMS7DUIWR6JIMQZE7XKWEQLJQAY"
+        for params in ({'start': 'first'}, {'count': '0'}, {'start': '-1'}):
+            resp = await self.client.request(
+                "POST",
+                reverse('generate-presigned-transactions', escrow_address=escrow_address),
+                json={},
+                params=params
+            )
+            assert resp.status == 400
+        mock_get_wallet.assert_not_called()
+
+    @unittest_run_loop
+    @patch('escrow.generate_pre_signed_tx_xdr.get_current_sequence_number')
+    @patch('transaction.generate_payment.get_wallet_detail')
+    async def test_get_presigned_tx_xdr_destination_not_trusted(self, mock_wallet, mock_sequence):
+        mock_wallet.return_value = {'asset': {}}
+        mock_sequence.return_value = '1'
+        with pytest.raises(web.HTTPBadRequest):
+            await get_presigned_tx_xdr(
+                'GAH6333FKTNQGSFSDLCANJIE52N7IGMS7DUIWR6JIMQZE7XKWEQLJQAY',
+                'GDSB3JZDYKLYKWZ6NXDPPGPCYJ32ISMTZ2LVF5PYQGY4B4FGNIU2M5BJ',
+                'GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6',
+                Decimal('10.0000000'),
+                Decimal('5')
+            )
 
 
     @unittest_run_loop
@@ -341,26 +341,19 @@ class TestGetCreateWallet(BaseTestClass):
         self.host = settings['HOST']
 
     @unittest_run_loop
-    @patch('escrow.post_generate_escrow_wallet.get_stellar_wallet')
+    @patch('escrow.post_generate_escrow_wallet.reserve_channel')
     @patch('escrow.post_generate_escrow_wallet.calculate_initial_xlm')
     @patch('escrow.post_generate_escrow_wallet.build_generate_escrow_wallet_transaction')
-    async def test_generate_escrow_wallet_success(self, mock_build, mock_cal, mock_get_stellar_wallet):
+    async def test_generate_escrow_wallet_success(self, mock_build, mock_cal, mock_reserve_channel):
 
         mock_build.return_value = ['xdr', 'tx_hash']
         mock_cal.return_value = 20
-        mock_get_stellar_wallet.return_value = Wallet(
-            "1",
-            [],
-            "1",
-            {},
-            [],
-            {},
-            {}
-        )
+        mock_reserve_channel.return_value = (self.transaction_source_address, "1")
         expect = {
             '@id': reverse('escrow-generate-wallet', escrow_address=self.escrow_address),
             '@transaction_url': reverse('transaction', transaction_hash='tx_hash'),
             'signers': [self.escrow_address, self.creator_address, self.provider_address],
+            'transaction_source_address': self.transaction_source_address,
             'xdr': 'xdr',
             'transaction_hash': 'tx_hash'
         }
@@ -7,7 +7,8 @@ from stellar_base.builder import Builder
 
 from conf import settings
 from router import reverse
-from stellar.wallet import get_stellar_wallet
+from stellar.build_executor import build_executor
+from stellar.sequence_allocator import reserve_sequence
 
 
 async def post_generate_joint_wallet(request: web.Request) -> web.Response:
@@ -34,9 +35,9 @@ async def generate_joint_wallet(
     meta: Dict = None,
 ) -> Dict:
     """Making transaction for generate joint wallet with many parties"""
-    wallet = await get_stellar_wallet(transaction_source_address)
+    sequence = await reserve_sequence(transaction_source_address)
     xdr, tx_hash = await build_joint_wallet(
-        transaction_source_address, deal_address, parties, creator, starting_xlm, meta, wallet.sequence
+        transaction_source_address, deal_address, parties, creator, starting_xlm, meta, sequence
     )
     parties_signer = [{'public_key': party['address'], 'weight': 1} for party in parties]
     signers = parties_signer + [{'public_key': creator, 'weight': 1}, {'public_key': deal_address, 'weight': 1}]
@@ -60,20 +61,31 @@ async def build_joint_wallet(
     sequence: str = None,
 ):
     """Build transaction for create joint wallet, trust HOT and set option signer."""
+    number_of_meta = len(meta) if meta and isinstance(meta, dict) else 0
+    xdr, tx_hash = await build_executor.build(
+        _build_joint_wallet,
+        transaction_source_address,
+        deal_address,
+        parties,
+        creator,
+        starting_xlm,
+        meta,
+        sequence,
+        operations=2 * len(parties) + number_of_meta + 5,
+    )
+
+    return xdr.decode(), binascii.hexlify(tx_hash).decode()
 
-    def _add_signer(builder: Builder, deal_address: str, party: str, amount: Decimal):
-        """Set permission of parties can signed transaction that generate from joint account"""
-        builder.append_set_options_op(
-            source=deal_address, signer_address=party, signer_type='ed25519PublicKey', signer_weight=1
-        )
-        builder.append_payment_op(
-            source=party,
-            destination=deal_address,
-            asset_code=settings['ASSET_CODE'],
-            asset_issuer=settings['ISSUER'],
-            amount=amount,
-        )
 
+def _build_joint_wallet(
+    transaction_source_address: str,
+    deal_address: str,
+    parties: List,
+    creator: str,
+    starting_xlm: Decimal,
+    meta: str = None,
+    sequence: str = None,
+) -> Builder:
     builder = Builder(
         address=transaction_source_address,
         horizon=settings['HORIZON_URL'],
@@ -101,7 +113,18 @@ async def build_joint_wallet(
     builder.append_set_options_op(
         source=deal_address, master_weight=0, low_threshold=weight, med_threshold=weight, high_threshold=weight
     )
-    xdr = builder.gen_xdr()
-    tx_hash = builder.te.hash_meta()
+    return builder
 
-    return xdr.decode(), binascii.hexlify(tx_hash).decode()
+
+def _add_signer(builder: Builder, deal_address: str, party: str, amount: Decimal):
+    """Set permission of parties can signed transaction that generate from joint account"""
+    builder.append_set_options_op(
+        source=deal_address, signer_address=party, signer_type='ed25519PublicKey', signer_weight=1
+    )
+    builder.append_payment_op(
+        source=party,
+        destination=deal_address,
+        asset_code=settings['ASSET_CODE'],
+        asset_issuer=settings['ISSUER'],
+        amount=amount,
+    )
@@ -1,3 +1,4 @@
+import asyncio
 import traceback
 from json import JSONDecodeError
 
@@ -11,6 +12,8 @@ from sentry import capture_exception
 async def handle_error(request, handler):
     try:
         response = await handler(request)
+    except asyncio.CancelledError:
+        raise
     except JSONDecodeError:
         message = 'Request payload must be json format.'
         return web.json_response(format_error(message), status=400)
@@ -29,6 +32,9 @@ async def handle_error(request, handler):
         return web.json_response(format_error_5xx(ex), status=500)
     except web.HTTPConflict as ex:
         return web.json_response(format_error(ex), status=409)
+    except web.HTTPServiceUnavailable as ex:
+        headers = {'Retry-After': ex.headers['Retry-After']} if 'Retry-After' in ex.headers else None
+        return web.json_response(format_error(ex), status=503, headers=headers)
     except Exception as ex:
         return web.json_response(format_error(ex), status=400)
     return response
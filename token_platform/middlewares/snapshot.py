@@ -0,0 +1,9 @@
+from aiohttp import web
+
+from stellar.snapshot import account_snapshot
+
+
+@web.middleware
+async def handle_account_snapshot(request, handler):
+    with account_snapshot():
+        return await handler(request)
@@ -0,0 +1,19 @@
+import json
+from typing import Dict
+
+from aiohttp import web
+
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+
+
+def is_stream_request(request: web.Request) -> bool:
+    """Client asks for NDJSON by Accept header or stream query parameter"""
+    return (
+        NDJSON_CONTENT_TYPE in request.headers.get('Accept', '')
+        or request.query.get('stream', '').lower() in ('1', 'true')
+    )
+
+
+def ndjson_line(data: Dict) -> bytes:
+    """Encode data as one line of NDJSON"""
+    return (json.dumps(data) + '\n').encode()
@@ -1,3 +1,5 @@
+from contextvars import ContextVar
+
 import prometheus_client
 from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram
 
@@ -5,12 +7,21 @@ from aiohttp import web
 
 metric = dict()
 
+# Metric name of the route which is handling current request, e.g. GET_WALLET_ADDRESS
+current_route: ContextVar[str] = ContextVar('current_route', default='')
+
 metric['GET_WALLET_ADDRESS'] = Gauge(
     'get_wallet_address_token_platform_api', 'tracking get wallet api')
 
+metric['POST_WALLETS_BATCH'] = Gauge(
+    'post_wallets_batch_token_platform_api', 'tracking post wallets batch api')
+
 metric['GET_WALLET_HISTORY'] = Gauge(
     'get_wallet_history_token_platform_api', 'tracking get wallet history api')
 
+metric['GET_WALLET_HISTORY_EXPORT'] = Gauge(
+    'get_wallet_history_export_token_platform_api', 'tracking get wallet history export api')
+
 metric['POST_GENERATE_WALLET'] = Gauge(
     'post_generate_wallet_token_platform_api', 'tracking post generate wallet api')
 
@@ -59,6 +70,157 @@ metric['POST_CLOSE_JOINT_WALLET'] = Gauge(
 metric['GET_CHANGE_TRUST_ADD_TOKEN'] = Gauge(
     'get_change_trust_add_token_api', 'tracking get change trust and add HOT')
 
+metric['GET_TRANSACTION_STATUS'] = Gauge(
+    'get_transaction_status_token_platform_api', 'tracking get transaction submission status api')
+
+metric['POST_SUBMIT_TRANSACTIONS'] = Gauge(
+    'post_submit_transactions_token_platform_api', 'tracking post submit batch of transactions api')
+
+horizon_metric = dict()
+
+horizon_metric['REQUEST'] = Counter(
+    'horizon_request_token_platform', 'number of requests sent to Horizon')
+
+horizon_metric['COALESCED'] = Counter(
+    'horizon_coalesced_request_token_platform', 'number of Horizon reads served by an identical in-flight request')
+
+account_cache_metric = dict()
+
+account_cache_metric['HIT'] = Counter(
+    'account_cache_hit_token_platform', 'number of wallets served from account cache')
+
+account_cache_metric['MISS'] = Counter(
+    'account_cache_miss_token_platform', 'number of wallets not found in account cache')
+
+account_cache_metric['EVICTION'] = Counter(
+    'account_cache_eviction_token_platform', 'number of wallets evicted from full account cache')
+
+account_cache_metric['SIZE'] = Gauge(
+    'account_cache_size_token_platform', 'number of wallets in account cache')
+
+memo_filter_metric = dict()
+
+memo_filter_metric['NEGATIVE'] = Counter(
+    'memo_filter_negative_token_platform', 'number of memos answered as never used without Horizon')
+
+memo_filter_metric['POSSIBLE'] = Counter(
+    'memo_filter_possible_token_platform', 'number of memos which are possibly used and checked with memo index')
+
+memo_filter_metric['FALSE_POSITIVE'] = Counter(
+    'memo_filter_false_positive_token_platform', 'number of possibly used memos which are not found in memo index')
+
+memo_filter_metric['EVICTION'] = Counter(
+    'memo_filter_eviction_token_platform', 'number of memo filters evicted to stay within MEMO_FILTER_TOTAL_BYTES')
+
+memo_filter_metric['BYTES'] = Gauge(
+    'memo_filter_bytes_token_platform', 'memory used by memo filters in bytes')
+
+memo_filter_metric['FALSE_POSITIVE_RATE'] = Gauge(
+    'memo_filter_false_positive_rate_token_platform', 'configured false positive rate of memo filters')
+
+build_metric = dict()
+
+build_metric['LOOP_BLOCKING'] = Histogram(
+    'build_loop_blocking_seconds_token_platform', 'time transaction builds block event loop', ['route'])
+
+build_metric['OFFLOADED'] = Counter(
+    'build_offloaded_token_platform', 'number of transaction builds encoded in build process pool', ['route'])
+
+sequence_metric = dict()
+
+sequence_metric['RESERVE'] = Counter(
+    'sequence_reserve_token_platform', 'number of sequence numbers reserved by sequence allocator')
+
+sequence_metric['RECONCILE'] = Counter(
+    'sequence_reconcile_token_platform', 'number of times sequence allocator reads account sequence from Horizon')
+
+sequence_metric['EXPIRE'] = Counter(
+    'sequence_expire_token_platform', 'number of sequence number leases which expired without submitting')
+
+channel_metric = dict()
+
+channel_metric['SIZE'] = Gauge(
+    'channel_pool_size_token_platform', 'number of channel accounts in channel pool')
+
+channel_metric['IN_FLIGHT'] = Gauge(
+    'channel_in_flight_token_platform', 'number of leased sequence numbers of channel account', ['channel'])
+
+channel_metric['ASSIGNED'] = Counter(
+    'channel_assigned_token_platform', 'number of transactions assigned to channel account', ['channel'])
+
+submission_metric = dict()
+
+submission_metric['QUEUE_SIZE'] = Gauge(
+    'submission_queue_size_token_platform', 'number of transactions waiting in submission queue')
+
+submission_metric['IN_PROGRESS'] = Gauge(
+    'submission_in_progress_token_platform', 'number of transactions being submitted to Horizon')
+
+submission_metric['REJECTED'] = Counter(
+    'submission_rejected_token_platform', 'number of transactions rejected because submission queue is full')
+
+submission_metric['COMPLETED'] = Counter(
+    'submission_completed_token_platform', 'number of transactions submitted to Horizon', ['status'])
+
+submission_metric['PREVALIDATION_REJECTED'] = Counter(
+    'submission_prevalidation_rejected_token_platform', 'number of transactions rejected before submitting to Horizon', ['reason'])
+
+submission_metric['LOCAL_DUPLICATE_CHECK'] = Counter(
+    'submission_local_duplicate_check_token_platform', 'number of duplicate checks answered by submission registry')
+
+submission_metric['HORIZON_DUPLICATE_CHECK'] = Counter(
+    'submission_horizon_duplicate_check_token_platform', 'number of duplicate checks looked up on Horizon')
+
+watcher_metric = dict()
+
+watcher_metric['WAITING'] = Gauge(
+    'transaction_watcher_waiting_token_platform', 'number of transaction hashes which requests are waiting for')
+
+watcher_metric['POLL'] = Counter(
+    'transaction_watcher_poll_token_platform', 'number of polls of transaction watcher')
+
+watcher_metric['LANDED'] = Counter(
+    'transaction_watcher_landed_token_platform', 'number of waited transactions found by transaction watcher')
+
+watcher_metric['ERROR'] = Counter(
+    'transaction_watcher_error_token_platform', 'number of failed polls of transaction watcher')
+
+transaction_cache_metric = dict()
+
+transaction_cache_metric['HIT'] = Counter(
+    'transaction_cache_hit_token_platform', 'number of transaction details served from transaction cache')
+
+transaction_cache_metric['MISS'] = Counter(
+    'transaction_cache_miss_token_platform', 'number of transaction details not found in transaction cache')
+
+transaction_cache_metric['EVICTION'] = Counter(
+    'transaction_cache_eviction_token_platform', 'number of transaction details evicted from full transaction cache')
+
+transaction_cache_metric['BYTES'] = Gauge(
+    'transaction_cache_bytes_token_platform', 'size of transaction details in transaction cache in bytes')
+
+ledger_index_metric = dict()
+
+ledger_index_metric['PROBE'] = Counter(
+    'ledger_index_probe_token_platform', 'number of ledgers fetched to seek wallet history by date')
+
+wallet_history_metric = dict()
+
+wallet_history_metric['UPSTREAM_PAGE'] = Counter(
+    'wallet_history_upstream_page_token_platform', 'number of effect pages fetched from Horizon for filtered wallet history')
+wallet_history_metric['PAGE_LIMIT_REACHED'] = Counter(
+    'wallet_history_page_limit_reached_token_platform', 'number of filtered wallet history pages which stopped at HISTORY_MAX_PAGES')
+
+effects_store_metric = dict()
+
+effects_store_metric['SYNC_PAGE'] = Counter(
+    'effects_store_sync_page_token_platform', 'number of effect pages read from Horizon into effects store')
+effects_store_metric['STORED'] = Counter(
+    'effects_store_stored_token_platform', 'number of effects stored in effects store')
+effects_store_metric['BACKFILL'] = Counter(
+    'effects_store_backfill_token_platform', 'number of wallet history requests served from Horizon while effects are stored')
+
+
 async def get_metrics(request: web.Request) -> web.Response:
     response = web.Response(body=prometheus_client.generate_latest())
     response.content_type = CONTENT_TYPE_LATEST
@@ -67,13 +229,14 @@ async def get_metrics(request: web.Request) -> web.Response:
 
 @web.middleware
 async def metrics_increasing(request, handler):
+    resource = request.match_info.route.resource
+    resource_name = str(resource.name if resource else '')
+    resource_name = resource_name.upper().replace('-', '_')
+    current_route.set(resource_name)
+
     response = await handler(request)
 
     if (response.status == 200 or response.status == 202):
-        resource_name = request.match_info.route.resource.name
-        resource_name = str(resource_name).upper()
-        resource_name = resource_name.replace('-', '_')
-
         # GET_METRICS is request from prometheus, we will not tracking.
         if resource_name != 'GET_METRICS' and resource_name != 'GET_ROOT':
             metric[resource_name].inc()
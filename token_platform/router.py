@@ -4,10 +4,15 @@ from controller import handle
 ROUTER = {
     "root": {"url": "/", "GET": "controller.handle"},
     "wallet-address": {"url": "/wallet/{wallet_address}", "GET": "wallet.get_wallet.get_wallet_from_request"},
+    "wallets-batch": {"url": "/wallets:batch", "POST": "wallet.post_wallets_batch.post_wallets_batch_from_request"},
     "wallet-history": {
         "url": "/wallet/{wallet_address}/history",
         "GET": "wallet.get_wallet_history.get_wallet_history_from_request",
     },
+    "wallet-history-export": {
+        "url": "/wallet/{wallet_address}/history/export",
+        "GET": "wallet.get_wallet_history_export.get_wallet_history_export_from_request",
+    },
     "generate-wallet": {
         "url": "/wallet/{wallet_address}/generate-wallet",
         "POST": "wallet.post_generate_wallet.post_generate_wallet_from_request",
@@ -61,6 +66,14 @@ ROUTER = {
         "GET": "transaction.get_transaction.get_transaction_from_request",
         "PUT": "transaction.put_transaction.put_transaction_from_request",
     },
+    "transaction-status": {
+        "url": "/transaction/{transaction_hash}/status",
+        "GET": "transaction.get_submission_status.get_submission_status_from_request",
+    },
+    "submit-transactions": {
+        "url": "/transactions/submit",
+        "POST": "transaction.post_submit_transactions.post_submit_transactions_from_request",
+    },
     "close-escrow-wallet": {
         "url": "/escrow/{escrow_address}/generate-close-escrow-wallet",
         "POST": "escrow.post_close_escrow_wallet.post_close_escrow_wallet_from_request",
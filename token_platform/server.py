@@ -6,16 +6,34 @@ from aiohttp import ClientSession, web
 from aiohttp.test_utils import AioHTTPTestCase, unittest_run_loop
 
 from controller import handle
-from middlewares import exception
+from middlewares import exception, snapshot
 from request_tracking import metrics
 from log import log, log_conf
 from router import generate_routes
+from stellar.build_executor import close_build_executor
+from stellar.horizon import close_horizon_client, init_horizon_client
+from transaction.submission_queue import close_submission_queue, start_submission_queue
+from transaction.transaction_watcher import close_transaction_watcher
+from wallet.effects_store import close_effects_store
 
 
 async def init_app():
     """Initialize the application server."""
-    app = web.Application(middlewares=[log.handle_log, exception.handle_error, metrics.metrics_increasing])
+    app = web.Application(middlewares=[
+        log.handle_log,
+        exception.handle_error,
+        metrics.metrics_increasing,
+        snapshot.handle_account_snapshot,
+    ])
     app.add_routes(generate_routes())
+    app.on_startup.append(init_horizon_client)
+    app.on_startup.append(start_submission_queue)
+    # Background work which calls Horizon is stopped before the Horizon client is closed
+    app.on_cleanup.append(close_submission_queue)
+    app.on_cleanup.append(close_transaction_watcher)
+    app.on_cleanup.append(close_horizon_client)
+    app.on_cleanup.append(close_build_executor)
+    app.on_cleanup.append(close_effects_store)
     return app
 
 
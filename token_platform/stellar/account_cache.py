@@ -0,0 +1,85 @@
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple, Union
+
+from conf import settings
+from request_tracking.metrics import account_cache_metric
+from stellar.envelope import decode_transaction_envelope, get_involved_accounts
+
+
+class AccountCache:
+    """Bounded LRU cache of wallet snapshots which expire after ttl seconds.
+
+    The cache is disabled when ttl or max_size is 0.
+    """
+
+    def __init__(self, ttl: float, max_size: int) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_size > 0
+
+    def get(self, wallet_address: str) -> Optional[Any]:
+        """Get cached wallet, return None if it is not cached or expired."""
+        if not self.enabled:
+            return None
+
+        entry: Optional[Tuple[float, Any]] = self._entries.get(wallet_address)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[wallet_address]
+                account_cache_metric['SIZE'].set(len(self._entries))
+            account_cache_metric['MISS'].inc()
+            return None
+
+        self._entries.move_to_end(wallet_address)
+        account_cache_metric['HIT'].inc()
+        return entry[1]
+
+    def get_fresh(self, wallet_address: str, max_age: float) -> Optional[Any]:
+        """Get cached wallet only if it was cached within max_age seconds, return None otherwise."""
+        if not self.enabled:
+            return None
+        entry: Optional[Tuple[float, Any]] = self._entries.get(wallet_address)
+        if entry is None or entry[0] - self.ttl + max_age < time.monotonic():
+            return None
+        return self.get(wallet_address)
+
+    def put(self, wallet_address: str, wallet: Any) -> None:
+        """Cache wallet, evict least recently used wallets when the cache is full."""
+        if not self.enabled:
+            return
+
+        self._entries[wallet_address] = (time.monotonic() + self.ttl, wallet)
+        self._entries.move_to_end(wallet_address)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            account_cache_metric['EVICTION'].inc()
+        account_cache_metric['SIZE'].set(len(self._entries))
+
+    def invalidate(self, *wallet_addresses: str) -> None:
+        """Remove wallets from the cache."""
+        for wallet_address in wallet_addresses:
+            self._entries.pop(wallet_address, None)
+        account_cache_metric['SIZE'].set(len(self._entries))
+
+    def invalidate_transaction(self, xdr: Union[str, bytes]) -> None:
+        """Remove every wallet which is touched by the transaction XDR."""
+        if not self.enabled or not self._entries:
+            return
+        try:
+            accounts = get_involved_accounts(decode_transaction_envelope(xdr))
+        except Exception:
+            # Horizon will reject XDR which cannot be decoded, so nothing has changed.
+            return
+        self.invalidate(*accounts)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        account_cache_metric['SIZE'].set(0)
+
+
+account_cache = AccountCache(settings['ACCOUNT_CACHE_TTL'], settings['ACCOUNT_CACHE_SIZE'])
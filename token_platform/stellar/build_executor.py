@@ -0,0 +1,80 @@
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Tuple
+
+from aiohttp import web
+from stellar_base.builder import Builder
+
+from conf import settings
+from request_tracking.metrics import build_metric, current_route
+
+
+def encode_transaction(build_function: Callable[..., Builder], *args) -> Tuple[bytes, bytes]:
+    """Build transaction then return unsigned XDR and transaction hash, run in worker process of build pool"""
+    builder = build_function(*args)
+    return builder.gen_xdr(), builder.te.hash_meta()
+
+
+@contextmanager
+def _measure_loop_blocking() -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        build_metric['LOOP_BLOCKING'].labels(current_route.get()).observe(time.perf_counter() - start)
+
+
+class BuildExecutor:
+    """Executor of CPU bound transaction building, XDR encoding and hashing.
+
+    A transaction which has at least `threshold` operations is built in a process pool,
+    so it doesn't block the event loop. The pool is disabled when `pool_size` is 0.
+    Time which builds block the event loop is reported per route.
+    """
+
+    def __init__(self, pool_size: int = 0, threshold: int = 20) -> None:
+        self.pool_size = pool_size
+        self.threshold = threshold
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.pool_size)
+        return self._pool
+
+    async def build(self, build_function: Callable[..., Builder], *args, operations: int = 0) -> Tuple[bytes, bytes]:
+        """Get unsigned XDR and transaction hash of the Builder returned from build_function(*args)
+
+            Args:
+                build_function: module level function which builds transaction, it must not raise HTTP exception
+                    because it would be run in another process.
+                operations: expected number of operations in the transaction.
+        """
+        if self.pool_size > 0 and operations >= self.threshold:
+            build_metric['OFFLOADED'].labels(current_route.get()).inc()
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(self.pool, encode_transaction, build_function, *args)
+
+        with _measure_loop_blocking():
+            return encode_transaction(build_function, *args)
+
+    async def encode(self, builder: Builder) -> Tuple[bytes, bytes]:
+        """Get unsigned XDR and transaction hash of builder which is already built on event loop"""
+        with _measure_loop_blocking():
+            return builder.gen_xdr(), builder.te.hash_meta()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+build_executor = BuildExecutor(settings['BUILD_POOL_SIZE'], settings['BUILD_OFFLOAD_THRESHOLD'])
+
+
+async def close_build_executor(app: web.Application) -> None:
+    """Shut down build process pool when the application is cleaned up."""
+    build_executor.close()
@@ -0,0 +1,66 @@
+from typing import List, Mapping, Optional, Tuple
+
+from aiohttp import web
+
+from conf import settings
+from request_tracking.metrics import channel_metric
+from stellar.sequence_allocator import SequenceAllocator, sequence_allocator
+
+
+class ChannelPool:
+    """Pool of channel accounts which are used as transaction source accounts.
+
+    Each transaction is assigned to the channel which has the fewest in-flight sequence
+    leases, channels with the same load are used in turn. Leases are tracked by the sequence
+    allocator, so when the allocator is disabled channels are simply used round robin.
+    """
+
+    def __init__(self, addresses: List[str], allocator: SequenceAllocator) -> None:
+        self.addresses = list(addresses)
+        self.allocator = allocator
+        self._next = 0
+
+        channel_metric['SIZE'].set(len(self.addresses))
+        for address in self.addresses:
+            channel_metric['IN_FLIGHT'].labels(address).set_function(lambda address=address: self.load(address))
+
+    def get_source_address(self, body: Mapping) -> Optional[str]:
+        """Get transaction_source_address of request body, it is optional only when the pool has channels"""
+        if not self.addresses:
+            return body['transaction_source_address']
+        return body.get('transaction_source_address')
+
+    def load(self, address: str) -> int:
+        return self.allocator.in_flight(address)
+
+    def choose(self) -> str:
+        """Get the least loaded channel account"""
+        if not self.addresses:
+            raise web.HTTPBadRequest(reason='Parameter transaction_source_address is required.')
+
+        size = len(self.addresses)
+        candidates = [self.addresses[(self._next + i) % size] for i in range(size)]
+        address = min(candidates, key=self.load)
+        self._next = (self.addresses.index(address) + 1) % size
+        return address
+
+    async def reserve(self, address: Optional[str] = None) -> Tuple[str, int]:
+        """Reserve sequence number of transaction source account, the account is chosen from
+        the pool when address is not given.
+        """
+        if not address:
+            address = self.choose()
+            channel_metric['ASSIGNED'].labels(address).inc()
+        return address, await self.allocator.reserve(address)
+
+
+channel_pool = ChannelPool(settings['CHANNEL_ACCOUNTS'], sequence_allocator)
+
+
+def get_transaction_source_address(body: Mapping) -> Optional[str]:
+    return channel_pool.get_source_address(body)
+
+
+async def reserve_channel(address: Optional[str] = None) -> Tuple[str, int]:
+    """Get transaction source address and its reserved sequence number, see ChannelPool.reserve"""
+    return await channel_pool.reserve(address)
@@ -0,0 +1,53 @@
+import binascii
+from typing import Optional, Set, Tuple, Union
+
+from stellar_base.memo import TextMemo
+from stellar_base.network import NETWORKS, Network
+from stellar_base.transaction_envelope import TransactionEnvelope
+
+from conf import settings
+
+
+def decode_transaction_envelope(xdr: Union[str, bytes]) -> TransactionEnvelope:
+    """Decode base64 XDR into transaction envelope"""
+    return TransactionEnvelope.from_xdr(xdr)
+
+
+def get_involved_accounts(envelope: TransactionEnvelope) -> Set[str]:
+    """Get addresses of every account which is touched by the transaction"""
+
+    def _address(value: Union[str, bytes]) -> str:
+        return value.decode() if isinstance(value, bytes) else value
+
+    accounts = {_address(envelope.tx.source)}
+    for operation in envelope.tx.operations:
+        for attribute in ('source', 'destination', 'trustor'):
+            address = getattr(operation, attribute, None)
+            if address:
+                accounts.add(_address(address))
+    return accounts
+
+
+def get_text_memo(envelope: TransactionEnvelope) -> Optional[str]:
+    """Get text memo of the transaction, return None if it does not have text memo"""
+    memo = envelope.tx.memo
+    if not isinstance(memo, TextMemo):
+        return None
+    return bytes(memo.text).decode('utf-8')
+
+
+def get_source_sequence(envelope: TransactionEnvelope) -> Tuple[str, int]:
+    """Get transaction source address and its account sequence number which the transaction was built from"""
+    source = envelope.tx.source
+    return source.decode() if isinstance(source, bytes) else source, int(envelope.tx.sequence) - 1
+
+
+def get_network_passphrase(network: str) -> str:
+    """Get passphrase of a well-known network name (PUBLIC, TESTNET), any other value is the passphrase itself"""
+    return NETWORKS.get(network.upper(), network)
+
+
+def get_transaction_hash(envelope: TransactionEnvelope) -> str:
+    """Get hex transaction hash of decoded envelope on the configured network"""
+    envelope.network_id = Network(get_network_passphrase(settings['PASSPHRASE'])).network_id()
+    return binascii.hexlify(envelope.hash_meta()).decode()
@@ -0,0 +1,152 @@
+import asyncio
+import copy
+from typing import Any, Dict, Optional
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector, web
+from dataclasses import dataclass
+
+from conf import settings
+from request_tracking.metrics import horizon_metric
+
+JSON_CONTENT_TYPES = {'application/json', 'application/problem+json', 'application/hal+json', 'application/ld+json'}
+
+
+@dataclass
+class HorizonResponse:
+    status: int
+    content_type: str
+    body: Any
+
+
+class _Flight:
+    """Upstream request which is shared by every identical concurrent caller."""
+
+    def __init__(self, future: asyncio.Future) -> None:
+        self.future = future
+        self.followers = 0
+
+
+class HorizonClient:
+    """Application wide HTTP client of Horizon server.
+
+    Every request to Horizon shares one connection pool, so connections are kept alive
+    between calls instead of paying TCP and TLS setup on each request. Concurrent GET
+    requests of the same URL are coalesced into one upstream request.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 100,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: float = 30,
+        timeout: float = 60,
+    ) -> None:
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self._session: Optional[ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flights: Dict[str, _Flight] = {}
+
+    @property
+    def session(self) -> ClientSession:
+        """Pooled session, created on first use within the running event loop."""
+        loop = asyncio.get_event_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            if self._session is not None and not self._session.closed:
+                # Session of another event loop can't be awaited here, close its pooled connections directly
+                self._session.connector.close()
+            connector = TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = ClientSession(connector=connector, timeout=ClientTimeout(total=self.timeout))
+            self._loop = loop
+        return self._session
+
+    async def get(self, url: str) -> HorizonResponse:
+        """Send GET request to Horizon, share the in-flight request if the same URL is being fetched."""
+        flight = self._flights.get(url)
+        if flight is not None:
+            flight.followers += 1
+            horizon_metric['COALESCED'].inc()
+        else:
+            flight = _Flight(asyncio.ensure_future(self._get(url)))
+            self._flights[url] = flight
+            flight.future.add_done_callback(lambda future: self._land(url, future))
+
+        response = await asyncio.shield(flight.future)
+        if flight.followers:
+            # Body is shared between callers, give everyone their own copy to modify.
+            return HorizonResponse(response.status, response.content_type, copy.deepcopy(response.body))
+        return response
+
+    def _land(self, url: str, future: asyncio.Future) -> None:
+        """Remove finished request, so next callers send a new request."""
+        if self._flights.get(url) is not None and self._flights[url].future is future:
+            del self._flights[url]
+        if not future.cancelled():
+            future.exception()
+
+    async def _get(self, url: str) -> HorizonResponse:
+        horizon_metric['REQUEST'].inc()
+        async with self.session.get(url) as resp:
+            return await self._read(resp)
+
+    async def post(self, url: str, data: dict) -> HorizonResponse:
+        """Send POST request to Horizon."""
+        horizon_metric['REQUEST'].inc()
+        async with self.session.post(url, data=data) as resp:
+            return await self._read(resp)
+
+    @staticmethod
+    async def _read(resp) -> HorizonResponse:
+        body = None
+        if resp.status == 200 or resp.content_type in JSON_CONTENT_TYPES:
+            body = await resp.json()
+        return HorizonResponse(resp.status, resp.content_type, body)
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+        self._flights = {}
+
+
+_client: Optional[HorizonClient] = None
+
+
+def get_horizon_client() -> HorizonClient:
+    """Get application wide Horizon client, create it from settings if it does not exist."""
+    global _client
+    if _client is None:
+        _client = HorizonClient(
+            limit=settings['HORIZON_CONNECTION_LIMIT'],
+            limit_per_host=settings['HORIZON_CONNECTION_LIMIT_PER_HOST'],
+            dns_cache_ttl=settings['HORIZON_DNS_CACHE_TTL'],
+            keepalive_timeout=settings['HORIZON_KEEPALIVE_TIMEOUT'],
+            timeout=settings['HORIZON_TIMEOUT'],
+        )
+    return _client
+
+
+async def init_horizon_client(app: web.Application) -> None:
+    """Create Horizon client when the application starts up."""
+    app['horizon'] = get_horizon_client()
+
+
+async def close_horizon_client(app: web.Application) -> None:
+    """Close Horizon client when the application is cleaned up."""
+    global _client
+    client = app.get('horizon')
+    if client is not None:
+        await client.close()
+    _client = None
@@ -0,0 +1,121 @@
+import bisect
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from aiohttp import web
+from dateutil import parser
+
+import stellar.wallet
+from conf import settings
+from request_tracking.metrics import ledger_index_metric
+
+# Average seconds between ledger closes, used to guess where a date is
+AVERAGE_CLOSE_TIME = 5
+# Interpolation probes before falling back to bisection, so skewed close times still converge
+MAX_INTERPOLATION_PROBES = 4
+# Paging token of an operation or effect is its ledger sequence shifted by 32 bits
+PAGING_TOKEN_LEDGER_SHIFT = 32
+
+_Point = Tuple[int, Optional[datetime]]
+
+
+class LedgerTimeIndex:
+    """Index from ledger close time to ledger sequence number.
+
+    A date is found by interpolation search over ledgers, every probed ledger is kept
+    as a known point (up to max_size) so later searches start from narrow bounds.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._points: 'OrderedDict[int, datetime]' = OrderedDict()
+        self._sequences: List[int] = []
+
+    async def find_ledger(self, date: datetime, after: bool = False) -> int:
+        """Get the first ledger which is closed at or after date, or strictly after date when after is True
+
+            If no ledger is closed at that time yet, return the next ledger sequence.
+        """
+
+        def _is_right(closed_at: Optional[datetime]) -> bool:
+            # Ledger which is not found on Horizon is older than its history
+            if closed_at is None:
+                return False
+            return closed_at > date if after else closed_at >= date
+
+        latest = await stellar.wallet.get_latest_ledger()
+        hi: _Point = (latest['sequence'], self._add(latest['sequence'], latest['closed_at']))
+        if not _is_right(hi[1]):
+            return hi[0] + 1
+
+        lo: Optional[_Point] = None
+        for sequence in self._sequences:
+            if sequence >= hi[0]:
+                break
+            if _is_right(self._points[sequence]):
+                hi = (sequence, self._points[sequence])
+                break
+            lo = (sequence, self._points[sequence])
+
+        step = max(int((hi[1] - date).total_seconds() / AVERAGE_CLOSE_TIME), 1)
+        while lo is None:
+            sequence = hi[0] - step
+            if sequence < 1:
+                lo = (0, None)
+                break
+            point = (sequence, await self._probe(sequence))
+            if _is_right(point[1]):
+                hi = point
+                step *= 2
+            else:
+                lo = point
+
+        probes = 0
+        while hi[0] - lo[0] > 1:
+            sequence = (lo[0] + hi[0]) // 2
+            if lo[1] is not None and probes < MAX_INTERPOLATION_PROBES:
+                span = (hi[1] - lo[1]).total_seconds()
+                if span > 0:
+                    estimate = lo[0] + int((hi[0] - lo[0]) * (date - lo[1]).total_seconds() / span)
+                    sequence = min(max(estimate, lo[0] + 1), hi[0] - 1)
+            probes += 1
+
+            point = (sequence, await self._probe(sequence))
+            if _is_right(point[1]):
+                hi = point
+            else:
+                lo = point
+        return hi[0]
+
+    async def _probe(self, sequence: int) -> Optional[datetime]:
+        ledger_index_metric['PROBE'].inc()
+        try:
+            ledger = await stellar.wallet.get_ledger(sequence)
+        except web.HTTPNotFound:
+            return None
+        return self._add(sequence, ledger['closed_at'])
+
+    def _add(self, sequence: int, closed_at: str) -> datetime:
+        date = parser.isoparse(closed_at)
+        if sequence not in self._points:
+            bisect.insort(self._sequences, sequence)
+        self._points[sequence] = date
+        while len(self._points) > self.max_size:
+            evicted, _ = self._points.popitem(last=False)
+            self._sequences.remove(evicted)
+        return date
+
+    def clear(self) -> None:
+        self._points.clear()
+        self._sequences = []
+
+
+def ledger_cursor(sequence: int) -> str:
+    """Cursor which pages records from the beginning of the ledger in ascending order,
+    or records before the ledger in descending order
+    """
+    return str(sequence << PAGING_TOKEN_LEDGER_SHIFT)
+
+
+ledger_index = LedgerTimeIndex(settings['LEDGER_INDEX_SIZE'])
@@ -0,0 +1,91 @@
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, List, Optional
+
+import stellar.wallet
+from conf import settings
+
+# Fetch a page of at most limit records after cursor, records are sorted by paging token in the requested order
+FetchPage = Callable[[Optional[str], int], Awaitable[List[dict]]]
+
+
+async def paginate(
+    fetch_page: FetchPage,
+    cursor: str = None,
+    page_size: int = None,
+    max_pages: int = None,
+    max_records: int = None,
+) -> AsyncIterator[List[dict]]:
+    """Yield pages of a Horizon collection from cursor, following paging token of the last record
+
+        The next page is requested while the caller handles the current one, so at most two pages
+        are held in memory. Paginating stops at the end of the collection (a page shorter than
+        page_size), after max_pages pages or after max_records records, the last page is cut to
+        max_records. A caller which stops early should aclose() the paginator so the prefetched
+        request is cancelled.
+    """
+    page_size = page_size or settings['HISTORY_PAGE_SIZE']
+    pages = 0
+    records_left = max_records
+    next_page: Optional[asyncio.Future] = asyncio.ensure_future(fetch_page(cursor, page_size))
+    try:
+        while next_page is not None:
+            records = await next_page
+            next_page = None
+            pages += 1
+            if records_left is not None:
+                records = records[:records_left]
+                records_left -= len(records)
+            if (
+                len(records) == page_size
+                and (max_pages is None or pages < max_pages)
+                and (records_left is None or records_left > 0)
+            ):
+                next_page = asyncio.ensure_future(fetch_page(records[-1]['paging_token'], page_size))
+            if records:
+                yield records
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+
+
+def paginate_effects(wallet_address: str, sort: str = 'asc', cursor: str = None, page_size: int = None, **budget):
+    """Paginate effects of the wallet"""
+
+    async def fetch_page(cursor: Optional[str], limit: int) -> List[dict]:
+        page = await stellar.wallet.get_wallet_effect(wallet_address, sort, limit, cursor)
+        return page['_embedded']['records']
+
+    return paginate(fetch_page, cursor, page_size, **budget)
+
+
+def paginate_wallet_transactions(
+    wallet_address: str, sort: str = 'asc', cursor: str = None, page_size: int = None, **budget
+):
+    """Paginate transactions of the wallet"""
+
+    async def fetch_page(cursor: Optional[str], limit: int) -> List[dict]:
+        return await stellar.wallet.get_transaction_by_wallet(
+            wallet_address=wallet_address, limit=limit, sort=sort, offset=cursor
+        )
+
+    return paginate(fetch_page, cursor, page_size, **budget)
+
+
+def paginate_transaction_operations(
+    transaction_hash: str, sort: str = 'asc', cursor: str = None, page_size: int = None, **budget
+):
+    """Paginate operations of the transaction"""
+
+    async def fetch_page(cursor: Optional[str], limit: int) -> List[dict]:
+        return await stellar.wallet.get_operations_of_transaction(transaction_hash, limit=limit, sort=sort, offset=cursor)
+
+    return paginate(fetch_page, cursor, page_size, **budget)
+
+
+def paginate_transactions(cursor: str = None, page_size: int = None, **budget):
+    """Paginate transactions of the whole network in ascending order"""
+
+    async def fetch_page(cursor: Optional[str], limit: int) -> List[dict]:
+        return await stellar.wallet.get_transactions(cursor, limit=limit)
+
+    return paginate(fetch_page, cursor, page_size, **budget)
@@ -0,0 +1,148 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Union
+
+from aiohttp import web
+
+import stellar.wallet
+from conf import settings
+from request_tracking.metrics import sequence_metric
+from stellar.envelope import decode_transaction_envelope, get_source_sequence
+
+
+class _Account:
+    def __init__(self, sequence: int) -> None:
+        # Last reserved sequence number
+        self.sequence = sequence
+        # Reserved sequence numbers which are not submitted yet and their lease expiry
+        self.leases: Dict[int, float] = {}
+        # Sequence number of the account on Horizon may differ from the reserved ones
+        self.stale = False
+
+
+class SequenceAllocator:
+    """In-process allocator of sequence numbers of transaction source accounts.
+
+    Sequence number of an account is read from Horizon once, then every reservation hands out
+    the next number and leases it for `lease_seconds`. The account is read from Horizon again
+    when Horizon rejects a transaction with tx_bad_seq, or when an abandoned lease left a gap
+    and no other lease is still alive. The allocator is disabled when `lease_seconds` is 0.
+    State of at most `max_accounts` accounts is kept, the least recently reserved accounts which have
+    no live lease are forgotten first.
+    """
+
+    def __init__(self, lease_seconds: float, max_accounts: int = None) -> None:
+        self.lease_seconds = lease_seconds
+        self.max_accounts = max_accounts if max_accounts is not None else settings['SEQUENCE_ALLOCATOR_MAX_ACCOUNTS']
+        self._accounts: Dict[str, _Account] = {}
+        self._locks: 'OrderedDict[str, asyncio.Lock]' = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.lease_seconds > 0
+
+    async def reserve(self, address: str) -> int:
+        """Reserve sequence number for building a transaction of the source account
+
+            Like wallet.sequence, a transaction built from returned number would use the number + 1.
+        """
+        if not self.enabled:
+            return await get_horizon_sequence(address)
+
+        async with self._get_lock(address):
+            now = time.monotonic()
+            account = self._accounts.get(address)
+            if account is not None:
+                self._expire_leases(account, now)
+            if account is None or (account.stale and not account.leases):
+                account = _Account(await get_horizon_sequence(address) - 1)
+                self._accounts[address] = account
+                sequence_metric['RECONCILE'].inc()
+
+            account.sequence += 1
+            account.leases[account.sequence] = now + self.lease_seconds
+            sequence_metric['RESERVE'].inc()
+            return account.sequence
+
+    def _get_lock(self, address: str) -> asyncio.Lock:
+        lock = self._locks.get(address)
+        if lock is None:
+            lock = self._locks[address] = asyncio.Lock()
+        self._locks.move_to_end(address)
+        if len(self._locks) > self.max_accounts:
+            # Accounts which are being reserved or have live leases are kept
+            now = time.monotonic()
+            for other in list(self._locks):
+                if len(self._locks) <= self.max_accounts:
+                    break
+                if other == address or self._locks[other].locked() or self.in_flight(other, now):
+                    continue
+                del self._locks[other]
+                self._accounts.pop(other, None)
+        return lock
+
+    @staticmethod
+    def _expire_leases(account: _Account, now: float) -> None:
+        expired = [sequence for sequence, expiry in account.leases.items() if expiry < now]
+        for sequence in expired:
+            del account.leases[sequence]
+            sequence_metric['EXPIRE'].inc()
+        if expired:
+            account.stale = True
+
+    def in_flight(self, address: str, now: float = None) -> int:
+        """Number of live leases of the account, i.e. transactions which are built but not submitted yet"""
+        account = self._accounts.get(address)
+        if account is None:
+            return 0
+        self._expire_leases(account, now if now is not None else time.monotonic())
+        return len(account.leases)
+
+    def release(self, address: str, sequence: int, consumed: bool = True) -> None:
+        """Release lease of submitted transaction
+
+            If it is not known whether the transaction consumed its sequence number,
+            the account would be read from Horizon again.
+        """
+        account = self._accounts.get(address)
+        if account is None:
+            return
+        account.leases.pop(sequence, None)
+        if not consumed:
+            account.stale = True
+
+    def reconcile(self, address: str) -> None:
+        """Forget sequence number of the account, it would be read from Horizon on next reservation"""
+        self._accounts.pop(address, None)
+
+    def release_transaction(self, xdr: Union[str, bytes], error: Optional[str] = None) -> None:
+        """Release lease of submitted transaction, error is result code of the transaction if it is rejected"""
+        if not self.enabled:
+            return
+        try:
+            address, sequence = get_source_sequence(decode_transaction_envelope(xdr))
+        except Exception:
+            return
+
+        if error and 'tx_bad_seq' in error:
+            self.reconcile(address)
+        else:
+            self.release(address, sequence, consumed=not error)
+
+
+async def get_horizon_sequence(address: str) -> int:
+    """Get sequence number of the account from Horizon, missing account is reported as in wallet.wallet.get_wallet"""
+    try:
+        wallet = await stellar.wallet.get_stellar_wallet(address)
+    except web.HTTPNotFound as ex:
+        raise web.HTTPNotFound(reason='{}: {}'.format(str(ex), address))
+    return int(wallet.sequence)
+
+
+sequence_allocator = SequenceAllocator(settings['SEQUENCE_LEASE_SECONDS'])
+
+
+async def reserve_sequence(address: str) -> int:
+    """Reserve sequence number of transaction source account"""
+    return await sequence_allocator.reserve(address)
@@ -0,0 +1,30 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+_accounts: ContextVar[Optional[Dict[str, Any]]] = ContextVar('account_snapshot', default=None)
+
+
+@contextmanager
+def account_snapshot():
+    """Open a scope where each account is fetched from Horizon at most once.
+
+    Accounts fetched inside the scope are memoized and shared by every helper
+    which is called within the same request.
+    """
+    token = _accounts.set({})
+    try:
+        yield
+    finally:
+        _accounts.reset(token)
+
+
+async def get_snapshot_wallet(wallet_address: str, fetch: Callable[[str], Awaitable[Any]]) -> Any:
+    """Get wallet from current snapshot, fetch it if it has not been fetched yet."""
+    accounts = _accounts.get()
+    if accounts is None:
+        return await fetch(wallet_address)
+
+    if wallet_address not in accounts:
+        accounts[wallet_address] = await fetch(wallet_address)
+    return accounts[wallet_address]
@@ -0,0 +1,91 @@
+from aiohttp.test_utils import unittest_run_loop
+from asynctest import patch
+from stellar_base.builder import Builder
+from tests.test_utils import BaseTestClass
+
+from conf import settings
+from request_tracking.metrics import account_cache_metric
+from stellar.account_cache import AccountCache
+from stellar.wallet import Wallet, get_stellar_wallet
+
+
+class TestAccountCache(BaseTestClass):
+    async def setUpAsync(self):
+        self.wallet = Wallet('test-address', [], '1', {}, [], {}, {})
+
+    def test_disabled_cache(self):
+        cache = AccountCache(ttl=0, max_size=10)
+        cache.put('test-address', self.wallet)
+        assert cache.get('test-address') is None
+
+    def test_get_cached_wallet(self):
+        cache = AccountCache(ttl=10, max_size=10)
+        hit = account_cache_metric['HIT']._value.get()
+        miss = account_cache_metric['MISS']._value.get()
+
+        assert cache.get('test-address') is None
+        cache.put('test-address', self.wallet)
+        assert cache.get('test-address') is self.wallet
+
+        assert account_cache_metric['HIT']._value.get() == hit + 1
+        assert account_cache_metric['MISS']._value.get() == miss + 1
+
+    @patch('stellar.account_cache.time.monotonic')
+    def test_expired_wallet(self, mock_time):
+        cache = AccountCache(ttl=10, max_size=10)
+        mock_time.return_value = 100
+        cache.put('test-address', self.wallet)
+        mock_time.return_value = 111
+        assert cache.get('test-address') is None
+
+    def test_evict_least_recently_used_wallet(self):
+        cache = AccountCache(ttl=10, max_size=2)
+        eviction = account_cache_metric['EVICTION']._value.get()
+
+        cache.put('address-1', self.wallet)
+        cache.put('address-2', self.wallet)
+        cache.get('address-1')
+        cache.put('address-3', self.wallet)
+
+        assert cache.get('address-1') is self.wallet
+        assert cache.get('address-2') is None
+        assert cache.get('address-3') is self.wallet
+        assert account_cache_metric['EVICTION']._value.get() == eviction + 1
+
+    def test_invalidate_transaction(self):
+        source = 'GDSB3JZDYKLYKWZ6NXDPPGPCYJ32ISMTZ2LVF5PYQGY4B4FGNIU2M5BJ'
+        sender = 'GAH6333FKTNQGSFSDLCANJIE52N7IGMS7DUIWR6JIMQZE7XKWEQLJQAY'
+        destination = 'GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6'
+        other = 'GDBNKZDZMEKXOH3HLWLKFMM7ARN2XVPHWZ7DWBBEV3UXTIGXBTRGJLHF'
+        builder = Builder(address=source, horizon=settings['HORIZON_URL'], network=settings['PASSPHRASE'], sequence=1)
+        builder.append_payment_op(destination, 10, source=sender)
+        xdr = builder.gen_xdr()
+
+        cache = AccountCache(ttl=10, max_size=10)
+        for address in (source, sender, destination, other):
+            cache.put(address, self.wallet)
+
+        cache.invalidate_transaction(xdr)
+
+        assert cache.get(source) is None
+        assert cache.get(sender) is None
+        assert cache.get(destination) is None
+        assert cache.get(other) is self.wallet
+
+    def test_invalidate_transaction_with_invalid_xdr(self):
+        cache = AccountCache(ttl=10, max_size=10)
+        cache.put('test-address', self.wallet)
+        cache.invalidate_transaction('invalid-xdr')
+        assert cache.get('test-address') is self.wallet
+
+    @unittest_run_loop
+    @patch('stellar.wallet.account_cache', new=AccountCache(ttl=10, max_size=10))
+    @patch('stellar.wallet._request_stellar_wallet')
+    async def test_get_stellar_wallet_from_cache(self, mock_request):
+        mock_request.return_value = self.wallet
+
+        first = await get_stellar_wallet('test-address')
+        second = await get_stellar_wallet('test-address')
+
+        assert first is second
+        mock_request.assert_called_once_with('test-address')
@@ -0,0 +1,55 @@
+from aiohttp.test_utils import unittest_run_loop
+from stellar_base.builder import Builder
+from tests.test_utils import BaseTestClass
+
+from conf import settings
+from request_tracking.metrics import build_metric, current_route
+from stellar.build_executor import BuildExecutor
+
+
+def _build(number_of_operations):
+    builder = Builder(
+        address='GDSB3JZDYKLYKWZ6NXDPPGPCYJ32ISMTZ2LVF5PYQGY4B4FGNIU2M5BJ',
+        horizon=settings['HORIZON_URL'],
+        network=settings['PASSPHRASE'],
+        sequence=1,
+    )
+    for amount in range(1, number_of_operations + 1):
+        builder.append_payment_op('GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6', str(amount))
+    return builder
+
+
+
+class TestBuildExecutor(BaseTestClass):
+    def _count_blocking(self, route):
+        return sum(bucket.get() for bucket in build_metric['LOOP_BLOCKING'].labels(route)._buckets)
+
+    def _expect(self, number_of_operations):
+        builder = _build(number_of_operations)
+        return builder.gen_xdr(), builder.te.hash_meta()
+
+    @unittest_run_loop
+    async def test_build_on_event_loop(self):
+        executor = BuildExecutor(pool_size=0, threshold=1)
+        current_route.set('POST_TEST_ROUTE')
+        blocking = self._count_blocking('POST_TEST_ROUTE')
+
+        assert await executor.build(_build, 3, operations=3) == self._expect(3)
+        assert await executor.encode(_build(3)) == self._expect(3)
+
+        assert executor._pool is None
+        assert self._count_blocking('POST_TEST_ROUTE') == blocking + 2
+
+    @unittest_run_loop
+    async def test_build_in_process_pool(self):
+        executor = BuildExecutor(pool_size=1, threshold=3)
+        current_route.set('POST_TEST_ROUTE')
+        offloaded = build_metric['OFFLOADED'].labels('POST_TEST_ROUTE')._value.get()
+
+        small = await executor.build(_build, 2, operations=2)
+        large = await executor.build(_build, 3, operations=3)
+        executor.close()
+
+        assert small == self._expect(2)
+        assert large == self._expect(3)
+        assert build_metric['OFFLOADED'].labels('POST_TEST_ROUTE')._value.get() == offloaded + 1
@@ -0,0 +1,59 @@
+from aiohttp import web
+from aiohttp.test_utils import unittest_run_loop
+from asynctest import patch
+from tests.test_utils import BaseTestClass
+
+from stellar.channel_pool import ChannelPool
+from stellar.sequence_allocator import SequenceAllocator
+from stellar.wallet import Wallet
+
+
+class TestChannelPool(BaseTestClass):
+    async def setUpAsync(self):
+        self.channels = [
+            'GDSB3JZDYKLYKWZ6NXDPPGPCYJ32ISMTZ2LVF5PYQGY4B4FGNIU2M5BJ',
+            'GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6',
+            'GDHH7XOUKIWA2NTMGBRD3P245P7SV2DAANU2RIONBAH6DGDLR5WISZZI',
+        ]
+
+    @unittest_run_loop
+    @patch('stellar.sequence_allocator.stellar.wallet.get_stellar_wallet')
+    async def test_reserve_least_loaded_channel(self, mock_wallet):
+        mock_wallet.side_effect = lambda address: Wallet(address, [], '10', {}, [], {}, {})
+        allocator = SequenceAllocator(lease_seconds=30)
+        pool = ChannelPool(self.channels, allocator)
+
+        reserved = [await pool.reserve() for _ in range(6)]
+
+        assert [address for address, _ in reserved] == self.channels * 2
+        assert [sequence for _, sequence in reserved] == [10, 10, 10, 11, 11, 11]
+        assert [pool.load(address) for address in self.channels] == [2, 2, 2]
+
+        allocator.release(self.channels[1], 11)
+        assert await pool.reserve() == (self.channels[1], 12)
+
+    @unittest_run_loop
+    @patch('stellar.sequence_allocator.stellar.wallet.get_stellar_wallet')
+    async def test_reserve_given_address(self, mock_wallet):
+        mock_wallet.return_value = Wallet(self.channels[2], [], '10', {}, [], {}, {})
+        pool = ChannelPool(self.channels, SequenceAllocator(lease_seconds=30))
+
+        assert await pool.reserve(self.channels[2]) == (self.channels[2], 10)
+        assert pool.choose() == self.channels[0]
+
+    @unittest_run_loop
+    @patch('stellar.sequence_allocator.stellar.wallet.get_stellar_wallet')
+    async def test_round_robin_when_allocator_disabled(self, mock_wallet):
+        mock_wallet.side_effect = lambda address: Wallet(address, [], '10', {}, [], {}, {})
+        pool = ChannelPool(self.channels, SequenceAllocator(lease_seconds=0))
+
+        reserved = [await pool.reserve() for _ in range(4)]
+
+        assert [address for address, _ in reserved] == self.channels + self.channels[:1]
+
+    @unittest_run_loop
+    async def test_reserve_from_empty_pool(self):
+        pool = ChannelPool([], SequenceAllocator(lease_seconds=30))
+
+        with self.assertRaises(web.HTTPBadRequest):
+            await pool.reserve()
@@ -0,0 +1,36 @@
+from asynctest import patch
+from stellar_base.builder import Builder
+from stellar_base.keypair import Keypair
+from stellar_base.network import NETWORKS, Network
+from tests.test_utils import BaseTestClass
+
+from conf import settings
+from stellar.envelope import decode_transaction_envelope, get_network_passphrase, get_transaction_hash
+
+
+class TestGetTransactionHash(BaseTestClass):
+    async def setUpAsync(self):
+        builder = Builder(secret=Keypair.random().seed().decode(), network='TESTNET', sequence=1)
+        builder.append_payment_op('GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6', '1')
+        self.xdr = builder.gen_xdr()
+
+    def test_network_passphrase(self):
+        assert get_network_passphrase('TESTNET') == NETWORKS['TESTNET']
+        assert get_network_passphrase('public') == NETWORKS['PUBLIC']
+        assert get_network_passphrase('Private Network ; 2018') == 'Private Network ; 2018'
+
+    def test_hash_on_custom_network(self):
+        envelope = decode_transaction_envelope(self.xdr)
+        with patch.dict(settings, {'PASSPHRASE': 'Private Network ; 2018'}):
+            transaction_hash = get_transaction_hash(envelope)
+
+        envelope.network_id = Network('Private Network ; 2018').network_id()
+        assert transaction_hash == envelope.hash_meta().hex()
+
+    def test_hash_on_named_network(self):
+        envelope = decode_transaction_envelope(self.xdr)
+        with patch.dict(settings, {'PASSPHRASE': 'TESTNET'}):
+            transaction_hash = get_transaction_hash(envelope)
+
+        envelope.network_id = Network(NETWORKS['TESTNET']).network_id()
+        assert transaction_hash == envelope.hash_meta().hex()
@@ -0,0 +1,93 @@
+import asyncio
+
+from aiohttp.test_utils import unittest_run_loop
+from asynctest import patch
+from tests.test_utils import BaseTestClass
+
+from request_tracking.metrics import horizon_metric
+from stellar.horizon import HorizonClient, get_horizon_client
+
+
+class TestHorizonClient(BaseTestClass):
+    @unittest_run_loop
+    async def test_session_is_reused(self):
+        client = HorizonClient(limit=10, limit_per_host=5, dns_cache_ttl=60)
+        session = client.session
+        assert client.session is session
+        assert session.connector.limit == 10
+        assert session.connector.limit_per_host == 5
+        await client.close()
+
+    @unittest_run_loop
+    async def test_close_session(self):
+        client = HorizonClient()
+        session = client.session
+        await client.close()
+        assert session.closed
+        assert client.session is not session
+        await client.close()
+
+    @unittest_run_loop
+    async def test_close_session_of_previous_loop(self):
+        client = HorizonClient()
+        session = client.session
+        previous_loop = client._loop = asyncio.new_event_loop()
+        assert client.session is not session
+        assert session.closed
+        await client.close()
+        previous_loop.close()
+
+    @unittest_run_loop
+    async def test_application_share_client(self):
+        assert self.app['horizon'] is get_horizon_client()
+
+
+class TestHorizonCoalescing(BaseTestClass):
+    class SlowResponse:
+        def __init__(self):
+            self.status = 200
+            self.content_type = 'application/hal+json'
+
+        async def json(self):
+            await asyncio.sleep(0.01)
+            return {'account_id': 'test', 'records': []}
+
+    @unittest_run_loop
+    @patch('stellar.horizon.ClientSession.get')
+    async def test_concurrent_get_share_one_request(self, mock_get):
+        mock_get.return_value.__aenter__.return_value = self.SlowResponse()
+        client = HorizonClient()
+        coalesced = horizon_metric['COALESCED']._value.get()
+
+        first, second, third = await asyncio.gather(
+            client.get('test-url'), client.get('test-url'), client.get('test-url')
+        )
+
+        mock_get.assert_called_once_with('test-url')
+        assert first.body == second.body == third.body == {'account_id': 'test', 'records': []}
+        assert first.body is not second.body
+        assert horizon_metric['COALESCED']._value.get() == coalesced + 2
+        await client.close()
+
+    @unittest_run_loop
+    @patch('stellar.horizon.ClientSession.get')
+    async def test_sequential_get_send_new_request(self, mock_get):
+        mock_get.return_value.__aenter__.return_value = self.SlowResponse()
+        client = HorizonClient()
+
+        await client.get('test-url')
+        await client.get('test-url')
+
+        assert mock_get.call_count == 2
+        await client.close()
+
+    @unittest_run_loop
+    @patch('stellar.horizon.ClientSession.get')
+    async def test_different_url_are_not_coalesced(self, mock_get):
+        mock_get.return_value.__aenter__.return_value = self.SlowResponse()
+        client = HorizonClient()
+
+        await asyncio.gather(client.get('test-url-1'), client.get('test-url-2'))
+
+        assert mock_get.call_count == 2
+        await client.close()
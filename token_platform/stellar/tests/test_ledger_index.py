@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta, timezone
+
+from aiohttp import web
+from aiohttp.test_utils import unittest_run_loop
+from asynctest import patch
+from tests.test_utils import BaseTestClass
+
+from stellar.ledger_index import LedgerTimeIndex, ledger_cursor
+
+GENESIS = datetime(2018, 1, 1, tzinfo=timezone.utc)
+LATEST = 1000000
+
+
+def _closed_at(sequence):
+    return (GENESIS + timedelta(seconds=sequence * 5)).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+async def _get_ledger(sequence):
+    if sequence > LATEST:
+        raise web.HTTPNotFound()
+    return {'sequence': sequence, 'closed_at': _closed_at(sequence)}
+
+
+async def _get_latest_ledger():
+    return {'sequence': LATEST, 'closed_at': _closed_at(LATEST)}
+
+
+class TestLedgerTimeIndex(BaseTestClass):
+    @unittest_run_loop
+    @patch('stellar.ledger_index.stellar.wallet.get_latest_ledger', side_effect=_get_latest_ledger)
+    @patch('stellar.ledger_index.stellar.wallet.get_ledger', side_effect=_get_ledger)
+    async def test_find_ledger_closed_at_date(self, mock_ledger, mock_latest):
+        index = LedgerTimeIndex(100)
+        date = GENESIS + timedelta(seconds=123456 * 5)
+
+        assert await index.find_ledger(date) == 123456
+        assert await index.find_ledger(date, after=True) == 123457
+        assert await index.find_ledger(date + timedelta(seconds=1)) == 123457
+        assert mock_ledger.call_count < 20
+
+    @unittest_run_loop
+    @patch('stellar.ledger_index.stellar.wallet.get_latest_ledger', side_effect=_get_latest_ledger)
+    @patch('stellar.ledger_index.stellar.wallet.get_ledger', side_effect=_get_ledger)
+    async def test_find_ledger_reuse_known_ledgers(self, mock_ledger, mock_latest):
+        index = LedgerTimeIndex(100)
+        date = GENESIS + timedelta(seconds=500000 * 5)
+
+        assert await index.find_ledger(date) == 500000
+        mock_ledger.reset_mock()
+        assert await index.find_ledger(date) == 500000
+        mock_ledger.assert_not_called()
+
+    @unittest_run_loop
+    @patch('stellar.ledger_index.stellar.wallet.get_latest_ledger', side_effect=_get_latest_ledger)
+    @patch('stellar.ledger_index.stellar.wallet.get_ledger', side_effect=_get_ledger)
+    async def test_find_ledger_out_of_history(self, mock_ledger, mock_latest):
+        index = LedgerTimeIndex(100)
+
+        assert await index.find_ledger(GENESIS - timedelta(days=1)) == 1
+        assert await index.find_ledger(GENESIS + timedelta(seconds=(LATEST + 10) * 5)) == LATEST + 1
+
+    @unittest_run_loop
+    @patch('stellar.ledger_index.stellar.wallet.get_latest_ledger', side_effect=_get_latest_ledger)
+    @patch('stellar.ledger_index.stellar.wallet.get_ledger', side_effect=_get_ledger)
+    async def test_known_ledgers_are_bounded(self, mock_ledger, mock_latest):
+        index = LedgerTimeIndex(5)
+
+        assert await index.find_ledger(GENESIS + timedelta(seconds=4321 * 5)) == 4321
+        assert len(index._points) <= 5
+        assert index._sequences == sorted(index._points)
+
+    def test_ledger_cursor(self):
+        assert ledger_cursor(1) == str(1 << 32)
@@ -0,0 +1,97 @@
+import asyncio
+
+from aiohttp.test_utils import unittest_run_loop
+from asynctest import CoroutineMock, patch
+from tests.test_utils import BaseTestClass
+
+from stellar.paginator import paginate, paginate_effects, paginate_transaction_operations
+
+ADDRESS = 'GDHZCRVQP3W3GUSZMC3ECHRG3WVQQZXVDHY5TOQ5AB5JKRSSUUZ6XDUE'
+
+
+def make_records(*tokens):
+    return [{'paging_token': str(token)} for token in tokens]
+
+
+def tokens_of(pages):
+    return [[record['paging_token'] for record in page] for page in pages]
+
+
+class TestPaginate(BaseTestClass):
+    @unittest_run_loop
+    async def test_paginate_until_short_page(self):
+        fetch_page = CoroutineMock(side_effect=[make_records(1, 2), make_records(3, 4), make_records(5)])
+
+        pages = [page async for page in paginate(fetch_page, None, 2)]
+
+        assert tokens_of(pages) == [['1', '2'], ['3', '4'], ['5']]
+        assert [call[0] for call in fetch_page.call_args_list] == [(None, 2), ('2', 2), ('4', 2)]
+
+    @unittest_run_loop
+    async def test_next_page_is_prefetched(self):
+        fetch_page = CoroutineMock(side_effect=[make_records(1, 2), make_records()])
+        pages = paginate(fetch_page, '0', 2)
+
+        assert tokens_of([await pages.__anext__()]) == [['1', '2']]
+        await asyncio.sleep(0)
+
+        fetch_page.assert_called_with('2', 2)
+        assert [page async for page in pages] == []
+
+    @unittest_run_loop
+    async def test_page_budget(self):
+        fetch_page = CoroutineMock(side_effect=[make_records(1, 2), make_records(3, 4), make_records(5, 6)])
+
+        pages = [page async for page in paginate(fetch_page, None, 2, max_pages=2)]
+
+        assert tokens_of(pages) == [['1', '2'], ['3', '4']]
+        assert fetch_page.call_count == 2
+
+    @unittest_run_loop
+    async def test_record_budget(self):
+        fetch_page = CoroutineMock(side_effect=[make_records(1, 2), make_records(3, 4), make_records(5, 6)])
+
+        pages = [page async for page in paginate(fetch_page, None, 2, max_records=3)]
+
+        assert tokens_of(pages) == [['1', '2'], ['3']]
+        assert fetch_page.call_count == 2
+
+    @unittest_run_loop
+    async def test_close_cancel_prefetched_page(self):
+        prefetched = asyncio.Event()
+
+        async def fetch_page(cursor, limit):
+            if cursor is None:
+                return make_records(1, 2)
+            prefetched.set()
+            await asyncio.sleep(10)
+
+        pages = paginate(fetch_page, None, 2)
+        async for page in pages:
+            break
+        await prefetched.wait()
+        await pages.aclose()
+        # Cancelled request doesn't hold the loop
+        await asyncio.sleep(0)
+
+
+class TestCollectionPaginators(BaseTestClass):
+    @unittest_run_loop
+    @patch('stellar.paginator.stellar.wallet.get_wallet_effect')
+    async def test_paginate_effects(self, mock_effect):
+        mock_effect.return_value = {'_embedded': {'records': make_records('1-1')}}
+
+        pages = [page async for page in paginate_effects(ADDRESS, 'desc', '9-1', 2)]
+
+        assert tokens_of(pages) == [['1-1']]
+        mock_effect.assert_called_once_with(ADDRESS, 'desc', 2, '9-1')
+
+    @unittest_run_loop
+    @patch('stellar.paginator.stellar.wallet.get_operations_of_transaction')
+    async def test_paginate_transaction_operations(self, mock_operations):
+        mock_operations.return_value = make_records(1)
+
+        pages = [page async for page in paginate_transaction_operations('tx-hash')]
+
+        assert tokens_of(pages) == [['1']]
+        mock_operations.assert_called_once_with('tx-hash', limit=200, sort='asc', offset=None)
@@ -0,0 +1,117 @@
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import unittest_run_loop
+from asynctest import patch
+from stellar_base.builder import Builder
+from tests.test_utils import BaseTestClass
+
+from conf import settings
+from stellar.sequence_allocator import SequenceAllocator
+from stellar.wallet import Wallet
+from transaction.transaction import submit_transaction
+
+
+class TestSequenceAllocator(BaseTestClass):
+    async def setUpAsync(self):
+        self.address = 'GDSB3JZDYKLYKWZ6NXDPPGPCYJ32ISMTZ2LVF5PYQGY4B4FGNIU2M5BJ'
+        self.wallet = Wallet(self.address, [], '10', {}, [], {}, {})
+
+    def _xdr(self, sequence):
+        builder = Builder(address=self.address, horizon=settings['HORIZON_URL'], network=settings['PASSPHRASE'], sequence=sequence)
+        builder.append_payment_op('GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6', '1')
+        return builder.gen_xdr()
+
+    @unittest_run_loop
+    @patch('stellar.sequence_allocator.stellar.wallet.get_stellar_wallet')
+    async def test_disabled_allocator_read_horizon(self, mock_wallet):
+        mock_wallet.return_value = self.wallet
+        allocator = SequenceAllocator(lease_seconds=0)
+
+        assert await allocator.reserve(self.address) == 10
+        assert await allocator.reserve(self.address) == 10
+        assert mock_wallet.call_count == 2
+
+    @unittest_run_loop
+    @patch('stellar.sequence_allocator.stellar.wallet.get_stellar_wallet')
+    async def test_reserve_increasing_sequence(self, mock_wallet):
+        mock_wallet.return_value = self.wallet
+        allocator = SequenceAllocator(lease_seconds=30)
+
+        sequences = await asyncio.gather(*[allocator.reserve(self.address) for _ in range(5)])
+
+        assert sorted(sequences) == [10, 11, 12, 13, 14]
+        mock_wallet.assert_called_once_with(self.address)
+
+    @unittest_run_loop
+    @patch('stellar.sequence_allocator.stellar.wallet.get_stellar_wallet')
+    async def test_reconcile_on_bad_sequence(self, mock_wallet):
+        mock_wallet.return_value = self.wallet
+        allocator = SequenceAllocator(lease_seconds=30)
+
+        sequence = await allocator.reserve(self.address)
+        allocator.release_transaction(self._xdr(sequence), error='tx_bad_seq')
+        mock_wallet.return_value = Wallet(self.address, [], '20', {}, [], {}, {})
+
+        assert await allocator.reserve(self.address) == 20
+        assert mock_wallet.call_count == 2
+
+    @unittest_run_loop
+    @patch('stellar.sequence_allocator.time.monotonic')
+    @patch('stellar.sequence_allocator.stellar.wallet.get_stellar_wallet')
+    async def test_reconcile_after_lease_expired(self, mock_wallet, mock_time):
+        mock_wallet.return_value = self.wallet
+        mock_time.return_value = 100
+        allocator = SequenceAllocator(lease_seconds=30)
+
+        submitted = await allocator.reserve(self.address)
+        allocator.release_transaction(self._xdr(submitted))
+        await allocator.reserve(self.address)
+        assert mock_wallet.call_count == 1
+
+        mock_time.return_value = 131
+        mock_wallet.return_value = Wallet(self.address, [], '11', {}, [], {}, {})
+        assert await allocator.reserve(self.address) == 11
+        assert mock_wallet.call_count == 2
+
+    @unittest_run_loop
+    @patch('transaction.transaction.stellar.wallet.submit_transaction')
+    @patch('stellar.sequence_allocator.stellar.wallet.get_stellar_wallet')
+    async def test_submit_bad_sequence_transaction(self, mock_wallet, mock_submit):
+        mock_wallet.return_value = self.wallet
+        mock_submit.side_effect = web.HTTPBadRequest(reason='tx_bad_seq')
+        allocator = SequenceAllocator(lease_seconds=30)
+
+        with patch('transaction.transaction.sequence_allocator', new=allocator):
+            sequence = await allocator.reserve(self.address)
+            with self.assertRaises(web.HTTPBadRequest):
+                await submit_transaction(self._xdr(sequence))
+            await allocator.reserve(self.address)
+
+        assert mock_wallet.call_count == 2
+
+    @unittest_run_loop
+    @patch('stellar.sequence_allocator.stellar.wallet.get_stellar_wallet')
+    async def test_forget_accounts_without_leases(self, mock_wallet):
+        mock_wallet.return_value = self.wallet
+        allocator = SequenceAllocator(lease_seconds=30, max_accounts=1)
+        other_address = 'GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6'
+
+        sequence = await allocator.reserve(self.address)
+        await allocator.reserve(other_address)
+        assert list(allocator._locks) == [self.address, other_address]
+
+        allocator.release(self.address, sequence)
+        await allocator.reserve(other_address)
+        assert list(allocator._locks) == [other_address]
+        assert allocator.in_flight(self.address) == 0
+
+    @unittest_run_loop
+    @patch('stellar.sequence_allocator.stellar.wallet.get_stellar_wallet')
+    async def test_missing_account_is_named(self, mock_wallet):
+        mock_wallet.side_effect = web.HTTPNotFound(reason='Resource Missing')
+
+        for allocator in (SequenceAllocator(lease_seconds=0), SequenceAllocator(lease_seconds=30)):
+            with self.assertRaises(web.HTTPNotFound) as context:
+                await allocator.reserve(self.address)
+            assert context.exception.reason == f'Resource Missing: {self.address}'
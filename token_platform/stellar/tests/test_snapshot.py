@@ -0,0 +1,56 @@
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import unittest_run_loop
+from asynctest import CoroutineMock, patch
+from tests.test_utils import BaseTestClass
+
+from stellar.snapshot import account_snapshot, get_snapshot_wallet
+from stellar.wallet import Wallet, get_stellar_wallet
+
+
+class TestAccountSnapshot(BaseTestClass):
+    async def setUpAsync(self):
+        self.wallet = Wallet('test-address', [], '1', {}, [], {}, {})
+
+    @unittest_run_loop
+    async def test_fetch_once_within_scope(self):
+        fetch = CoroutineMock(return_value=self.wallet)
+        with account_snapshot():
+            first = await get_snapshot_wallet('test-address', fetch)
+            second = await get_snapshot_wallet('test-address', fetch)
+        assert first is second
+        fetch.assert_called_once_with('test-address')
+
+    @unittest_run_loop
+    async def test_fetch_every_time_without_scope(self):
+        fetch = CoroutineMock(return_value=self.wallet)
+        await get_snapshot_wallet('test-address', fetch)
+        await get_snapshot_wallet('test-address', fetch)
+        assert fetch.call_count == 2
+
+    @unittest_run_loop
+    async def test_scope_is_not_shared(self):
+        fetch = CoroutineMock(return_value=self.wallet)
+        with account_snapshot():
+            await get_snapshot_wallet('test-address', fetch)
+        with account_snapshot():
+            await get_snapshot_wallet('test-address', fetch)
+        assert fetch.call_count == 2
+
+    @unittest_run_loop
+    async def test_error_is_not_memoized(self):
+        fetch = CoroutineMock(side_effect=[web.HTTPNotFound(), self.wallet])
+        with account_snapshot():
+            with pytest.raises(web.HTTPNotFound):
+                await get_snapshot_wallet('test-address', fetch)
+            result = await get_snapshot_wallet('test-address', fetch)
+        assert result is self.wallet
+
+    @unittest_run_loop
+    @patch('stellar.wallet._fetch_stellar_wallet')
+    async def test_get_stellar_wallet_use_snapshot(self, mock_fetch):
+        mock_fetch.return_value = self.wallet
+        with account_snapshot():
+            await get_stellar_wallet('test-address')
+            await get_stellar_wallet('test-address')
+        mock_fetch.assert_called_once_with('test-address')
@@ -131,7 +131,7 @@ class TestHorizonApi(BaseTestClass):
         self.transaction_hash = 'test-hash'
 
     @unittest_run_loop
-    @patch('stellar.wallet.ClientSession.get')
+    @patch('stellar.horizon.ClientSession.get')
     async def test_get_stellar_wallet_success(self, mock_get):
         session = mock_get.return_value
         session.__aenter__.return_value = self.SuccessResponse('application/hal+json')
@@ -140,7 +140,7 @@ class TestHorizonApi(BaseTestClass):
         mock_get.assert_called_once_with(url)
 
     @unittest_run_loop
-    @patch('stellar.wallet.ClientSession.get')
+    @patch('stellar.horizon.ClientSession.get')
     async def test_get_stellar_wallet_fail(self, mock_get):
         session = mock_get.return_value
         session.__aenter__.return_value = self.NotFoundResponse('application/problem+json')
@@ -150,7 +150,7 @@ class TestHorizonApi(BaseTestClass):
         mock_get.assert_called_once_with(url)
 
     @unittest_run_loop
-    @patch('stellar.wallet.ClientSession.get')
+    @patch('stellar.horizon.ClientSession.get')
     async def test_get_stellar_wallet_upstream_fail(self, mock_get):
         session = mock_get.return_value
         session.__aenter__.return_value = self.NotFoundResponse('document/html')
@@ -160,7 +160,7 @@ class TestHorizonApi(BaseTestClass):
         mock_get.assert_called_once_with(url)
 
     @unittest_run_loop
-    @patch('stellar.wallet.ClientSession.get')
+    @patch('stellar.horizon.ClientSession.get')
     async def test_get_transaction_success(self, mock_get):
         session = mock_get.return_value
         session.__aenter__.return_value = self.SuccessResponse('application/hal+json')
@@ -169,7 +169,7 @@ class TestHorizonApi(BaseTestClass):
         mock_get.assert_called_once_with(url)
 
     @unittest_run_loop
-    @patch('stellar.wallet.ClientSession.get')
+    @patch('stellar.horizon.ClientSession.get')
     async def test_get_transaction_fail(self, mock_get):
         session = mock_get.return_value
         session.__aenter__.return_value = self.NotFoundResponse('application/problem+json')
@@ -179,7 +179,7 @@ class TestHorizonApi(BaseTestClass):
         mock_get.assert_called_once_with(url)
 
     @unittest_run_loop
-    @patch('stellar.wallet.ClientSession.get')
+    @patch('stellar.horizon.ClientSession.get')
     async def test_get_transaction_upstream_fail(self, mock_get):
         session = mock_get.return_value
         session.__aenter__.return_value = self.NotFoundResponse('document/html')
@@ -189,7 +189,7 @@ class TestHorizonApi(BaseTestClass):
         mock_get.assert_called_once_with(url)
 
     @unittest_run_loop
-    @patch('stellar.wallet.ClientSession.get')
+    @patch('stellar.horizon.ClientSession.get')
     async def test_get_wallet_effect_success(self, mock_get):
         session = mock_get.return_value
         session.__aenter__.return_value = self.SuccessResponse('application/hal+json')
@@ -198,7 +198,7 @@ class TestHorizonApi(BaseTestClass):
         mock_get.assert_called_once_with(url)
 
     @unittest_run_loop
-    @patch('stellar.wallet.ClientSession.get')
+    @patch('stellar.horizon.ClientSession.get')
     async def test_get_wallet_effect_not_found(self, mock_get):
         session = mock_get.return_value
         session.__aenter__.return_value = self.NotFoundResponse('application/problem+json')
@@ -208,7 +208,7 @@ class TestHorizonApi(BaseTestClass):
         mock_get.assert_called_once_with(url)
 
     @unittest_run_loop
-    @patch('stellar.wallet.ClientSession.get')
+    @patch('stellar.horizon.ClientSession.get')
     async def test_get_wallet_effect_bad_request(self, mock_get):
         session = mock_get.return_value
         session.__aenter__.return_value = self.BadRequestResponse('application/problem+json')
@@ -218,7 +218,7 @@ class TestHorizonApi(BaseTestClass):
         mock_get.assert_called_once_with(url)
 
     @unittest_run_loop
-    @patch('stellar.wallet.ClientSession.get')
+    @patch('stellar.horizon.ClientSession.get')
     async def test_get_wallet_effect_wrong_parameter(self, mock_get):
         session = mock_get.return_value
         session.__aenter__.return_value = self.BadRequestResponse('application/problem+json')
@@ -227,7 +227,7 @@ class TestHorizonApi(BaseTestClass):
         mock_get.assert_not_called()
 
     @unittest_run_loop
-    @patch('stellar.wallet.ClientSession.get')
+    @patch('stellar.horizon.ClientSession.get')
     async def test_get_wallet_effect_upstream_fail(self, mock_get):
         session = mock_get.return_value
         session.__aenter__.return_value = self.BadRequestResponse('document/html')
@@ -236,7 +236,7 @@ class TestHorizonApi(BaseTestClass):
         mock_get.assert_not_called()
 
     @unittest_run_loop
-    @patch('stellar.wallet.ClientSession.get')
+    @patch('stellar.horizon.ClientSession.get')
     async def test_get_get_transaction_by_wallet_success(self, mock_get):
         session = mock_get.return_value
         session.__aenter__.return_value = self.GetTransactionBywalletSuccess('application/hal+json')
@@ -246,7 +246,7 @@ class TestHorizonApi(BaseTestClass):
         assert transactions == session.__aenter__.return_value.transaction_records
 
     @unittest_run_loop
-    @patch('stellar.wallet.ClientSession.get')
+    @patch('stellar.horizon.ClientSession.get')
     async def test_get_get_transaction_by_wallet_not_found(self, mock_get):
         session = mock_get.return_value
         session.__aenter__.return_value = self.NotFoundResponse('application/problem+json')
@@ -254,7 +254,7 @@ class TestHorizonApi(BaseTestClass):
             transactions = await get_transaction_by_wallet(self.wallet_address)
 
     @unittest_run_loop
-    @patch('stellar.wallet.ClientSession.get')
+    @patch('stellar.horizon.ClientSession.get')
     async def test_get_get_transaction_by_wallet_upstream_fail(self, mock_get):
         session = mock_get.return_value
         session.__aenter__.return_value = self.NotFoundResponse('document/html')
@@ -267,7 +267,7 @@ class TestHorizonApi(BaseTestClass):
             transactions = await get_transaction_by_wallet(self.wallet_address, sort='test-sort')
 
     @unittest_run_loop
-    @patch('stellar.wallet.ClientSession.get')
+    @patch('stellar.horizon.ClientSession.get')
     async def test_get_operations_of_transaction_success(self, mock_get):
         session = mock_get.return_value
         session.__aenter__.return_value = self.GetOperationsOfTransactionSuccess('application/hal+json')
@@ -277,7 +277,7 @@ class TestHorizonApi(BaseTestClass):
         assert transactions == session.__aenter__.return_value.operation_records
 
     @unittest_run_loop
-    @patch('stellar.wallet.ClientSession.get')
+    @patch('stellar.horizon.ClientSession.get')
     async def test_get_operations_of_transaction_not_found(self, mock_get):
         session = mock_get.return_value
         session.__aenter__.return_value = self.NotFoundResponse('application/problem+json')
@@ -285,7 +285,7 @@ class TestHorizonApi(BaseTestClass):
             transactions = await get_operations_of_transaction(self.wallet_address)
 
     @unittest_run_loop
-    @patch('stellar.wallet.ClientSession.get')
+    @patch('stellar.horizon.ClientSession.get')
     async def test_get_operations_of_transaction_upstream_fail(self, mock_get):
         session = mock_get.return_value
         session.__aenter__.return_value = self.NotFoundResponse('document/html')
@@ -0,0 +1,43 @@
+import binascii
+
+import pytest
+from stellar_base.builder import Builder
+from stellar_base.keypair import Keypair
+from tests.test_utils import BaseTestClass
+
+from conf import settings
+from stellar.transaction_template import TransactionTemplate
+
+
+class TestTransactionTemplate(BaseTestClass):
+    def _build(self, sequence, network):
+        builder = Builder(
+            address='GDSB3JZDYKLYKWZ6NXDPPGPCYJ32ISMTZ2LVF5PYQGY4B4FGNIU2M5BJ',
+            horizon=settings['HORIZON_URL'],
+            network=network,
+            sequence=sequence,
+        )
+        builder.append_payment_op(
+            'GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6',
+            '5',
+            asset_code=settings['ASSET_CODE'],
+            asset_issuer=settings['ISSUER'],
+            source='GAH6333FKTNQGSFSDLCANJIE52N7IGMS7DUIWR6JIMQZE7XKWEQLJQAY',
+        )
+        builder.append_payment_op('GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6', '1')
+        builder.add_text_memo('memo')
+        return builder
+
+    def test_build_same_transaction_as_builder(self):
+        for network in ('TESTNET', 'PUBLIC'):
+            template = TransactionTemplate.from_builder(self._build(1, network))
+            for sequence in (1, 2, 255, 256, 65536, 2 ** 32, 2 ** 62):
+                builder = self._build(sequence, network)
+                expect = (builder.gen_xdr().decode('utf8'), binascii.hexlify(builder.te.hash_meta()).decode())
+                assert template.build(sequence) == expect
+
+    def test_signed_transaction_cannot_be_template(self):
+        builder = self._build(1, 'TESTNET')
+        builder.gen_te().sign(Keypair.random())
+        with pytest.raises(ValueError):
+            TransactionTemplate(builder.te)
@@ -0,0 +1,55 @@
+import base64
+import hashlib
+import struct
+from typing import Tuple
+
+from stellar_base.builder import Builder
+from stellar_base.stellarxdr import Xdr
+from stellar_base.transaction_envelope import TransactionEnvelope
+
+# Unsigned envelope is Transaction followed by zero length signature array.
+# Transaction starts with source account (4 bytes key type + 32 bytes key) and fee (4 bytes),
+# so sequence number (int64) is always at the same offset.
+SEQUENCE_OFFSET = 40
+SEQUENCE_FORMAT = '>q'
+EMPTY_SIGNATURES = b'\x00\x00\x00\x00'
+
+
+class TransactionTemplate:
+    """Unsigned transaction envelope which only its sequence number is changed between transactions.
+
+    The envelope is packed once, then each transaction of the series is made by patching
+    sequence number bytes and hashing the signature base again. Output is byte-identical
+    to building the same transaction with Builder.
+    """
+
+    def __init__(self, envelope: TransactionEnvelope) -> None:
+        if envelope.signatures:
+            raise ValueError('Transaction template must not be signed')
+
+        packer = Xdr.StellarXDRPacker()
+        packer.pack_Transaction(envelope.tx.to_xdr_object())
+        self._buffer = bytearray(packer.get_buffer() + EMPTY_SIGNATURES)
+        self._transaction = memoryview(self._buffer)[: -len(EMPTY_SIGNATURES)]
+
+        (sequence,) = struct.unpack_from(SEQUENCE_FORMAT, self._buffer, SEQUENCE_OFFSET)
+        if sequence != int(envelope.tx.sequence):
+            raise ValueError('Sequence number is not found in transaction template')
+
+        envelope_type = Xdr.StellarXDRPacker()
+        envelope_type.pack_EnvelopeType(Xdr.const.ENVELOPE_TYPE_TX)
+        self._hasher = hashlib.sha256(envelope.network_id + envelope_type.get_buffer())
+
+    @classmethod
+    def from_builder(cls, builder: Builder) -> 'TransactionTemplate':
+        return cls(builder.gen_te())
+
+    def build(self, sequence: int) -> Tuple[str, str]:
+        """Get unsigned XDR and transaction hash of the transaction for account sequence number
+
+            Like Builder(sequence=sequence), transaction sequence number would be sequence + 1.
+        """
+        struct.pack_into(SEQUENCE_FORMAT, self._buffer, SEQUENCE_OFFSET, int(sequence) + 1)
+        hasher = self._hasher.copy()
+        hasher.update(self._transaction)
+        return base64.b64encode(self._buffer).decode('utf8'), hasher.hexdigest()
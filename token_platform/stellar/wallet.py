@@ -1,9 +1,12 @@
 from urllib.parse import urlencode
 
-from aiohttp import ClientSession, web
+from aiohttp import web
 
 from conf import settings
 from dataclasses import dataclass
+from stellar.account_cache import account_cache
+from stellar.horizon import get_horizon_client
+from stellar.snapshot import get_snapshot_wallet
 
 HORIZON_URL = settings['HORIZON_URL']
 
@@ -30,40 +33,93 @@ async def is_json_response(content_type: str) -> bool:
 
 async def get_stellar_wallet(wallet_address: str) -> Wallet:
     """Get wallet detail from Stellar network"""
+    return await get_snapshot_wallet(wallet_address, _fetch_stellar_wallet)
 
+
+async def _fetch_stellar_wallet(wallet_address: str) -> Wallet:
+    """Fetch wallet detail from account cache or Horizon"""
+    wallet = account_cache.get(wallet_address)
+    if wallet is None:
+        wallet = await _request_stellar_wallet(wallet_address)
+        account_cache.put(wallet_address, wallet)
+    return wallet
+
+
+async def _request_stellar_wallet(wallet_address: str) -> Wallet:
+    """Request wallet detail from Horizon"""
     url = f'{HORIZON_URL}/accounts/{wallet_address}'
-    async with ClientSession() as session:
-        async with session.get(url) as resp:
-            if resp.status != 200 and not await is_json_response(resp.content_type):
-                raise web.HTTPInternalServerError(
-                    reason='There is something wrong when sending request to upstream server'
-                )
-            body = await resp.json()
-            if resp.status != 200:
-                raise web.HTTPNotFound(reason=body.get('detail'))
-            return Wallet(
-                body['account_id'],
-                body['balances'],
-                body['sequence'],
-                body['data'],
-                body['signers'],
-                body['thresholds'],
-                body['flags'],
-            )  # type: ignore
+    resp = await get_horizon_client().get(url)
+    if resp.status != 200 and not await is_json_response(resp.content_type):
+        raise web.HTTPInternalServerError(
+            reason='There is something wrong when sending request to upstream server'
+        )
+    body = resp.body
+    if resp.status != 200:
+        raise web.HTTPNotFound(reason=body.get('detail'))
+    return Wallet(
+        body['account_id'],
+        body['balances'],
+        body['sequence'],
+        body['data'],
+        body['signers'],
+        body['thresholds'],
+        body['flags'],
+    )  # type: ignore
 
 
 async def get_transaction(transaction_hash: str) -> dict:
     url = f'{HORIZON_URL}/transactions/{transaction_hash}'
-    async with ClientSession() as session:
-        async with session.get(url) as resp:
-            if resp.status != 200 and not await is_json_response(resp.content_type):
-                raise web.HTTPInternalServerError(
-                    reason='There is something wrong when sending request to upstream server'
-                )
-            body = await resp.json()
-            if resp.status != 200:
-                raise web.HTTPNotFound(reason=body.get('detail'))
-            return body
+    resp = await get_horizon_client().get(url)
+    if resp.status != 200 and not await is_json_response(resp.content_type):
+        raise web.HTTPInternalServerError(
+            reason='There is something wrong when sending request to upstream server'
+        )
+    body = resp.body
+    if resp.status != 200:
+        raise web.HTTPNotFound(reason=body.get('detail'))
+    return body
+
+
+async def get_transactions(cursor: str, limit: int = 200) -> list:
+    """Get transactions of the network after the cursor in ledger order"""
+    url = f'{HORIZON_URL}/transactions?' + urlencode({'cursor': cursor, 'order': 'asc', 'limit': limit})
+    resp = await get_horizon_client().get(url)
+    if resp.status != 200 and not await is_json_response(resp.content_type):
+        raise web.HTTPInternalServerError(
+            reason='There is something wrong when sending request to upstream server'
+        )
+    body = resp.body
+    if resp.status != 200:
+        raise web.HTTPNotFound(reason=body.get('detail'))
+    return body.get('_embedded').get('records')
+
+
+async def get_ledger(sequence: int) -> dict:
+    """Get ledger by its sequence number"""
+    url = f'{HORIZON_URL}/ledgers/{sequence}'
+    resp = await get_horizon_client().get(url)
+    if resp.status != 200 and not await is_json_response(resp.content_type):
+        raise web.HTTPInternalServerError(
+            reason='There is something wrong when sending request to upstream server'
+        )
+    body = resp.body
+    if resp.status != 200:
+        raise web.HTTPNotFound(reason=body.get('detail'))
+    return body
+
+
+async def get_latest_ledger() -> dict:
+    """Get the last closed ledger"""
+    url = f'{HORIZON_URL}/ledgers?' + urlencode({'order': 'desc', 'limit': 1})
+    resp = await get_horizon_client().get(url)
+    if resp.status != 200 and not await is_json_response(resp.content_type):
+        raise web.HTTPInternalServerError(
+            reason='There is something wrong when sending request to upstream server'
+        )
+    body = resp.body
+    if resp.status != 200:
+        raise web.HTTPNotFound(reason=body.get('detail'))
+    return body.get('_embedded').get('records')[0]
 
 
 async def get_transaction_by_wallet(wallet_address: str, **kwargs) -> dict:
@@ -96,16 +152,15 @@ async def get_transaction_by_wallet(wallet_address: str, **kwargs) -> dict:
         query['cursor'] = offset
 
     completed_url = url + urlencode(query)
-    async with ClientSession() as session:
-        async with session.get(completed_url) as resp:
-            if resp.status != 200 and not await is_json_response(resp.content_type):
-                raise web.HTTPInternalServerError(
-                    reason='There is something wrong when sending request to upstream server'
-                )
-            body = await resp.json()
-            if resp.status != 200:
-                raise web.HTTPNotFound(reason=body.get('detail'))
-            return body.get('_embedded').get('records')
+    resp = await get_horizon_client().get(completed_url)
+    if resp.status != 200 and not await is_json_response(resp.content_type):
+        raise web.HTTPInternalServerError(
+            reason='There is something wrong when sending request to upstream server'
+        )
+    body = resp.body
+    if resp.status != 200:
+        raise web.HTTPNotFound(reason=body.get('detail'))
+    return body.get('_embedded').get('records')
 
 
 async def get_wallet_effect(wallet_address: str, sort: str = 'asc', limit: int = None, offset: str = None) -> dict:
@@ -125,18 +180,17 @@ async def get_wallet_effect(wallet_address: str, sort: str = 'asc', limit: int =
 
     completed_url = url + urlencode(query)
 
-    async with ClientSession() as session:
-        async with session.get(completed_url) as resp:
-            if resp.status != 200 and not await is_json_response(resp.content_type):
-                raise web.HTTPInternalServerError(
-                    reason='There is something wrong when sending request to upstream server'
-                )
-            body = await resp.json()
-            if resp.status == 400:
-                raise web.HTTPBadRequest(reason=body.get('detail'))
-            if resp.status == 404:
-                raise web.HTTPNotFound(reason=body.get('detail'))
-            return body
+    resp = await get_horizon_client().get(completed_url)
+    if resp.status != 200 and not await is_json_response(resp.content_type):
+        raise web.HTTPInternalServerError(
+            reason='There is something wrong when sending request to upstream server'
+        )
+    body = resp.body
+    if resp.status == 400:
+        raise web.HTTPBadRequest(reason=body.get('detail'))
+    if resp.status == 404:
+        raise web.HTTPNotFound(reason=body.get('detail'))
+    return body
 
 
 async def get_operations_of_transaction(transaction_hash: str, **kwargs) -> dict:
@@ -170,16 +224,15 @@ async def get_operations_of_transaction(transaction_hash: str, **kwargs) -> dict
         query['cursor'] = offset
 
     completed_url = url + urlencode(query)
-    async with ClientSession() as session:
-        async with session.get(completed_url) as resp:
-            if resp.status != 200 and not await is_json_response(resp.content_type):
-                raise web.HTTPInternalServerError(
-                    reason='There is something wrong when sending request to upstream server'
-                )
-            body = await resp.json()
-            if resp.status != 200:
-                raise web.HTTPNotFound(reason=body.get('detail'))
-            return body.get('_embedded').get('records')
+    resp = await get_horizon_client().get(completed_url)
+    if resp.status != 200 and not await is_json_response(resp.content_type):
+        raise web.HTTPInternalServerError(
+            reason='There is something wrong when sending request to upstream server'
+        )
+    body = resp.body
+    if resp.status != 200:
+        raise web.HTTPNotFound(reason=body.get('detail'))
+    return body.get('_embedded').get('records')
 
 
 async def submit_transaction(xdr: bytes) -> dict:
@@ -195,28 +248,28 @@ async def submit_transaction(xdr: bytes) -> dict:
         return result
 
     url = f'{HORIZON_URL}/transactions'
-    async with ClientSession() as session:
-        data = {'tx': xdr}
-        async with session.post(url, data=data) as resp:
-            if resp.status != 200 and not await is_json_response(resp.content_type):
-                raise web.HTTPInternalServerError(
-                    reason='There is something wrong when sending request to upstream server'
-                )
-            response = await resp.json()
-            if resp.status == 400:
-                msg = response.get('extras', {}).get('result_codes', {}).get('transaction', None)
-                if msg:
-                    reasons = _get_reason_transaction(response)
-                    if reasons:
-                        msg += f' {reasons}'
-                raise web.HTTPBadRequest(reason=msg)
-            if resp.status == 404:
-                msg = response.get('extras', {}).get('result_codes', {}).get('transaction', None)
-                if msg:
-                    reasons = _get_reason_transaction(response)
-                    if reasons:
-                        msg += f' {reasons}'
-                raise web.HTTPNotFound(reason=msg)
-            if resp.status == 200 or resp.status == 202:
-                return response
-            raise web.HTTPInternalServerError()
+    # Form field is sent URL encoded as text, bytes would turn the form into multipart
+    data = {'tx': xdr.decode() if isinstance(xdr, bytes) else xdr}
+    resp = await get_horizon_client().post(url, data=data)
+    if resp.status != 200 and not await is_json_response(resp.content_type):
+        raise web.HTTPInternalServerError(
+            reason='There is something wrong when sending request to upstream server'
+        )
+    response = resp.body
+    if resp.status == 400:
+        msg = response.get('extras', {}).get('result_codes', {}).get('transaction', None)
+        if msg:
+            reasons = _get_reason_transaction(response)
+            if reasons:
+                msg += f' {reasons}'
+        raise web.HTTPBadRequest(reason=msg)
+    if resp.status == 404:
+        msg = response.get('extras', {}).get('result_codes', {}).get('transaction', None)
+        if msg:
+            reasons = _get_reason_transaction(response)
+            if reasons:
+                msg += f' {reasons}'
+        raise web.HTTPNotFound(reason=msg)
+    if resp.status == 200 or resp.status == 202:
+        return response
+    raise web.HTTPInternalServerError()
@@ -5,7 +5,9 @@ from router import reverse
 from decimal import Decimal
 from conf import settings
 from aiohttp import web
-from stellar.wallet import get_stellar_wallet, get_transaction_by_wallet
+from stellar.build_executor import build_executor
+from stellar.sequence_allocator import reserve_sequence
+from stellar.wallet import get_transaction_by_wallet
 import binascii
 
 
@@ -26,9 +28,9 @@ async def generate_merge_transaction(
         transaction_hash: Transaction hash number for get transaction detail
     """
     wallet_detail = await get_escrow_wallet_detail(wallet_address)
-    wallet = await get_stellar_wallet(transaction_source_address)
+    sequence = await reserve_sequence(transaction_source_address)
     unsigned_xdr, tx_hash = await build_generate_merge_transaction(
-        transaction_source_address, wallet_detail, parties_wallet, wallet.sequence
+        transaction_source_address, wallet_detail, parties_wallet, sequence
     )
 
     return {
@@ -79,12 +81,10 @@ async def build_generate_merge_transaction(
     await build_account_merge_operation(builder, wallet_address, creator_address)
 
     try:
-        xdr = builder.gen_xdr()
+        xdr, tx_hash = await build_executor.encode(builder)
     except Exception as e:
         raise web.HTTPBadRequest(reason='Bad request, Please ensure parameters are valid.')
 
-    tx_hash = builder.te.hash_meta()
-
     return xdr.decode(), binascii.hexlify(tx_hash).decode()
 
 
@@ -11,7 +11,12 @@ from router import reverse
 from transaction.transaction import get_signers, get_threshold_weight, get_transaction_by_memo
 from wallet.get_wallet import get_wallet_detail
 from wallet.wallet import get_wallet
-from stellar.wallet import get_stellar_wallet
+from stellar.build_executor import build_executor
+from stellar.transaction_template import TransactionTemplate
+from stellar.channel_pool import get_transaction_source_address, reserve_channel
+
+# Any sequence number works for a template, it is patched for every transaction of the series
+TEMPLATE_SEQUENCE = 1
 
 
 async def generate_payment_from_request(request: web.Request) -> web.Response:
@@ -19,7 +24,7 @@ async def generate_payment_from_request(request: web.Request) -> web.Response:
 
     body = await request.json()
     source_account = request.match_info.get("wallet_address", "")
-    transaction_source_address = body['transaction_source_address']
+    transaction_source_address = get_transaction_source_address(body)
     target_address = body['target_address']
     amount_hot = body.get('amount_htkn')
     amount_xlm = body.get('amount_xlm')
@@ -44,8 +49,9 @@ async def generate_payment_from_request(request: web.Request) -> web.Response:
             raise web.HTTPBadRequest(reason="Transaction is already submitted")
 
     if not sequence_number:
-        wallet = await get_stellar_wallet(transaction_source_address)
-        sequence_number = wallet.sequence
+        transaction_source_address, sequence_number = await reserve_channel(transaction_source_address)
+    elif not transaction_source_address:
+        raise web.HTTPBadRequest(reason='Parameter transaction_source_address is required with sequence_number.')
 
     result = await generate_payment(
         transaction_source_address,
@@ -89,6 +95,7 @@ async def generate_payment(
         '@transaction_url': reverse('transaction', transaction_hash=tx_hash),
         'min_signer': await get_threshold_weight(source_address, 'payment'),
         'signers': await get_signers(source_address),
+        'transaction_source_address': transaction_source_address,
         'xdr': unsigned_xdr,
         'transaction_hash': tx_hash,
     }
@@ -115,22 +122,75 @@ async def build_unsigned_transfer(
             sequence: sequence number for generate transaction [optional]
             memo: memo text [optional]
     """
-    builder = Builder(
-        address=transaction_source_address,
-        sequence=sequence,
-        horizon=settings['HORIZON_URL'],
-        network=settings['PASSPHRASE'],
+    await check_transfer_destination(destination_address, amount_hot)
+    unsigned_xdr, tx_hash = await build_executor.build(
+        _build_transfer,
+        transaction_source_address,
+        source_address,
+        destination_address,
+        amount_hot,
+        amount_xlm,
+        tax_amount_hot,
+        sequence,
+        memo_text,
     )
+    return unsigned_xdr.decode('utf8'), binascii.hexlify(tx_hash).decode()
 
+
+async def check_transfer_destination(destination_address: str, amount_hot: Decimal) -> None:
+    """Check destination wallet exists and trusts the asset when HoToken would be transferred"""
     wallet = await get_wallet_detail(destination_address)
 
     if amount_hot and not wallet['asset'].get(settings['ASSET_CODE'], False):
         raise web.HTTPBadRequest(reason="{} is not trusted {}".format(destination_address, settings['ASSET_CODE']))
 
+
+def build_transfer_template(
+    transaction_source_address: str,
+    source_address: str,
+    destination_address: str,
+    amount_hot: Decimal,
+    amount_xlm: Decimal,
+    tax_amount_hot: Decimal = None,
+    memo_text: str = None,
+) -> TransactionTemplate:
+    """Build template of unsigned transfer transaction for generating series of transactions
+    which are different only in sequence number.
+    """
+    builder = _build_transfer(
+        transaction_source_address,
+        source_address,
+        destination_address,
+        amount_hot,
+        amount_xlm,
+        tax_amount_hot,
+        TEMPLATE_SEQUENCE,
+        memo_text,
+    )
+    return TransactionTemplate.from_builder(builder)
+
+
+def _build_transfer(
+    transaction_source_address: str,
+    source_address: str,
+    destination_address: str,
+    amount_hot: Decimal,
+    amount_xlm: Decimal,
+    tax_amount_hot: Decimal = None,
+    sequence: int = None,
+    memo_text: str = None,
+) -> Builder:
+    builder = Builder(
+        address=transaction_source_address,
+        sequence=sequence,
+        horizon=settings['HORIZON_URL'],
+        network=settings['PASSPHRASE'],
+    )
+
     if amount_xlm:
         builder.append_payment_op(destination_address, amount_xlm, source=source_address)
 
-    if amount_hot and wallet['asset'].get(settings['ASSET_CODE'], False):
+    if amount_hot:
         builder.append_payment_op(
             destination_address,
             amount_hot,
@@ -151,6 +211,4 @@ async def build_unsigned_transfer(
     if memo_text:
         builder.add_text_memo(memo_text)
 
-    unsigned_xdr = builder.gen_xdr()
-    tx_hash = builder.te.hash_meta()
-    return unsigned_xdr.decode('utf8'), binascii.hexlify(tx_hash).decode()
+    return builder
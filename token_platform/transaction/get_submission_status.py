@@ -0,0 +1,42 @@
+import math
+from typing import Any, Dict
+
+from aiohttp import web
+
+from conf import settings
+from router import reverse
+from transaction.submission_registry import Submission, submission_registry
+
+
+async def get_submission_status_from_request(request: web.Request) -> web.Response:
+    """AIOHttp Request status of transaction submitted asynchronously, wait up to ?wait=<seconds> until it is done"""
+    tx_hash = request.match_info.get('transaction_hash', '')
+    wait = get_wait_from_request(request)
+
+    submission = submission_registry.get(tx_hash)
+    if submission is None:
+        raise web.HTTPNotFound(reason='Submission of the transaction is not found.')
+
+    await submission.wait(wait)
+    return web.json_response(format_submission(submission))
+
+
+def get_wait_from_request(request: web.Request) -> float:
+    """Get seconds to wait from query string, limited by LONG_POLL_MAX_WAIT"""
+    try:
+        wait = float(request.query.get('wait', 0))
+        if not math.isfinite(wait):
+            raise ValueError(wait)
+    except ValueError:
+        raise web.HTTPBadRequest(reason='Parameter wait must be a number of seconds.')
+    if wait < 0:
+        raise web.HTTPBadRequest(reason='Parameter wait must not be negative.')
+    return min(wait, settings['LONG_POLL_MAX_WAIT'])
+
+
+def format_submission(submission: Submission) -> Dict[str, Any]:
+    host = settings['HOST']
+    result = submission.to_dict()
+    result['@id'] = f"{host}{reverse('transaction-status', transaction_hash=submission.transaction_hash)}"
+    result['transaction_url'] = f"{host}{reverse('transaction', transaction_hash=submission.transaction_hash)}"
+    return result
@@ -1,17 +1,52 @@
-from typing import Dict
+from typing import Any, Dict
 
 from aiohttp import web, web_request, web_response
 from conf import settings
+from transaction.get_submission_status import get_wait_from_request
 from transaction.transaction import (get_transaction,
                                      get_transaction_hash,
                                      get_transaction_by_memo)
+from transaction.transaction_cache import CachedTransaction, transaction_cache
+from transaction.transaction_watcher import transaction_watcher
 
 
 async def get_transaction_from_request(request: web_request.Request) ->  web_response.Response:
-    """AIOHttp Request transaction hash to get transaction detail"""
+    """AIOHttp Request transaction hash to get transaction detail, wait up to ?wait=<seconds> until it lands"""
     tx_hash = request.match_info.get('transaction_hash', "")
-    result = await get_transaction(tx_hash)
-    return web.json_response(result)
+    wait = get_wait_from_request(request)
+
+    cached = transaction_cache.get(tx_hash)
+    if cached is None:
+        if wait:
+            result = await wait_for_transaction(tx_hash, wait)
+        else:
+            result = await get_transaction(tx_hash)
+        cached = transaction_cache.put(tx_hash, result)
+    return cached_transaction_response(request, cached)
+
+
+def cached_transaction_response(request: web.Request, cached: CachedTransaction) -> web.Response:
+    """Response of immutable transaction detail, 304 Not Modified when client already has it"""
+    headers = {
+        'ETag': cached.etag,
+        'Cache-Control': f"public, max-age={settings['TRANSACTION_CACHE_MAX_AGE']}, immutable",
+    }
+    if cached.etag in request.headers.get('If-None-Match', ''):
+        return web.Response(status=304, headers=headers)
+    return web.Response(body=cached.body, content_type='application/json', headers=headers)
+
+
+async def wait_for_transaction(tx_hash: str, timeout: float) -> Dict[str, Any]:
+    """Get transaction detail, if it is not found wait up to timeout seconds for the transaction watcher
+
+        The watcher rewinds a few ledgers, so a transaction which lands before the waiter registers is not missed.
+    """
+    try:
+        return await get_transaction(tx_hash)
+    except web.HTTPNotFound:
+        if not await transaction_watcher.wait(tx_hash, timeout):
+            raise
+    return await get_transaction(tx_hash)
 
 
 async def get_transaction_hash_from_request(request: web.Request) -> web.Response:
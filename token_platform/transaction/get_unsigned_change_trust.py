@@ -9,7 +9,8 @@ from conf import settings
 from router import reverse
 from transaction.transaction import get_signers, get_threshold_weight
 from wallet.wallet import get_wallet
-from stellar.wallet import get_stellar_wallet
+from stellar.build_executor import build_executor
+from stellar.sequence_allocator import reserve_sequence
 
 
 async def get_unsigned_add_trust_and_hot_from_request(request: web.Request) -> web.Response:
@@ -56,9 +57,9 @@ async def get_unsigned_add_trust_and_hot(
     source_address: str, transaction_source_address: str, hot_amount: Decimal
 ) -> Dict:
     """Get unsigned transfer transaction and signers"""
-    wallet = await get_stellar_wallet(transaction_source_address)
+    sequence = await reserve_sequence(transaction_source_address)
     unsigned_xdr, tx_hash = await build_unsigned_add_trust_and_hot(
-        source_address, transaction_source_address, hot_amount, wallet.sequence
+        source_address, transaction_source_address, hot_amount, sequence
     )
     host: str = settings['HOST']
     result = {
@@ -100,8 +101,7 @@ async def build_unsigned_add_trust_and_hot(
         )
 
     try:
-        unsigned_xdr = builder.gen_xdr()
-        tx_hash = builder.te.hash_meta()
+        unsigned_xdr, tx_hash = await build_executor.encode(builder)
     except Exception as ex:
         raise web.HTTPNotFound(text=str(ex))
     return unsigned_xdr.decode('utf8'), binascii.hexlify(tx_hash).decode()
@@ -118,8 +118,8 @@ async def get_unsigned_change_trust_from_request(request: web.Request) -> web.Re
 
 async def get_unsigned_change_trust(source_address: str, transaction_source_address: str) -> Dict:
     """Get unsigned transfer transaction and signers"""
-    wallet = await get_stellar_wallet(transaction_source_address)
-    unsigned_xdr, tx_hash = build_unsigned_change_trust(source_address, transaction_source_address, wallet.sequence)
+    sequence = await reserve_sequence(transaction_source_address)
+    unsigned_xdr, tx_hash = build_unsigned_change_trust(source_address, transaction_source_address, sequence)
     host: str = settings['HOST']
     result = {
         '@id': reverse('change-trust', wallet_address=source_address),
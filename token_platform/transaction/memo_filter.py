@@ -0,0 +1,149 @@
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional, Union
+
+from conf import settings
+from request_tracking.metrics import memo_filter_metric
+from stellar.envelope import decode_transaction_envelope, get_involved_accounts, get_text_memo
+
+
+class BloomFilter:
+    """Probabilistic set which answers "definitely not added" or "possibly added"."""
+
+    def __init__(self, capacity: int, false_positive_rate: float, max_bytes: int) -> None:
+        optimal_bits = math.ceil(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2))
+        self.size = max(8, min(optimal_bits, max_bytes * 8))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray(math.ceil(self.size / 8))
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.bits)
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.sha256(item.encode('utf-8')).digest()
+        first = int.from_bytes(digest[:8], 'big')
+        second = int.from_bytes(digest[8:16], 'big') | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self.bits[position // 8] |= 1 << (position % 8)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position // 8] & (1 << (position % 8)) for position in self._positions(item))
+
+
+class _AccountFilter:
+    def __init__(self, bloom: BloomFilter) -> None:
+        self.bloom = bloom
+        self.loaded = False
+        self.synced_at = 0.0
+
+
+class MemoFilter:
+    """Bloom filters of text memos which are used by each account.
+
+    A filter is only trusted for max_age seconds after the account was synced with
+    the memo index, memos of transactions submitted through this service are added
+    immediately. Set max_age to 0 to disable the filter.
+
+    Filters of all accounts use at most total_bytes, the least recently used filter is evicted first.
+    """
+
+    def __init__(
+        self, capacity: int, false_positive_rate: float, max_bytes: int, max_age: float, total_bytes: int = None
+    ) -> None:
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.total_bytes = total_bytes if total_bytes is not None else settings['MEMO_FILTER_TOTAL_BYTES']
+        self._filters: 'OrderedDict[str, _AccountFilter]' = OrderedDict()
+        self._size_bytes = 0
+        memo_filter_metric['FALSE_POSITIVE_RATE'].set(false_positive_rate)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_age > 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def _get_filter(self, account: str) -> _AccountFilter:
+        if account in self._filters:
+            self._filters.move_to_end(account)
+            return self._filters[account]
+
+        bloom = BloomFilter(self.capacity, self.false_positive_rate, self.max_bytes)
+        while self._filters and self._size_bytes + bloom.size_bytes > self.total_bytes:
+            _, evicted = self._filters.popitem(last=False)
+            self._size_bytes -= evicted.bloom.size_bytes
+            memo_filter_metric['EVICTION'].inc()
+        self._filters[account] = _AccountFilter(bloom)
+        self._size_bytes += bloom.size_bytes
+        memo_filter_metric['BYTES'].set(self._size_bytes)
+        return self._filters[account]
+
+    def is_loaded(self, account: str) -> bool:
+        return account in self._filters and self._filters[account].loaded
+
+    def check(self, account: str, memo: str) -> Optional[bool]:
+        """Return False when the memo is definitely not used by the account, True when it is possibly used
+        and None when filter of the account is not loaded or too old to be trusted.
+        """
+        account_filter = self._filters.get(account)
+        if (
+            not self.enabled
+            or account_filter is None
+            or not account_filter.loaded
+            or time.monotonic() - account_filter.synced_at > self.max_age
+        ):
+            return None
+
+        self._filters.move_to_end(account)
+        if memo in account_filter.bloom:
+            memo_filter_metric['POSSIBLE'].inc()
+            return True
+        memo_filter_metric['NEGATIVE'].inc()
+        return False
+
+    def update(self, account: str, memos: Iterable[str]) -> None:
+        """Add memos which are synced from memo index, all memos are needed on the first update."""
+        if not self.enabled:
+            return
+        account_filter = self._get_filter(account)
+        for memo in memos:
+            account_filter.bloom.add(memo)
+        account_filter.loaded = True
+        account_filter.synced_at = time.monotonic()
+
+    def add_transaction(self, xdr: Union[str, bytes]) -> None:
+        """Add text memo of submitted transaction to loaded filters of involved accounts.
+
+            Accounts without a loaded filter are skipped, their filters get the memo from memo index when loaded.
+        """
+        if not self.enabled:
+            return
+        try:
+            envelope = decode_transaction_envelope(xdr)
+        except Exception:
+            return
+        memo = get_text_memo(envelope)
+        if memo is None:
+            return
+        for account in get_involved_accounts(envelope):
+            account_filter = self._filters.get(account)
+            if account_filter is not None and account_filter.loaded:
+                account_filter.bloom.add(memo)
+
+
+memo_filter = MemoFilter(
+    capacity=settings['MEMO_FILTER_CAPACITY'],
+    false_positive_rate=settings['MEMO_FILTER_FALSE_POSITIVE_RATE'],
+    max_bytes=settings['MEMO_FILTER_MAX_BYTES'],
+    max_age=settings['MEMO_FILTER_MAX_AGE'],
+)
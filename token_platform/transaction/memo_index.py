@@ -0,0 +1,121 @@
+import asyncio
+import sqlite3
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from conf import settings
+from stellar.paginator import paginate_wallet_transactions
+
+PAGE_SIZE = 200
+
+
+class MemoIndex:
+    """Local index of text memo to transaction hash of each account, stored in SQLite.
+
+    The index remembers paging token of the last indexed transaction of each account,
+    so syncing an account only scans transactions which are newer than that token.
+    Empty path keeps the index in memory, then only memos of max_accounts recently synced accounts are kept.
+    """
+
+    def __init__(self, path: str, max_accounts: int = None) -> None:
+        self.path = path
+        self.max_accounts = max_accounts if max_accounts is not None else settings['MEMO_INDEX_MAX_ACCOUNTS']
+        self._connection: Optional[sqlite3.Connection] = None
+        self._locks: 'OrderedDict[str, asyncio.Lock]' = OrderedDict()
+
+    @property
+    def in_memory(self) -> bool:
+        return self.path in ('', ':memory:')
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path or ':memory:', check_same_thread=False)
+            with self._connection:
+                self._connection.execute(
+                    '''CREATE TABLE IF NOT EXISTS memo (
+                        account TEXT NOT NULL,
+                        memo TEXT NOT NULL,
+                        transaction_hash TEXT NOT NULL,
+                        paging_token TEXT NOT NULL,
+                        PRIMARY KEY (account, memo)
+                    )'''
+                )
+                self._connection.execute(
+                    '''CREATE TABLE IF NOT EXISTS cursor (
+                        account TEXT PRIMARY KEY,
+                        paging_token TEXT NOT NULL
+                    )'''
+                )
+        return self._connection
+
+    def get_cursor(self, account: str) -> Optional[str]:
+        """Get paging token of the last indexed transaction of the account"""
+        row = self.connection.execute('SELECT paging_token FROM cursor WHERE account = ?', (account,)).fetchone()
+        return row[0] if row else None
+
+    def lookup(self, account: str, memo: str) -> Optional[str]:
+        """Get hash of the latest transaction of the account which has the text memo"""
+        row = self.connection.execute(
+            'SELECT transaction_hash FROM memo WHERE account = ? AND memo = ?', (account, memo)
+        ).fetchone()
+        return row[0] if row else None
+
+    def memos(self, account: str) -> List[str]:
+        """Get every indexed text memo of the account"""
+        rows = self.connection.execute('SELECT memo FROM memo WHERE account = ?', (account,))
+        return [row[0] for row in rows]
+
+    def add(self, account: str, transactions: List[Dict]) -> List[str]:
+        """Index text memos of transactions which are sorted by ascending paging token, return indexed memos"""
+        if not transactions:
+            return []
+        memos = [
+            (account, transaction['memo'], transaction['hash'], transaction['paging_token'])
+            for transaction in transactions
+            if transaction.get('memo_type') == 'text'
+        ]
+        with self.connection:
+            self.connection.executemany('INSERT OR REPLACE INTO memo VALUES (?, ?, ?, ?)', memos)
+            self.connection.execute(
+                'INSERT OR REPLACE INTO cursor VALUES (?, ?)', (account, transactions[-1]['paging_token'])
+            )
+        return [memo for _, memo, _, _ in memos]
+
+    async def sync(self, account: str) -> List[str]:
+        """Index transactions of the account which are newer than the last indexed one, return new memos"""
+        memos: List[str] = []
+        async with self._get_lock(account):
+            async for transactions in paginate_wallet_transactions(account, 'asc', self.get_cursor(account), PAGE_SIZE):
+                memos.extend(self.add(account, transactions))
+        return memos
+
+    def discard(self, account: str) -> None:
+        """Remove indexed memos and cursor of the account"""
+        with self.connection:
+            self.connection.execute('DELETE FROM memo WHERE account = ?', (account,))
+            self.connection.execute('DELETE FROM cursor WHERE account = ?', (account,))
+
+    def _get_lock(self, account: str) -> asyncio.Lock:
+        lock = self._locks.get(account)
+        if lock is None:
+            lock = self._locks[account] = asyncio.Lock()
+        self._locks.move_to_end(account)
+        if len(self._locks) > self.max_accounts:
+            # Locks which are held are kept until they are released
+            for other in list(self._locks):
+                if len(self._locks) <= self.max_accounts:
+                    break
+                if other != account and not self._locks[other].locked():
+                    del self._locks[other]
+                    if self.in_memory:
+                        self.discard(other)
+        return lock
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+memo_index = MemoIndex(settings['MEMO_INDEX_PATH'])
@@ -0,0 +1,148 @@
+import asyncio
+from collections import OrderedDict
+from json import JSONDecodeError
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from aiohttp import web
+
+from conf import settings
+from log.log import write_audit_log
+from middlewares.exception import format_error
+from ndjson import NDJSON_CONTENT_TYPE, is_stream_request, ndjson_line
+from stellar.envelope import decode_transaction_envelope, get_source_sequence, get_transaction_hash
+from transaction.prevalidation import prevalidate_transaction
+from transaction.submission_queue import submit_recorded
+from transaction.submission_registry import FAILED, SUCCESS, submission_registry
+from transaction.transaction import is_duplicate_transaction
+
+SKIPPED = 'skipped'
+
+
+class BatchItem:
+    """Signed transaction of a batch, transactions of the same source account are submitted in sequence order"""
+
+    def __init__(self, index: int, xdr: str, transaction_hash: Optional[str] = None) -> None:
+        self.index = index
+        self.xdr = xdr
+        self.transaction_hash = transaction_hash
+        self.source: Optional[str] = None
+        self.sequence = 0
+        self.error: Optional[str] = None
+        try:
+            envelope = decode_transaction_envelope(xdr)
+            self.source, self.sequence = get_source_sequence(envelope)
+            if self.transaction_hash is None:
+                self.transaction_hash = get_transaction_hash(envelope)
+        except Exception:
+            self.error = 'Transaction XDR cannot be decoded.'
+
+    def result(self, status: str, result: Dict = None, error: str = None) -> Dict[str, Any]:
+        return {
+            'index': self.index,
+            'transaction_hash': self.transaction_hash,
+            'status': status,
+            'result': result,
+            'error': error,
+        }
+
+
+async def post_submit_transactions_from_request(request: web.Request) -> web.StreamResponse:
+    """Submit batch of signed transactions into Stellar network
+
+        Request body is {"transactions": [...]}, each transaction is signed XDR or
+        {"xdr": ..., "transaction_hash": ...}. Results are streamed as NDJSON in completion order
+        when client asks for NDJSON, otherwise they are returned in request order.
+    """
+    try:
+        body = await request.json()
+    except JSONDecodeError:
+        raise web.HTTPBadRequest(reason='Bad request, JSON data missing.')
+    items = get_batch_from_body(body)
+
+    operation = settings['LOG_OPS']['SUBMIT']
+    if is_stream_request(request):
+        response = web.StreamResponse(status=202, headers={'Content-Type': NDJSON_CONTENT_TYPE})
+        await response.prepare(request)
+        async for result in submit_batch(items):
+            write_audit_log(request, result, operation, f'xdr={items[result["index"]].xdr}')
+            await response.write(ndjson_line(result))
+        await response.write_eof()
+        return response
+
+    results = []
+    async for result in submit_batch(items):
+        write_audit_log(request, result, operation, f'xdr={items[result["index"]].xdr}')
+        results.append(result)
+    results.sort(key=lambda result: result['index'])
+    return web.json_response({'results': results}, status=202)
+
+
+def get_batch_from_body(body: Dict) -> List[BatchItem]:
+    transactions = body['transactions']
+    if not isinstance(transactions, list) or not transactions:
+        raise web.HTTPBadRequest(reason='Parameter transactions must be a non-empty list.')
+    if len(transactions) > settings['BATCH_SUBMIT_MAX_SIZE']:
+        raise web.HTTPBadRequest(reason=f"Batch must not have more than {settings['BATCH_SUBMIT_MAX_SIZE']} transactions.")
+
+    items = []
+    for index, transaction in enumerate(transactions):
+        if isinstance(transaction, str):
+            items.append(BatchItem(index, transaction))
+        elif isinstance(transaction, dict) and isinstance(transaction.get('xdr'), str):
+            items.append(BatchItem(index, transaction['xdr'], transaction.get('transaction_hash')))
+        else:
+            raise web.HTTPBadRequest(reason=f'Transaction at index {index} must be signed XDR.')
+    return items
+
+
+async def submit_batch(items: List[BatchItem]) -> AsyncIterator[Dict[str, Any]]:
+    """Submit transactions with at most BATCH_SUBMIT_CONCURRENCY in parallel, yield results in completion order
+
+        Transactions of the same source account form a chain which is submitted one by one in sequence order,
+        when one of them fails the rest of the chain is skipped because Horizon would reject them.
+    """
+    semaphore = asyncio.Semaphore(settings['BATCH_SUBMIT_CONCURRENCY'])
+    results: asyncio.Queue = asyncio.Queue()
+
+    chains: Dict[Any, List[BatchItem]] = OrderedDict()
+    for item in items:
+        key = item.source if item.error is None else ('invalid', item.index)
+        chains.setdefault(key, []).append(item)
+
+    tasks = [asyncio.ensure_future(_submit_chain(chain, semaphore, results)) for chain in chains.values()]
+    try:
+        for _ in range(len(items)):
+            yield await results.get()
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _submit_chain(chain: List[BatchItem], semaphore: asyncio.Semaphore, results: asyncio.Queue) -> None:
+    failed = False
+    for item in sorted(chain, key=lambda item: item.sequence):
+        if failed:
+            results.put_nowait(item.result(SKIPPED, error='Previous transaction of the source account failed.'))
+            continue
+        async with semaphore:
+            result = await _submit_item(item)
+        failed = result['status'] != SUCCESS
+        results.put_nowait(result)
+
+
+async def _submit_item(item: BatchItem) -> Dict[str, Any]:
+    # Transaction hash is known once the item is decoded without error
+    transaction_hash = item.transaction_hash
+    if item.error is not None or transaction_hash is None:
+        return item.result(FAILED, error=item.error)
+    try:
+        if settings['TRANSACTION_PREVALIDATION']:
+            prevalidate_transaction(item.xdr, transaction_hash)
+        if await is_duplicate_transaction(transaction_hash):
+            raise web.HTTPBadRequest(reason='Duplicate transaction.')
+        response = await submit_recorded(submission_registry.add(transaction_hash), item.xdr)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        return item.result(FAILED, error=format_error(e)['message'])
+    return item.result(SUCCESS, result=response)
@@ -0,0 +1,111 @@
+from typing import Dict, List, Optional, Union
+
+from aiohttp import web
+from stellar_base.keypair import Keypair
+from stellar_base.operation import AccountMerge, AllowTrust, Operation, SetOptions
+from stellar_base.transaction_envelope import TransactionEnvelope
+
+from conf import settings
+from request_tracking.metrics import submission_metric
+from stellar.account_cache import account_cache
+from stellar.envelope import decode_transaction_envelope, get_transaction_hash
+
+THRESHOLD_LEVELS = ['low_threshold', 'med_threshold', 'high_threshold']
+ED25519_SIGNER = 'ed25519_public_key'
+
+
+def prevalidate_transaction(xdr: Union[str, bytes], transaction_hash: str) -> None:
+    """Reject signed transaction which cannot succeed without sending it to Horizon
+
+        The envelope must decode and its hash must match transaction_hash. When the source accounts
+        are in account cache, sequence number is checked against the cached sequence number.
+        Signatures are checked against signers and thresholds which are cached within
+        PREVALIDATION_SIGNERS_MAX_AGE seconds, because signers may have changed outside this service.
+        Accounts which are not cached or not cached recently are left for Horizon to check.
+    """
+    try:
+        envelope = decode_transaction_envelope(xdr)
+    except Exception:
+        _reject('bad_xdr', 'Transaction XDR cannot be decoded.')
+    if get_transaction_hash(envelope) != transaction_hash:
+        _reject('hash_mismatch', 'Transaction hash does not match transaction XDR.')
+
+    source = _address(envelope.tx.source)
+    wallet = account_cache.get(source)
+    if wallet is not None and int(envelope.tx.sequence) <= int(wallet.sequence):
+        _reject('tx_bad_seq', 'tx_bad_seq')
+
+    for address, level in get_required_thresholds(envelope).items():
+        wallet = account_cache.get_fresh(address, settings['PREVALIDATION_SIGNERS_MAX_AGE'])
+        if wallet is None:
+            continue
+        weight = get_signed_weight(wallet.signers, envelope.signatures, envelope.hash_meta())
+        if weight is not None and weight < max(wallet.thresholds[level], 1):
+            _reject('tx_bad_auth', 'tx_bad_auth')
+
+
+def get_required_thresholds(envelope: TransactionEnvelope) -> Dict[str, str]:
+    """Get threshold level which each source account of the transaction has to meet"""
+    source = _address(envelope.tx.source)
+    required = {source: 'low_threshold'}
+    for operation in envelope.tx.operations:
+        address = _address(operation.source) if operation.source else source
+        level = _get_threshold_level(operation)
+        required[address] = max(required.get(address, level), level, key=THRESHOLD_LEVELS.index)
+    return required
+
+
+def get_signed_weight(signers: List[Dict], signatures: list, tx_hash: bytes) -> Optional[int]:
+    """Sum weight of signers who signed the transaction hash
+
+        Return None if the account has a signer which cannot be checked offline (hash or pre-authorized transaction).
+    """
+    weight = 0
+    for signer in signers:
+        if signer['weight'] <= 0:
+            continue
+        if signer.get('type', ED25519_SIGNER) != ED25519_SIGNER:
+            return None
+        keypair = Keypair.from_address(signer.get('key') or signer['public_key'])
+        hint = keypair.signature_hint()
+        for signature in signatures:
+            if bytes(signature.hint) == hint and _verify(keypair, tx_hash, bytes(signature.signature)):
+                weight += signer['weight']
+                break
+    return weight
+
+
+def _get_threshold_level(operation: Operation) -> str:
+    if isinstance(operation, AllowTrust):
+        return 'low_threshold'
+    if isinstance(operation, AccountMerge):
+        return 'high_threshold'
+    if isinstance(operation, SetOptions) and any(
+        value is not None
+        for value in (
+            operation.master_weight,
+            operation.low_threshold,
+            operation.med_threshold,
+            operation.high_threshold,
+            operation.signer_address,
+        )
+    ):
+        return 'high_threshold'
+    return 'med_threshold'
+
+
+def _verify(keypair: Keypair, data: bytes, signature: bytes) -> bool:
+    try:
+        keypair.verify(data, signature)
+    except Exception:
+        return False
+    return True
+
+
+def _address(value: Union[str, bytes]) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _reject(reason: str, message: str) -> None:
+    submission_metric['PREVALIDATION_REJECTED'].labels(reason).inc()
+    raise web.HTTPBadRequest(reason=message)
@@ -1,12 +1,27 @@
-from transaction.transaction import is_duplicate_transaction, submit_transaction, get_transaction
+import asyncio
+from typing import Dict
+
+from transaction.transaction import is_duplicate_transaction, get_transaction
 from aiohttp import web
 from log import log_conf
 from conf import settings
 from log.log import write_audit_log
+from transaction.get_submission_status import format_submission
+from transaction.prevalidation import prevalidate_transaction
+from transaction.submission_queue import submission_queue, submit_recorded
+from transaction.submission_registry import FAILED, Submission, submission_registry
+
+# Transactions which are being checked for duplicate before they are queued, concurrent requests
+# of the same transaction wait for the first one instead of queueing it again
+_pending_enqueues: Dict[str, asyncio.Future] = {}
 
 
 async def put_transaction_from_request(request: web.Request) -> web.Response:
-    """Submit the transaction into Stellar network"""
+    """Submit the transaction into Stellar network
+
+        With ?async=true or "Prefer: respond-async" header, the transaction is put into submission queue
+        and the response links to status of the submission.
+    """
 
     signed_xdr = await request.text()
     tx_hash = request.match_info.get('transaction_hash')
@@ -14,10 +29,16 @@ async def put_transaction_from_request(request: web.Request) -> web.Response:
     if not signed_xdr or not tx_hash:
         raise web.HTTPBadRequest(reason='transaction fail, please check your parameter.')
 
+    if settings['TRANSACTION_PREVALIDATION']:
+        prevalidate_transaction(signed_xdr, tx_hash)
+
+    if is_async_request(request):
+        return await enqueue_transaction(request, tx_hash, signed_xdr)
+
     if await is_duplicate_transaction(tx_hash):
         raise web.HTTPBadRequest(reason='Duplicate transaction.')
 
-    response = await submit_transaction(signed_xdr)
+    response = await submit_recorded(submission_registry.add(tx_hash), signed_xdr)
 
     # audit log
     operation = settings['LOG_OPS']['SUBMIT']
@@ -26,3 +47,51 @@ async def put_transaction_from_request(request: web.Request) -> web.Response:
 
     return web.json_response(response, status=202)
 
+
+def is_async_request(request: web.Request) -> bool:
+    """Client asks for asynchronous submission by ?async=true or "Prefer: respond-async" header"""
+    if 'respond-async' in request.headers.get('Prefer', ''):
+        return True
+    return request.query.get('async', '').lower() in ('1', 'true')
+
+
+async def enqueue_transaction(request: web.Request, tx_hash: str, signed_xdr: str) -> web.Response:
+    """Put the transaction into submission queue, a transaction which is already queued is not submitted again"""
+    pending = _pending_enqueues.get(tx_hash)
+    if pending is not None:
+        submission = await asyncio.shield(pending)
+    else:
+        submission = submission_registry.get(tx_hash)
+        if submission is None or submission.status == FAILED:
+            submission = await _check_and_enqueue(tx_hash, signed_xdr)
+
+    response = format_submission(submission)
+
+    # audit log
+    operation = settings['LOG_OPS']['SUBMIT']
+    message = f'xdr={signed_xdr}'
+    write_audit_log(request, response, operation, message)
+
+    return web.json_response(response, status=202, headers={'Location': response['@id']})
+
+
+async def _check_and_enqueue(tx_hash: str, signed_xdr: str) -> Submission:
+    pending = asyncio.get_event_loop().create_future()
+    _pending_enqueues[tx_hash] = pending
+    try:
+        if await is_duplicate_transaction(tx_hash):
+            raise web.HTTPBadRequest(reason='Duplicate transaction.')
+        submission = submission_queue.enqueue(tx_hash, signed_xdr)
+    except asyncio.CancelledError:
+        pending.cancel()
+        raise
+    except Exception as e:
+        pending.set_exception(e)
+        # Requests which waited for it have got the error, so it doesn't need to be retrieved again
+        pending.exception()
+        raise
+    else:
+        pending.set_result(submission)
+    finally:
+        del _pending_enqueues[tx_hash]
+    return submission
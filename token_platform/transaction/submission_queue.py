@@ -0,0 +1,135 @@
+import asyncio
+from typing import List, Optional
+
+from aiohttp import web
+
+from conf import settings
+from middlewares.exception import format_error
+from request_tracking.metrics import submission_metric
+from transaction.submission_registry import (
+    FAILED,
+    SUBMITTING,
+    SUCCESS,
+    Submission,
+    SubmissionRegistry,
+    submission_registry,
+)
+from transaction.transaction import submit_transaction
+
+# Result codes which prove the transaction is not applied by a ledger. Validity of a transaction which has already
+# landed is checked against its consumed sequence number first, so a resubmitted transaction gets tx_bad_seq
+# (or tx_too_late, tx_no_account) and those codes don't tell whether it has been applied.
+NOT_APPLIED_RESULT_CODES = {
+    'tx_failed',
+    'tx_bad_auth',
+    'tx_bad_auth_extra',
+    'tx_insufficient_balance',
+    'tx_insufficient_fee',
+    'tx_too_early',
+    'tx_missing_operation',
+}
+
+
+class SubmissionQueue:
+    """In-process queue of signed transactions which are submitted to Horizon in background.
+
+    At most `concurrency` transactions are submitted at the same time and at most `max_size`
+    transactions wait in the queue, a submission is rejected when the queue is full.
+    Outcome of every submission is recorded in the submission registry.
+    """
+
+    def __init__(self, concurrency: int, max_size: int, registry: SubmissionRegistry) -> None:
+        self.concurrency = concurrency
+        self.max_size = max_size
+        self.registry = registry
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+        submission_metric['QUEUE_SIZE'].set_function(self.qsize)
+
+    def qsize(self) -> int:
+        queue = self._queue
+        return queue.qsize() if queue is not None else 0
+
+    def start(self) -> None:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_size)
+        loop = asyncio.get_event_loop()
+        self._queue = queue
+        self._workers = [loop.create_task(self._work(queue)) for _ in range(self.concurrency)]
+
+    async def close(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+    def enqueue(self, transaction_hash: str, xdr: str) -> Submission:
+        """Put signed transaction into the queue, raise HTTPServiceUnavailable when the queue is full"""
+        if self._queue is None:
+            raise web.HTTPServiceUnavailable(reason='Submission queue is not running.')
+
+        submission = self.registry.add(transaction_hash)
+        try:
+            self._queue.put_nowait((submission, xdr))
+        except asyncio.QueueFull:
+            self.registry.discard(transaction_hash)
+            submission_metric['REJECTED'].inc()
+            raise web.HTTPServiceUnavailable(
+                reason='Submission queue is full, please retry later.',
+                headers={'Retry-After': str(settings['SUBMIT_RETRY_AFTER'])},
+            )
+        return submission
+
+    async def _work(self, queue: asyncio.Queue) -> None:
+        while True:
+            submission, xdr = await queue.get()
+            try:
+                await submit_recorded(submission, xdr)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Outcome is recorded in the submission
+                pass
+            finally:
+                queue.task_done()
+
+
+async def submit_recorded(submission: Submission, xdr: str) -> dict:
+    """Submit transaction into Stellar network and record its outcome in the submission"""
+    submission.status = SUBMITTING
+    submission_metric['IN_PROGRESS'].inc()
+    try:
+        result = await submit_transaction(xdr.encode())
+    except asyncio.CancelledError:
+        submission.finish(FAILED, error='Submission is cancelled.')
+        raise
+    except Exception as e:
+        submission.finish(FAILED, error=format_error(e)['message'], rejected=is_not_applied(e))
+        raise
+    else:
+        submission.finish(SUCCESS, result=result)
+    finally:
+        submission_metric['IN_PROGRESS'].dec()
+        submission_metric['COMPLETED'].labels(submission.status).inc()
+    return result
+
+
+def is_not_applied(error: Exception) -> bool:
+    """Horizon rejected the transaction with a result code which proves it is not applied"""
+    if not isinstance(error, web.HTTPBadRequest) or not error.reason:
+        return False
+    return error.reason.split()[0] in NOT_APPLIED_RESULT_CODES
+
+
+submission_queue = SubmissionQueue(settings['SUBMIT_CONCURRENCY'], settings['SUBMIT_QUEUE_SIZE'], submission_registry)
+
+
+async def start_submission_queue(app: web.Application) -> None:
+    """Start submission workers when the application starts up."""
+    submission_queue.start()
+
+
+async def close_submission_queue(app: web.Application) -> None:
+    """Stop submission workers when the application is cleaned up."""
+    await submission_queue.close()
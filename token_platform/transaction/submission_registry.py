@@ -0,0 +1,89 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from conf import settings
+
+QUEUED = 'queued'
+SUBMITTING = 'submitting'
+SUCCESS = 'success'
+FAILED = 'failed'
+
+
+class Submission:
+    """Status of a signed transaction which is submitted through this service"""
+
+    def __init__(self, transaction_hash: str) -> None:
+        self.transaction_hash = transaction_hash
+        self.status = QUEUED
+        self.result: Optional[Dict] = None
+        self.error: Optional[str] = None
+        # Horizon rejected the transaction with a result code which proves it is not applied
+        self.rejected = False
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self._done: Optional[asyncio.Event] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in (SUCCESS, FAILED)
+
+    def finish(self, status: str, result: Dict = None, error: str = None, rejected: bool = False) -> None:
+        self.status = status
+        self.result = result
+        self.error = error
+        self.rejected = rejected
+        self.finished_at = time.time()
+        if self._done is not None:
+            self._done.set()
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait until the submission is done or timeout, return whether it is done"""
+        if self.done or timeout <= 0:
+            return self.done
+        if self._done is None:
+            self._done = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.done
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'transaction_hash': self.transaction_hash,
+            'status': self.status,
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at,
+            'finished_at': self.finished_at,
+        }
+
+
+class SubmissionRegistry:
+    """Size bounded registry of submissions by transaction hash, the oldest submission is evicted first"""
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._submissions: 'OrderedDict[str, Submission]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._submissions)
+
+    def get(self, transaction_hash: str) -> Optional[Submission]:
+        return self._submissions.get(transaction_hash)
+
+    def add(self, transaction_hash: str) -> Submission:
+        submission = Submission(transaction_hash)
+        self._submissions.pop(transaction_hash, None)
+        self._submissions[transaction_hash] = submission
+        while len(self._submissions) > self.max_size:
+            self._submissions.popitem(last=False)
+        return submission
+
+    def discard(self, transaction_hash: str) -> None:
+        self._submissions.pop(transaction_hash, None)
+
+
+submission_registry = SubmissionRegistry(settings['SUBMISSION_REGISTRY_SIZE'])
@@ -44,11 +44,11 @@ class TestGenerateMergeTransaction(BaseTestClass):
         }
 
     @unittest_run_loop
-    @patch('transaction.generate_merge_transaction.get_stellar_wallet')
+    @patch('transaction.generate_merge_transaction.reserve_sequence')
     @patch('transaction.generate_merge_transaction.build_generate_merge_transaction')
     @patch('transaction.generate_merge_transaction.get_escrow_wallet_detail')
     async def test_generate_merge_transaction_success(
-        self, mock_wallet_detail, mock_merge_transaction, mock_get_stellar_wallet
+        self, mock_wallet_detail, mock_merge_transaction, mock_reserve_sequence
     ):
         mock_wallet_detail.return_value = self.wallet_detail
         mock_merge_transaction.return_value = self.unsigned_xdr, self.tx_hash
@@ -57,7 +57,7 @@ class TestGenerateMergeTransaction(BaseTestClass):
             self.transaction_source_address, self.wallet_address, self.parties_wallet
         )
 
-        mock_get_stellar_wallet.return_value = Wallet("1", [], "1", {}, [], {}, {})
+        mock_reserve_sequence.return_value = "1"
 
         expect = {
             'wallet_address': self.wallet_address,
@@ -18,9 +18,9 @@ from decimal import Decimal
 class TestGetUnsignedTransaction(BaseTestClass):
     @unittest_run_loop
     @patch('transaction.generate_payment.get_wallet')
-    @patch('transaction.generate_payment.get_stellar_wallet')
+    @patch('transaction.generate_payment.reserve_channel')
     @patch('transaction.generate_payment.generate_payment')
-    async def test_get_transaction_from_request(self, mock_generate_payment, mock_stellar_wallet, mock_address):
+    async def test_get_transaction_from_request(self, mock_generate_payment, mock_reserve_channel, mock_address):
         mock_generate_payment.return_value = {}
         balances = [{'balance': '9.9999200', 'asset_type': 'native'}]
         mock_address.return_value = StellarWallet(balances)
@@ -28,8 +28,7 @@ class TestGetUnsignedTransaction(BaseTestClass):
         destination_address = 'GDMZSRU6XQ3MKEO3YVQNACUEKBDT6G75I27CTBIBKXMVY74BDTS3CSA6'
         transaction_source_address = 'GDSB3JZDYKLYKWZ6NXDPPGPCYJ32ISMTZ2LVF5PYQGY4B4FGNIU2M5BJ'
 
-        instance = mock_stellar_wallet.return_value
-        instance.sequence = 5
+        mock_reserve_channel.return_value = (transaction_source_address, 5)
 
         data = {
             'target_address': destination_address,
@@ -43,7 +42,7 @@ class TestGetUnsignedTransaction(BaseTestClass):
         mock_generate_payment.assert_called_once_with(
             transaction_source_address, source_address, destination_address, 5, 10, None, 5, None
         )
-        mock_stellar_wallet.assert_called_once()
+        mock_reserve_channel.assert_called_once_with(transaction_source_address)
 
     @unittest_run_loop
     @patch('transaction.generate_payment.get_wallet')
@@ -182,6 +181,7 @@ class TestGetUnsignedTransaction(BaseTestClass):
             "@transaction_url": reverse('transaction', transaction_hash='tx_hash'),
             "min_signer": 1,
             "signers": [{"public_key": "GDHH7XOUKIWA2NTMGBRD3P245P7SV2DAANU2RIONBAH6DGDLR5WISZZI", "weight": 1}],
+            "transaction_source_address": "GDSB3JZDYKLYKWZ6NXDPPGPCYJ32ISMTZ2LVF5PYQGY4B4FGNIU2M5BJ",
             "xdr": "xdr",
             "transaction_hash": "tx_hash",
         }
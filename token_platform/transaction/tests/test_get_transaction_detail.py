@@ -11,9 +11,13 @@ from transaction.get_transaction import get_transaction_from_request
 from transaction.transaction import get_transaction
 from conf import settings
 from router import reverse
+from transaction.transaction_cache import transaction_cache
 
 
 class TestGetTransactionFromRequest(BaseTestClass):
+    async def setUpAsync(self):
+        transaction_cache.clear()
+
     @unittest_run_loop
     @patch('transaction.get_transaction.get_transaction')
     async def test_get_transaction_from_request(self, mock_get_transaction) -> None:
@@ -0,0 +1,105 @@
+from aiohttp.test_utils import unittest_run_loop
+from asynctest import patch
+from stellar_base.builder import Builder
+from tests.test_utils import BaseTestClass
+
+from conf import settings
+from transaction.memo_filter import BloomFilter, MemoFilter
+from transaction.memo_index import MemoIndex
+from transaction.transaction import get_transaction_by_memo
+
+
+class TestBloomFilter(BaseTestClass):
+    def test_no_false_negative(self):
+        bloom = BloomFilter(capacity=1000, false_positive_rate=0.01, max_bytes=4096)
+        for i in range(1000):
+            bloom.add(f'memo-{i}')
+        assert all(f'memo-{i}' in bloom for i in range(1000))
+
+    def test_false_positive_rate(self):
+        bloom = BloomFilter(capacity=1000, false_positive_rate=0.01, max_bytes=4096)
+        for i in range(1000):
+            bloom.add(f'memo-{i}')
+        false_positives = sum(f'other-{i}' in bloom for i in range(10000))
+        assert false_positives < 300
+
+    def test_memory_is_limited(self):
+        bloom = BloomFilter(capacity=1000000, false_positive_rate=0.001, max_bytes=1024)
+        assert bloom.size_bytes == 1024
+
+
+class TestMemoFilter(BaseTestClass):
+    async def setUpAsync(self):
+        self.filter = MemoFilter(capacity=1000, false_positive_rate=0.01, max_bytes=4096, max_age=5)
+        self.address = 'GAH6333FKTNQGSFSDLCANJIE52N7IGMS7DUIWR6JIMQZE7XKWEQLJQAY'
+
+    def test_check_not_loaded_account(self):
+        assert self.filter.check(self.address, 'memo') is None
+
+    def test_check_loaded_account(self):
+        self.filter.update(self.address, ['memo'])
+        assert self.filter.check(self.address, 'memo') is True
+        assert self.filter.check(self.address, 'new-memo') is False
+
+    @patch('transaction.memo_filter.time.monotonic')
+    def test_check_stale_account(self, mock_time):
+        mock_time.return_value = 100
+        self.filter.update(self.address, ['memo'])
+        mock_time.return_value = 106
+        assert self.filter.check(self.address, 'new-memo') is None
+
+    def test_disabled_filter(self):
+        memo_filter = MemoFilter(capacity=1000, false_positive_rate=0.01, max_bytes=4096, max_age=0)
+        memo_filter.update(self.address, ['memo'])
+        assert memo_filter.check(self.address, 'new-memo') is None
+
+    def test_add_submitted_transaction(self):
+        source = 'GDSB3JZDYKLYKWZ6NXDPPGPCYJ32ISMTZ2LVF5PYQGY4B4FGNIU2M5BJ'
+        destination = 'GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6'
+        builder = Builder(address=source, horizon=settings['HORIZON_URL'], network=settings['PASSPHRASE'], sequence=1)
+        builder.append_payment_op(destination, 10, source=self.address)
+        builder.add_text_memo('submitted-memo')
+
+        self.filter.update(self.address, [])
+        self.filter.add_transaction(builder.gen_xdr())
+
+        assert self.filter.check(self.address, 'submitted-memo') is True
+        assert self.filter.check(destination, 'submitted-memo') is None
+        assert destination not in self.filter._filters
+        assert source not in self.filter._filters
+
+    def test_filters_are_bounded(self):
+        size = BloomFilter(capacity=1000, false_positive_rate=0.01, max_bytes=4096).size_bytes
+        memo_filter = MemoFilter(capacity=1000, false_positive_rate=0.01, max_bytes=4096, max_age=5, total_bytes=2 * size)
+        first, second, third = 'first', 'second', 'third'
+        memo_filter.update(first, ['memo'])
+        memo_filter.update(second, ['memo'])
+        assert memo_filter.check(first, 'memo') is True
+
+        memo_filter.update(third, ['memo'])
+
+        assert memo_filter.size_bytes == 2 * size
+        assert memo_filter.is_loaded(first)
+        assert not memo_filter.is_loaded(second)
+        assert memo_filter.is_loaded(third)
+
+
+class TestGetTransactionByMemoWithFilter(BaseTestClass):
+    async def setUpAsync(self):
+        self.address = 'GAH6333FKTNQGSFSDLCANJIE52N7IGMS7DUIWR6JIMQZE7XKWEQLJQAY'
+
+    @unittest_run_loop
+    @patch('transaction.transaction.memo_filter', new=MemoFilter(1000, 0.01, 4096, 5))
+    @patch('transaction.transaction.memo_index', new=MemoIndex(':memory:'))
+    @patch('transaction.transaction.stellar.wallet.get_transaction_by_wallet')
+    async def test_fresh_memo_does_not_touch_horizon(self, mock_transactions):
+        mock_transactions.return_value = [
+            {'memo_type': 'text', 'memo': 'used-memo', 'hash': 'test-hash', 'paging_token': '1'}
+        ]
+
+        assert await get_transaction_by_memo(self.address, 'used-memo')
+        assert await get_transaction_by_memo(self.address, 'fresh-memo') == {}
+        assert mock_transactions.call_count == 1
+
+        assert await get_transaction_by_memo(self.address, 'used-memo')
+        assert mock_transactions.call_count == 2
@@ -0,0 +1,99 @@
+import os
+import tempfile
+
+from aiohttp.test_utils import unittest_run_loop
+from asynctest import patch
+from tests.test_utils import BaseTestClass
+
+from transaction.memo_index import PAGE_SIZE, MemoIndex
+
+
+def make_transaction(paging_token: int, memo: str = None) -> dict:
+    return {
+        'hash': f'hash-{paging_token}',
+        'paging_token': str(paging_token),
+        'memo_type': 'text' if memo else 'none',
+        'memo': memo,
+    }
+
+
+class TestMemoIndex(BaseTestClass):
+    async def setUpAsync(self):
+        self.index = MemoIndex(':memory:')
+        self.address = 'GDBNKZDZMEKXOH3HLWLKFMM7ARN2XVPHWZ7DWBBEV3UXTIGXBTRGJLHF'
+
+    @unittest_run_loop
+    @patch('stellar.paginator.stellar.wallet.get_transaction_by_wallet')
+    async def test_sync_all_pages(self, mock_transactions):
+        first_page = [make_transaction(i, f'memo-{i}' if i % 2 else None) for i in range(1, PAGE_SIZE + 1)]
+        second_page = [make_transaction(PAGE_SIZE + 1, 'last-memo')]
+        mock_transactions.side_effect = [first_page, second_page]
+
+        await self.index.sync(self.address)
+
+        assert mock_transactions.call_count == 2
+        mock_transactions.assert_called_with(
+            wallet_address=self.address, limit=PAGE_SIZE, sort='asc', offset=str(PAGE_SIZE)
+        )
+        assert self.index.lookup(self.address, 'memo-1') == 'hash-1'
+        assert self.index.lookup(self.address, 'last-memo') == f'hash-{PAGE_SIZE + 1}'
+        assert self.index.lookup(self.address, 'unknown') is None
+        assert self.index.get_cursor(self.address) == str(PAGE_SIZE + 1)
+
+    @unittest_run_loop
+    @patch('stellar.paginator.stellar.wallet.get_transaction_by_wallet')
+    async def test_sync_only_new_transactions(self, mock_transactions):
+        mock_transactions.return_value = [make_transaction(1, 'memo')]
+        await self.index.sync(self.address)
+
+        mock_transactions.return_value = []
+        await self.index.sync(self.address)
+
+        mock_transactions.assert_called_with(wallet_address=self.address, limit=PAGE_SIZE, sort='asc', offset='1')
+        assert self.index.lookup(self.address, 'memo') == 'hash-1'
+
+    @unittest_run_loop
+    @patch('stellar.paginator.stellar.wallet.get_transaction_by_wallet')
+    async def test_latest_transaction_of_memo_is_kept(self, mock_transactions):
+        mock_transactions.return_value = [make_transaction(1, 'memo'), make_transaction(2, 'memo')]
+        await self.index.sync(self.address)
+        assert self.index.lookup(self.address, 'memo') == 'hash-2'
+
+    def test_index_survive_restart(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'memo_index.sqlite3')
+            index = MemoIndex(path)
+            index.add(self.address, [make_transaction(1, 'memo')])
+            index.close()
+
+            index = MemoIndex(path)
+            assert index.lookup(self.address, 'memo') == 'hash-1'
+            assert index.get_cursor(self.address) == '1'
+            index.close()
+
+    @unittest_run_loop
+    @patch('stellar.paginator.stellar.wallet.get_transaction_by_wallet')
+    async def test_empty_path_keep_index_in_memory(self, mock_transactions):
+        index = MemoIndex('')
+        mock_transactions.return_value = [make_transaction(1, 'memo')]
+
+        await index.sync(self.address)
+
+        assert index.lookup(self.address, 'memo') == 'hash-1'
+        index.close()
+
+    @unittest_run_loop
+    @patch('stellar.paginator.stellar.wallet.get_transaction_by_wallet')
+    async def test_index_in_memory_is_bounded(self, mock_transactions):
+        index = MemoIndex('', max_accounts=1)
+        other_address = 'GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6'
+        mock_transactions.return_value = [make_transaction(1, 'memo')]
+
+        await index.sync(self.address)
+        await index.sync(other_address)
+
+        assert index.lookup(self.address, 'memo') is None
+        assert index.get_cursor(self.address) is None
+        assert index.lookup(other_address, 'memo') == 'hash-1'
+        assert list(index._locks) == [other_address]
+        index.close()
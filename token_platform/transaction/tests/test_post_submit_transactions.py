@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+from aiohttp import web
+from aiohttp.test_utils import unittest_run_loop
+from asynctest import patch
+from stellar_base.builder import Builder
+from stellar_base.keypair import Keypair
+from tests.test_utils import BaseTestClass
+
+from conf import settings
+from router import reverse
+from transaction.post_submit_transactions import BatchItem, submit_batch
+
+
+class TestSubmitTransactions(BaseTestClass):
+    async def setUpAsync(self):
+        self.first = Keypair.random()
+        self.second = Keypair.random()
+
+    def _xdr(self, keypair, sequence):
+        builder = Builder(
+            secret=keypair.seed().decode(),
+            horizon=settings['HORIZON_URL'],
+            network=settings['PASSPHRASE'],
+            sequence=sequence,
+        )
+        builder.append_payment_op('GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6', '1')
+        builder.sign()
+        return builder.gen_xdr().decode()
+
+    @unittest_run_loop
+    @patch('transaction.post_submit_transactions.is_duplicate_transaction')
+    @patch('transaction.submission_queue.submit_transaction')
+    async def test_submit_chain_in_sequence_order(self, mock_submit, mock_dup):
+        mock_dup.return_value = False
+        submitted = []
+
+        async def submit(xdr):
+            submitted.append(xdr.decode())
+            await asyncio.sleep(0)
+            return {}
+
+        mock_submit.side_effect = submit
+        xdrs = [self._xdr(self.first, 12), self._xdr(self.second, 5), self._xdr(self.first, 11)]
+        items = [BatchItem(index, xdr) for index, xdr in enumerate(xdrs)]
+
+        results = [result async for result in submit_batch(items)]
+
+        assert sorted(result['index'] for result in results) == [0, 1, 2]
+        assert all(result['status'] == 'success' for result in results)
+        assert submitted.index(xdrs[2]) < submitted.index(xdrs[0])
+
+    @unittest_run_loop
+    @patch('transaction.post_submit_transactions.is_duplicate_transaction')
+    @patch('transaction.submission_queue.submit_transaction')
+    async def test_skip_rest_of_failed_chain(self, mock_submit, mock_dup):
+        mock_dup.return_value = False
+        mock_submit.side_effect = web.HTTPBadRequest(reason='tx_bad_seq')
+        items = [BatchItem(0, self._xdr(self.first, 11)), BatchItem(1, self._xdr(self.first, 12))]
+
+        results = {result['index']: result async for result in submit_batch(items)}
+
+        assert results[0]['status'] == 'failed'
+        assert results[0]['error'] == 'tx_bad_seq'
+        assert results[1]['status'] == 'skipped'
+        assert mock_submit.call_count == 1
+
+    @unittest_run_loop
+    @patch('transaction.post_submit_transactions.is_duplicate_transaction')
+    @patch('transaction.submission_queue.submit_transaction')
+    async def test_post_submit_transactions(self, mock_submit, mock_dup):
+        mock_dup.return_value = False
+        mock_submit.return_value = {'ledger': 1}
+        xdr = self._xdr(self.first, 11)
+        data = {'transactions': [xdr, {'xdr': 'invalid'}]}
+
+        resp = await self.client.request('POST', reverse('submit-transactions'), json=data)
+        assert resp.status == 202
+        body = await resp.json()
+        assert [result['status'] for result in body['results']] == ['success', 'failed']
+        assert body['results'][0]['result'] == {'ledger': 1}
+
+        resp = await self.client.request(
+            'POST', reverse('submit-transactions'), json={'transactions': [xdr]}, params={'stream': 'true'}
+        )
+        assert resp.status == 202
+        assert resp.headers['Content-Type'] == 'application/x-ndjson'
+        lines = [json.loads(line) for line in (await resp.text()).splitlines()]
+        assert lines[0]['index'] == 0
+
+    @unittest_run_loop
+    async def test_post_submit_transactions_empty_batch(self):
+        resp = await self.client.request('POST', reverse('submit-transactions'), json={'transactions': []})
+        assert resp.status == 400
@@ -0,0 +1,110 @@
+from aiohttp import web
+from aiohttp.test_utils import unittest_run_loop
+from asynctest import patch
+from stellar_base.builder import Builder
+from stellar_base.keypair import Keypair
+from tests.test_utils import BaseTestClass
+
+from conf import settings
+from router import reverse
+from stellar.account_cache import AccountCache
+from stellar.wallet import Wallet
+from transaction.prevalidation import get_required_thresholds, prevalidate_transaction
+
+
+class TestPrevalidateTransaction(BaseTestClass):
+    async def setUpAsync(self):
+        self.source = Keypair.random()
+        self.cosigner = Keypair.random()
+        self.address = self.source.address().decode()
+        self.cache = AccountCache(ttl=60, max_size=10)
+
+    def _build(self, sequence=10, signers=None):
+        builder = Builder(
+            address=self.address, horizon=settings['HORIZON_URL'], network=settings['PASSPHRASE'], sequence=sequence
+        )
+        builder.append_payment_op('GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6', '1')
+        for signer in signers or [self.source]:
+            builder.sign(signer.seed().decode())
+        return builder.gen_xdr().decode(), builder.te.hash_meta().hex()
+
+    def _cache_wallet(self, sequence='10', med_threshold=2):
+        signers = [
+            {'public_key': self.address, 'key': self.address, 'weight': 1, 'type': 'ed25519_public_key'},
+            {
+                'public_key': self.cosigner.address().decode(),
+                'key': self.cosigner.address().decode(),
+                'weight': 1,
+                'type': 'ed25519_public_key',
+            },
+        ]
+        thresholds = {'low_threshold': 1, 'med_threshold': med_threshold, 'high_threshold': 2}
+        self.cache.put(self.address, Wallet(self.address, [], sequence, {}, signers, thresholds, {}))
+
+    def test_prevalidate_transaction_hash_mismatch(self):
+        xdr, _ = self._build()
+        with self.assertRaises(web.HTTPBadRequest) as context:
+            prevalidate_transaction(xdr, 'e11b7a3677fdd45c885e8fb49d0079d083ee8a5cab08e32b00126172abb05111')
+        assert context.exception.reason == 'Transaction hash does not match transaction XDR.'
+
+    def test_prevalidate_transaction_bad_xdr(self):
+        with self.assertRaises(web.HTTPBadRequest):
+            prevalidate_transaction('test data', 'e11b7a3677fdd45c885e8fb49d0079d083ee8a5cab08e32b00126172abb05111')
+
+    def test_prevalidate_transaction_uncached_account(self):
+        xdr, tx_hash = self._build()
+        with patch('transaction.prevalidation.account_cache', new=self.cache):
+            prevalidate_transaction(xdr, tx_hash)
+
+    def test_prevalidate_transaction_bad_sequence(self):
+        xdr, tx_hash = self._build(sequence=9, signers=[self.source, self.cosigner])
+        self._cache_wallet(sequence='10')
+        with patch('transaction.prevalidation.account_cache', new=self.cache):
+            with self.assertRaises(web.HTTPBadRequest) as context:
+                prevalidate_transaction(xdr, tx_hash)
+        assert context.exception.reason == 'tx_bad_seq'
+
+    def test_prevalidate_transaction_bad_auth(self):
+        xdr, tx_hash = self._build(signers=[self.source, Keypair.random()])
+        self._cache_wallet()
+        with patch('transaction.prevalidation.account_cache', new=self.cache):
+            with self.assertRaises(web.HTTPBadRequest) as context:
+                prevalidate_transaction(xdr, tx_hash)
+        assert context.exception.reason == 'tx_bad_auth'
+
+    @patch('stellar.account_cache.time.monotonic')
+    def test_prevalidate_transaction_stale_signers(self, mock_time):
+        xdr, tx_hash = self._build(signers=[self.source, Keypair.random()])
+        mock_time.return_value = 100
+        self._cache_wallet()
+        mock_time.return_value = 100 + settings['PREVALIDATION_SIGNERS_MAX_AGE'] + 1
+        with patch('transaction.prevalidation.account_cache', new=self.cache):
+            prevalidate_transaction(xdr, tx_hash)
+
+    def test_prevalidate_transaction_enough_signatures(self):
+        xdr, tx_hash = self._build(signers=[self.source, self.cosigner])
+        self._cache_wallet()
+        with patch('transaction.prevalidation.account_cache', new=self.cache):
+            prevalidate_transaction(xdr, tx_hash)
+
+    def test_get_required_thresholds(self):
+        builder = Builder(
+            address=self.address, horizon=settings['HORIZON_URL'], network=settings['PASSPHRASE'], sequence=10
+        )
+        other = Keypair.random().address().decode()
+        builder.append_payment_op('GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6', '1')
+        builder.append_account_merge_op(self.address, source=other)
+
+        assert get_required_thresholds(builder.gen_te()) == {
+            self.address: 'med_threshold',
+            other: 'high_threshold',
+        }
+
+    @unittest_run_loop
+    @patch('transaction.put_transaction.is_duplicate_transaction')
+    async def test_put_transaction_hash_mismatch(self, mock_dup):
+        xdr, _ = self._build()
+        url = reverse('transaction', transaction_hash='e11b7a3677fdd45c885e8fb49d0079d083ee8a5cab08e32b00126172abb05111')
+        resp = await self.client.request('PUT', url, data=xdr)
+        assert resp.status == 400
+        mock_dup.assert_not_called()
@@ -1,30 +1,49 @@
+import asyncio
+
 import pytest
 from aiohttp.test_utils import unittest_run_loop
 from asynctest import patch
 from tests.test_utils import BaseTestClass
 from aiohttp import web
 from router import reverse
+from stellar_base.builder import Builder
+from stellar_base.keypair import Keypair
+
+from conf import settings
+from transaction.submission_registry import submission_registry
+
 
 class TestSubmitTransactionFromRequest(BaseTestClass):
+    async def setUpAsync(self):
+        builder = Builder(
+            secret=Keypair.random().seed().decode(),
+            horizon=settings['HORIZON_URL'],
+            network=settings['PASSPHRASE'],
+            sequence=1,
+        )
+        builder.append_payment_op('GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6', '1')
+        builder.sign()
+        self.xdr = builder.gen_xdr().decode()
+        self.tx_hash = builder.te.hash_meta().hex()
 
     @unittest_run_loop
     @patch('transaction.put_transaction.is_duplicate_transaction')
-    @patch('transaction.put_transaction.submit_transaction')
+    @patch('transaction.submission_queue.submit_transaction')
     async def test_put_transaction_from_request_success(self, mock_tx, mock_dup) -> None:
 
         mock_dup.return_value = False
         mock_tx.return_value = {'status': 200}
-        url = reverse('transaction', transaction_hash='transaction-hash')
-        resp = await self.client.request("PUT", url, data=b'test data')
+        url = reverse('transaction', transaction_hash=self.tx_hash)
+        resp = await self.client.request("PUT", url, data=self.xdr)
         assert resp.status == 202
 
     @unittest_run_loop
     @patch('transaction.put_transaction.is_duplicate_transaction')
-    @patch('transaction.put_transaction.submit_transaction')
+    @patch('transaction.submission_queue.submit_transaction')
     async def test_put_transaction_from_request_with_no_xdr(self, mock_tx, mock_dup) -> None:
         mock_dup.return_value = False
         mock_tx.return_value = {'status': 200}
-        url = reverse('transaction', transaction_hash='transaction-hash')
+        url = reverse('transaction', transaction_hash=self.tx_hash)
         resp = await self.client.request("PUT", url)
         assert resp.status == 400
         text = await resp.json()
@@ -32,12 +51,81 @@ class TestSubmitTransactionFromRequest(BaseTestClass):
 
     @unittest_run_loop
     @patch('transaction.put_transaction.is_duplicate_transaction')
-    @patch('transaction.put_transaction.submit_transaction')
+    @patch('transaction.submission_queue.submit_transaction')
     async def test_put_transaction_from_request_with_duplicate_transaction(self, mock_tx, mock_dup) -> None:
         mock_dup.return_value = True
         mock_tx.return_value = {'status': 200}
-        url = reverse('transaction', transaction_hash='transaction-hash')
-        resp = await self.client.request("PUT", url, data=b'test data')
+        url = reverse('transaction', transaction_hash=self.tx_hash)
+        resp = await self.client.request("PUT", url, data=self.xdr)
         assert resp.status == 400
         text = await resp.json()
         assert 'message' in text
+
+    @unittest_run_loop
+    @patch('transaction.put_transaction.is_duplicate_transaction')
+    @patch('transaction.submission_queue.submit_transaction')
+    async def test_put_transaction_from_request_async(self, mock_tx, mock_dup) -> None:
+        mock_dup.return_value = False
+        mock_tx.return_value = {'hash': self.tx_hash}
+        url = reverse('transaction', transaction_hash=self.tx_hash)
+        resp = await self.client.request("PUT", url, data=self.xdr, headers={'Prefer': 'respond-async'})
+        assert resp.status == 202
+        text = await resp.json()
+        status_url = reverse('transaction-status', transaction_hash=self.tx_hash)
+        assert text['@id'].endswith(status_url)
+        assert resp.headers['Location'] == text['@id']
+
+        resp = await self.client.request("GET", status_url, params={'wait': 1})
+        assert resp.status == 200
+        text = await resp.json()
+        assert text['status'] == 'success'
+        assert text['result'] == {'hash': self.tx_hash}
+        mock_tx.assert_called_once_with(self.xdr.encode())
+
+    @unittest_run_loop
+    @patch('transaction.put_transaction.is_duplicate_transaction')
+    @patch('transaction.put_transaction.submission_queue.enqueue')
+    async def test_put_transaction_from_request_async_queue_full(self, mock_enqueue, mock_dup) -> None:
+        mock_dup.return_value = False
+        mock_enqueue.side_effect = web.HTTPServiceUnavailable(reason='full', headers={'Retry-After': '1'})
+        url = reverse('transaction', transaction_hash=self.tx_hash)
+        resp = await self.client.request("PUT", url, data=self.xdr, params={'async': 'true'})
+        assert resp.status == 503
+        assert resp.headers['Retry-After'] == '1'
+
+    @unittest_run_loop
+    @patch('transaction.put_transaction.is_duplicate_transaction')
+    @patch('transaction.put_transaction.submission_queue.enqueue')
+    async def test_put_transaction_from_request_async_concurrent(self, mock_enqueue, mock_dup) -> None:
+        checking = asyncio.Event()
+
+        async def is_duplicate(transaction_hash):
+            checking.set()
+            await asyncio.sleep(0.05)
+            return False
+
+        mock_dup.side_effect = is_duplicate
+        mock_enqueue.side_effect = lambda transaction_hash, xdr: submission_registry.add(transaction_hash)
+        url = reverse('transaction', transaction_hash=self.tx_hash)
+
+        async def put():
+            return await self.client.request("PUT", url, data=self.xdr, params={'async': 'true'})
+
+        first = asyncio.ensure_future(put())
+        await checking.wait()
+        responses = await asyncio.gather(first, put())
+
+        assert [resp.status for resp in responses] == [202, 202]
+        mock_dup.assert_called_once_with(self.tx_hash)
+        mock_enqueue.assert_called_once_with(self.tx_hash, self.xdr)
+        submission_registry.discard(self.tx_hash)
+
+    @unittest_run_loop
+    async def test_get_submission_status_not_found(self) -> None:
+        url = reverse('transaction-status', transaction_hash='unknown-transaction-hash')
+        resp = await self.client.request("GET", url)
+        assert resp.status == 404
+
+        for wait in ('soon', 'nan', 'inf'):
+            resp = await self.client.request("GET", url, params={'wait': wait})
+            assert resp.status == 400
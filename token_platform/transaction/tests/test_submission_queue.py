@@ -0,0 +1,87 @@
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import unittest_run_loop
+from asynctest import patch
+from tests.test_utils import BaseTestClass
+
+from transaction.submission_queue import SubmissionQueue, is_not_applied
+from transaction.submission_registry import FAILED, QUEUED, SUCCESS, SubmissionRegistry
+
+
+class TestSubmissionQueue(BaseTestClass):
+    async def setUpAsync(self):
+        self.registry = SubmissionRegistry(max_size=10)
+
+    @unittest_run_loop
+    @patch('transaction.submission_queue.submit_transaction')
+    async def test_submit_in_background(self, mock_submit):
+        mock_submit.return_value = {'hash': 'tx-hash'}
+        queue = SubmissionQueue(concurrency=2, max_size=10, registry=self.registry)
+        queue.start()
+
+        submission = queue.enqueue('tx-hash', 'xdr')
+        assert submission.status == QUEUED
+        assert await submission.wait(1)
+        await queue.close()
+
+        assert submission.status == SUCCESS
+        assert submission.result == {'hash': 'tx-hash'}
+        assert self.registry.get('tx-hash') is submission
+        mock_submit.assert_called_once_with(b'xdr')
+
+    @unittest_run_loop
+    @patch('transaction.submission_queue.submit_transaction')
+    async def test_record_failed_submission(self, mock_submit):
+        mock_submit.side_effect = web.HTTPBadRequest(reason='tx_bad_seq')
+        queue = SubmissionQueue(concurrency=1, max_size=10, registry=self.registry)
+        queue.start()
+
+        submission = queue.enqueue('tx-hash', 'xdr')
+        assert await submission.wait(1)
+        await queue.close()
+
+        assert submission.status == FAILED
+        assert submission.error == 'tx_bad_seq'
+        assert submission.rejected is False
+
+    def test_not_applied_result_codes(self):
+        assert is_not_applied(web.HTTPBadRequest(reason='tx_bad_auth'))
+        assert is_not_applied(web.HTTPBadRequest(reason='tx_failed op_underfunded'))
+        assert not is_not_applied(web.HTTPBadRequest(reason='tx_bad_seq'))
+        assert not is_not_applied(web.HTTPBadRequest(reason='tx_too_late'))
+        assert not is_not_applied(web.HTTPBadRequest())
+        assert not is_not_applied(web.HTTPInternalServerError(reason='tx_bad_auth'))
+
+    @unittest_run_loop
+    @patch('transaction.submission_queue.submit_transaction')
+    async def test_reject_when_queue_is_full(self, mock_submit):
+        release = asyncio.Event()
+
+        async def submit(xdr):
+            await release.wait()
+            return {}
+
+        mock_submit.side_effect = submit
+        queue = SubmissionQueue(concurrency=1, max_size=1, registry=self.registry)
+        queue.start()
+
+        first = queue.enqueue('tx-1', 'xdr-1')
+        await asyncio.sleep(0)
+        queue.enqueue('tx-2', 'xdr-2')
+        with self.assertRaises(web.HTTPServiceUnavailable):
+            queue.enqueue('tx-3', 'xdr-3')
+        assert self.registry.get('tx-3') is None
+
+        release.set()
+        assert await first.wait(1)
+        await queue.close()
+
+    def test_registry_evict_oldest_submission(self):
+        registry = SubmissionRegistry(max_size=2)
+        registry.add('tx-1')
+        registry.add('tx-2')
+        registry.add('tx-3')
+
+        assert registry.get('tx-1') is None
+        assert len(registry) == 2
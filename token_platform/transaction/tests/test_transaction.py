@@ -1,6 +1,9 @@
+import asyncio
+
 import pytest
 from aiohttp.test_utils import unittest_run_loop
 from aiohttp.web_exceptions import HTTPBadRequest, HTTPInternalServerError, HTTPNotFound
+from aiohttp import web
 from aioresponses import aioresponses
 from asynctest import patch
 from stellar_base.builder import Builder
@@ -16,6 +19,8 @@ from transaction.transaction import (
     get_transaction_hash,
     is_duplicate_transaction,
 )
+from transaction.memo_index import MemoIndex
+from transaction.submission_registry import FAILED, SUCCESS, submission_registry
 from wallet.tests.factory.wallet import StellarWallet
 from stellar.wallet import Wallet
 
@@ -145,18 +150,73 @@ class TestGetThreshold(BaseTestClass):
         assert result == 2
 
     @unittest_run_loop
+    @patch('transaction.transaction.memo_index', new=MemoIndex(':memory:'))
     @patch('transaction.transaction.stellar.wallet.get_transaction_by_wallet')
     async def test_get_transaction_by_memo_success(self, mock_get_transaction):
-        mock_get_transaction.return_value = [{"memo_type": "text", "memo": "testmemo", "hash": "testhash"}]
+        mock_get_transaction.return_value = [
+            {"memo_type": "text", "memo": "testmemo", "hash": "testhash", "paging_token": "1"}
+        ]
 
         result = await get_transaction_by_memo('GD3PPDLKXRDM57UV7QDFIHLLRCLM4KGVIA43GEM7ZOT7EHK5TR3Z5G6I', 'testmemo')
         assert 'error' in result.keys()
         assert 'url' in result.keys()
 
     @unittest_run_loop
+    @patch('transaction.transaction.memo_index', new=MemoIndex(':memory:'))
     @patch('transaction.transaction.stellar.wallet.get_transaction_by_wallet')
     async def test_get_transaction_by_memo_not_found(self, mock_get_transaction):
         mock_get_transaction.return_value = []
 
         result = await get_transaction_by_memo('GDHH7XOUKIWA2NTMGBRD3P245P7SV2DAANU2RIONBAH6DGDLR5WISZZI', 'testmemo')
         assert not result
+
+
+class TestDuplicateTransactionRegistry(BaseTestClass):
+    async def setUpAsync(self):
+        self.tx_hash = 'b5c4d9ac8cd7a87e13ee1b82c9b5e8b0cdbc0e8b0f1fa3d4c1a4d36a1b7a9e10'
+        submission_registry.discard(self.tx_hash)
+
+    @unittest_run_loop
+    @patch('transaction.transaction.stellar.wallet.get_transaction')
+    async def test_is_duplicate_transaction_submitted_by_service(self, mock_data) -> None:
+        submission_registry.add(self.tx_hash).finish(SUCCESS, result={})
+
+        assert await is_duplicate_transaction(self.tx_hash) is True
+        mock_data.assert_not_called()
+
+    @unittest_run_loop
+    @patch('transaction.transaction.stellar.wallet.get_transaction')
+    async def test_is_duplicate_transaction_rejected_by_horizon(self, mock_data) -> None:
+        submission_registry.add(self.tx_hash).finish(FAILED, error='tx_bad_auth', rejected=True)
+
+        assert await is_duplicate_transaction(self.tx_hash) is False
+        mock_data.assert_not_called()
+
+    @unittest_run_loop
+    @patch('transaction.transaction.stellar.wallet.get_transaction')
+    async def test_is_duplicate_transaction_failed_without_proof(self, mock_data) -> None:
+        submission_registry.add(self.tx_hash).finish(FAILED, error='tx_bad_seq', rejected=False)
+        mock_data.return_value = {'id': self.tx_hash}
+
+        assert await is_duplicate_transaction(self.tx_hash) is True
+        mock_data.assert_called_once_with(self.tx_hash)
+
+    @unittest_run_loop
+    @patch('transaction.transaction.stellar.wallet.get_transaction')
+    async def test_is_duplicate_transaction_unknown_not_found(self, mock_data) -> None:
+        mock_data.side_effect = web.HTTPNotFound(reason='Resource Missing')
+
+        assert await is_duplicate_transaction(self.tx_hash) is False
+        mock_data.assert_called_once_with(self.tx_hash)
+
+    @unittest_run_loop
+    @patch('transaction.transaction.stellar.wallet.get_transaction')
+    async def test_is_duplicate_transaction_horizon_timeout(self, mock_data) -> None:
+        async def slow_transaction(tx_hash):
+            await asyncio.sleep(1)
+
+        mock_data.side_effect = slow_transaction
+
+        with patch.dict(settings, {'DUPLICATE_CHECK_TIMEOUT': 0.01}):
+            with self.assertRaises(web.HTTPServiceUnavailable):
+                await is_duplicate_transaction(self.tx_hash)
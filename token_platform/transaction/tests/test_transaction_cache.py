@@ -0,0 +1,53 @@
+from aiohttp.test_utils import unittest_run_loop
+from asynctest import patch
+from tests.test_utils import BaseTestClass
+
+from router import reverse
+from transaction.transaction_cache import TransactionCache, transaction_cache
+
+
+class TestTransactionCache(BaseTestClass):
+    async def setUpAsync(self):
+        transaction_cache.clear()
+        self.tx_hash = '4c239561b64f2353819452073f2ec7f62a5ad66f533868f89f7af862584cdee9'
+
+    def test_evict_least_recently_used_by_bytes(self):
+        cache = TransactionCache(max_bytes=100)
+        first = cache.put('tx-1', {'memo': 'a' * 30})
+        cache.put('tx-2', {'memo': 'b' * 30})
+        cache.get('tx-1')
+        cache.put('tx-3', {'memo': 'c' * 30})
+
+        assert cache.get('tx-1') == first
+        assert cache.get('tx-2') is None
+        assert cache.get('tx-3') is not None
+        assert cache.size <= 100
+
+    def test_cache_disabled(self):
+        cache = TransactionCache(max_bytes=0)
+        entry = cache.put('tx-1', {'memo': 'a'})
+
+        assert entry.body == b'{"memo": "a"}'
+        assert cache.get('tx-1') is None
+
+    @unittest_run_loop
+    @patch('transaction.get_transaction.get_transaction')
+    async def test_get_transaction_from_request_cached(self, mock_get_transaction):
+        mock_get_transaction.return_value = {'transaction_id': self.tx_hash}
+        url = reverse('transaction', transaction_hash=self.tx_hash)
+
+        resp = await self.client.request('GET', url)
+        assert resp.status == 200
+        assert await resp.json() == {'transaction_id': self.tx_hash}
+        etag = resp.headers['ETag']
+        assert 'immutable' in resp.headers['Cache-Control']
+
+        resp = await self.client.request('GET', url)
+        assert resp.status == 200
+        assert resp.headers['ETag'] == etag
+
+        resp = await self.client.request('GET', url, headers={'If-None-Match': etag})
+        assert resp.status == 304
+        assert resp.headers['ETag'] == etag
+
+        mock_get_transaction.assert_called_once_with(self.tx_hash)
@@ -0,0 +1,98 @@
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import unittest_run_loop
+from asynctest import patch
+from tests.test_utils import BaseTestClass
+
+from request_tracking.metrics import watcher_metric
+from router import reverse
+from transaction.transaction_cache import transaction_cache
+from transaction.transaction_watcher import TransactionWatcher
+
+
+class TestTransactionWatcher(BaseTestClass):
+    async def setUpAsync(self):
+        transaction_cache.clear()
+
+    @unittest_run_loop
+    @patch('transaction.transaction_watcher.stellar.wallet.get_transactions')
+    @patch('transaction.transaction_watcher.stellar.wallet.get_latest_ledger')
+    async def test_resolve_every_waiter_from_one_poll(self, mock_ledger, mock_transactions):
+        mock_ledger.return_value = {'sequence': 10}
+        mock_transactions.side_effect = [
+            [],
+            [{'hash': 'other-hash', 'paging_token': '42949672961'}, {'hash': 'tx-hash', 'paging_token': '42949672962'}],
+            [],
+        ]
+        watcher = TransactionWatcher(interval=0.01)
+
+        landed = await asyncio.gather(*[watcher.wait('tx-hash', 1) for _ in range(10)])
+
+        assert landed == [True] * 10
+        mock_ledger.assert_called_once_with()
+        assert mock_transactions.call_count == 2
+        mock_transactions.assert_any_call(str(8 << 32), limit=200)
+        await watcher.close()
+
+    @unittest_run_loop
+    @patch('transaction.transaction_watcher.stellar.wallet.get_transactions')
+    async def test_count_empty_poll(self, mock_transactions):
+        mock_transactions.return_value = []
+        polls = watcher_metric['POLL']._value.get()
+
+        assert await TransactionWatcher(interval=0.01)._poll('42949672961') == '42949672961'
+
+        assert watcher_metric['POLL']._value.get() == polls + 1
+
+    @unittest_run_loop
+    @patch('transaction.transaction_watcher.stellar.wallet.get_transactions')
+    @patch('transaction.transaction_watcher.stellar.wallet.get_latest_ledger')
+    async def test_wait_timeout(self, mock_ledger, mock_transactions):
+        mock_ledger.return_value = {'sequence': 10}
+        mock_transactions.return_value = []
+        watcher = TransactionWatcher(interval=0.01)
+
+        assert await watcher.wait('tx-hash', 0.05) is False
+        await asyncio.sleep(0.02)
+
+        assert watcher._waiters == {}
+        assert watcher._task.done()
+
+    @unittest_run_loop
+    @patch('transaction.get_transaction.transaction_watcher.wait')
+    @patch('transaction.get_transaction.get_transaction')
+    async def test_get_transaction_from_request_wait(self, mock_get_transaction, mock_wait):
+        mock_get_transaction.side_effect = [web.HTTPNotFound(reason='Not Found'), {'transaction_id': 'tx-hash'}]
+        mock_wait.return_value = True
+
+        resp = await self.client.request('GET', reverse('transaction', transaction_hash='tx-hash'), params={'wait': 5})
+
+        assert resp.status == 200
+        assert await resp.json() == {'transaction_id': 'tx-hash'}
+        assert mock_get_transaction.call_count == 2
+        mock_wait.assert_called_once_with('tx-hash', 5)
+
+    @unittest_run_loop
+    @patch('transaction.get_transaction.transaction_watcher.wait')
+    @patch('transaction.get_transaction.get_transaction')
+    async def test_get_transaction_from_request_wait_landed(self, mock_get_transaction, mock_wait):
+        mock_get_transaction.return_value = {'transaction_id': 'landed-hash'}
+
+        resp = await self.client.request('GET', reverse('transaction', transaction_hash='landed-hash'), params={'wait': 5})
+
+        assert resp.status == 200
+        mock_get_transaction.assert_called_once_with('landed-hash')
+        mock_wait.assert_not_called()
+
+    @unittest_run_loop
+    @patch('transaction.get_transaction.transaction_watcher.wait')
+    @patch('transaction.get_transaction.get_transaction')
+    async def test_get_transaction_from_request_wait_timeout(self, mock_get_transaction, mock_wait):
+        mock_get_transaction.side_effect = web.HTTPNotFound(reason='Not Found')
+        mock_wait.return_value = False
+
+        resp = await self.client.request('GET', reverse('transaction', transaction_hash='tx-hash'), params={'wait': 5})
+
+        assert resp.status == 404
+        mock_get_transaction.assert_called_once_with('tx-hash')
@@ -1,10 +1,19 @@
+import asyncio
 import copy
 from typing import Any, Dict, List, Mapping, NewType, Optional, Union
 
 import aiohttp
+from aiohttp import web
 import stellar
 from conf import settings
+from request_tracking.metrics import memo_filter_metric, submission_metric
 from router import reverse
+from stellar.account_cache import account_cache
+from stellar.paginator import paginate_transaction_operations
+from stellar.sequence_allocator import sequence_allocator
+from transaction.memo_filter import memo_filter
+from transaction.memo_index import memo_index
+from transaction.submission_registry import FAILED, submission_registry
 from wallet.wallet import get_wallet
 
 JSONType = Union[str, int, float, bool, None, Dict[str, Any], List[Any]]
@@ -12,18 +21,43 @@ HORIZON_URL = settings['HORIZON_URL']
 
 
 async def is_duplicate_transaction(transaction_hash: str) -> bool:
-    """Check transaction is duplicate or not"""
+    """Check transaction is duplicate or not
+
+        Transaction which is submitted through this service is checked with submission registry,
+        only unknown transaction is looked up on Horizon within DUPLICATE_CHECK_TIMEOUT seconds.
+    """
+    submission = submission_registry.get(transaction_hash)
+    if submission is not None and (submission.status != FAILED or submission.rejected):
+        submission_metric['LOCAL_DUPLICATE_CHECK'].inc()
+        return submission.status != FAILED
+
+    submission_metric['HORIZON_DUPLICATE_CHECK'].inc()
     try:
-        transaction = await stellar.wallet.get_transaction(transaction_hash)
-        id = transaction.get('id')
-        return True if id else False
-    except:
+        transaction = await asyncio.wait_for(
+            stellar.wallet.get_transaction(transaction_hash), settings['DUPLICATE_CHECK_TIMEOUT']
+        )
+    except web.HTTPNotFound:
         return False
+    except Exception:
+        raise web.HTTPServiceUnavailable(
+            reason='Cannot check duplicate transaction, please retry later.',
+            headers={'Retry-After': str(settings['SUBMIT_RETRY_AFTER'])},
+        )
+    id = transaction.get('id')
+    return True if id else False
 
 
 async def submit_transaction(xdr: bytes) -> dict:
     """Submit transaction into Stellar network"""
-    resp = await stellar.wallet.submit_transaction(xdr)
+    try:
+        resp = await stellar.wallet.submit_transaction(xdr)
+    except Exception as e:
+        sequence_allocator.release_transaction(xdr, error=getattr(e, 'reason', None) or repr(e))
+        raise
+    finally:
+        account_cache.invalidate_transaction(xdr)
+    sequence_allocator.release_transaction(xdr)
+    memo_filter.add_transaction(xdr)
     return resp
 
 
@@ -67,16 +101,20 @@ async def get_transaction(tx_hash: str) -> Dict[str, Union[str, int, List[Dict[s
 
     async def _get_operation_data_of_transaction(tx_hash: str) -> List[Dict[str, str]]:
         """Get operation list of transaction"""
-        operations = await stellar.wallet.get_operations_of_transaction(tx_hash)
+        operations = [
+            operation async for page in paginate_transaction_operations(tx_hash) for operation in page
+        ]
         for operation in operations:
             operation.pop("_links")
         return operations
 
-    transaction = await stellar.wallet.get_transaction(tx_hash)
+    transaction, operations = await asyncio.gather(
+        stellar.wallet.get_transaction(tx_hash), _get_operation_data_of_transaction(tx_hash)
+    )
 
     tx_detail = _format_transaction(transaction)
 
-    tx_detail["operations"] = await _get_operation_data_of_transaction(tx_hash)
+    tx_detail["operations"] = operations
 
     return tx_detail
 
@@ -110,26 +148,24 @@ async def get_threshold_weight(wallet_address: str, operation_type: str) -> int:
     return wallet.thresholds[level]
 
 
-async def get_transaction_by_memo(source_account: str, memo: str, cursor: int = None) -> Dict:
-
-    # Get transactions data within key 'records'
-    transactions = await stellar.wallet.get_transaction_by_wallet(
-        wallet_address=source_account, limit=200, sort='desc', offset=cursor
-    )
-
-    # Filter result data on above by 'memo_type' == text
-    transactions_filter = list([transaction for transaction in transactions if transaction['memo_type'] == 'text'])
-
-    for transaction in transactions_filter:
-
-        if transaction['memo'] == memo:
-            return {
-                'error': 'Transaction is already submited',
-                'url': '/transaction/{}'.format(transaction['hash']),
-                'transaction_hash': transaction['hash'],
-            }
-
-    if len(transactions) > 0:
-        transaction_paging_token = transactions[-1]['paging_token']
-        return await get_transaction_by_memo(source_account, memo, transaction_paging_token)
-    return {}
+async def get_transaction_by_memo(source_account: str, memo: str) -> Dict:
+    """Find transaction of the account which has the text memo, return empty dict if it is not found"""
+    possibly_used = memo_filter.check(source_account, memo)
+    if possibly_used is False:
+        return {}
+
+    memos = await memo_index.sync(source_account)
+    if not memo_filter.is_loaded(source_account):
+        memos = memo_index.memos(source_account)
+    memo_filter.update(source_account, memos)
+
+    transaction_hash = memo_index.lookup(source_account, memo)
+    if not transaction_hash:
+        if possibly_used:
+            memo_filter_metric['FALSE_POSITIVE'].inc()
+        return {}
+    return {
+        'error': 'Transaction is already submited',
+        'url': '/transaction/{}'.format(transaction_hash),
+        'transaction_hash': transaction_hash,
+    }
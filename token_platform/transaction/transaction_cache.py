@@ -0,0 +1,73 @@
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from dataclasses import dataclass
+
+from conf import settings
+from request_tracking.metrics import transaction_cache_metric
+
+
+@dataclass
+class CachedTransaction:
+    body: bytes
+    etag: str
+
+
+class TransactionCache:
+    """LRU cache of formatted transaction details which is bounded by size of their JSON bodies in bytes.
+
+    A transaction which Horizon returns is already in a ledger and never changes,
+    so entries don't expire, they are only evicted when the cache is full.
+    The cache is disabled when max_bytes is 0.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: 'OrderedDict[str, CachedTransaction]' = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, transaction_hash: str) -> Optional[CachedTransaction]:
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(transaction_hash)
+        if entry is None:
+            transaction_cache_metric['MISS'].inc()
+            return None
+
+        self._entries.move_to_end(transaction_hash)
+        transaction_cache_metric['HIT'].inc()
+        return entry
+
+    def put(self, transaction_hash: str, transaction: Dict[str, Any]) -> CachedTransaction:
+        """Serialize transaction detail and cache it, evict least recently used transactions when the cache is full."""
+        body = json.dumps(transaction).encode('utf8')
+        entry = CachedTransaction(body, '"{}"'.format(hashlib.sha256(body).hexdigest()))  # type: ignore
+        if not self.enabled or len(body) > self.max_bytes:
+            return entry
+
+        previous = self._entries.pop(transaction_hash, None)
+        if previous is not None:
+            self.size -= len(previous.body)
+        self._entries[transaction_hash] = entry
+        self.size += len(body)
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted.body)
+            transaction_cache_metric['EVICTION'].inc()
+        transaction_cache_metric['BYTES'].set(self.size)
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+        transaction_cache_metric['BYTES'].set(0)
+
+
+transaction_cache = TransactionCache(settings['TRANSACTION_CACHE_MAX_BYTES'])
@@ -0,0 +1,101 @@
+import asyncio
+import logging
+from typing import Dict, Optional
+
+from aiohttp import web
+
+import stellar.wallet
+from conf import settings
+from request_tracking.metrics import watcher_metric
+from stellar.paginator import paginate_transactions
+
+# Paging token of a transaction is its ledger sequence shifted by 32 bits
+PAGING_TOKEN_LEDGER_SHIFT = 32
+PAGE_LIMIT = 200
+
+
+class _Waiter:
+    """Future of a transaction hash which is shared by every request waiting for it"""
+
+    def __init__(self) -> None:
+        self.future: asyncio.Future = asyncio.get_event_loop().create_future()
+        self.count = 0
+
+
+class TransactionWatcher:
+    """Single upstream watcher which resolves every request waiting for a transaction to land.
+
+    While someone is waiting, the watcher pages through transactions of the network every
+    `interval` seconds and resolves waiters of the hashes it sees, so N waiting requests
+    cost one Horizon poll instead of N. The watcher starts `rewind_ledgers` ledgers before
+    the last closed ledger, so a transaction which lands while a waiter registers is not missed.
+    """
+
+    def __init__(self, interval: float, rewind_ledgers: int = 2) -> None:
+        self.interval = interval
+        self.rewind_ledgers = rewind_ledgers
+        self._waiters: Dict[str, _Waiter] = {}
+        self._task: Optional[asyncio.Task] = None
+
+        watcher_metric['WAITING'].set_function(lambda: len(self._waiters))
+
+    async def wait(self, transaction_hash: str, timeout: float) -> bool:
+        """Wait until the transaction lands in a ledger or timeout, return whether it landed"""
+        waiter = self._waiters.get(transaction_hash)
+        if waiter is None:
+            waiter = self._waiters[transaction_hash] = _Waiter()
+        waiter.count += 1
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_event_loop().create_task(self._watch())
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            waiter.count -= 1
+            if waiter.count == 0 and self._waiters.get(transaction_hash) is waiter:
+                del self._waiters[transaction_hash]
+
+    async def _watch(self) -> None:
+        cursor = None
+        while self._waiters:
+            try:
+                if cursor is None:
+                    ledger = await stellar.wallet.get_latest_ledger()
+                    cursor = str(max(ledger['sequence'] - self.rewind_ledgers, 0) << PAGING_TOKEN_LEDGER_SHIFT)
+                cursor = await self._poll(cursor)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                watcher_metric['ERROR'].inc()
+                logging.getLogger('aiohttp.server').error(f'Transaction watcher cannot poll Horizon: {e!r}')
+            await asyncio.sleep(self.interval)
+
+    async def _poll(self, cursor: str) -> str:
+        """Resolve waiters of transactions after cursor, return cursor of the last seen transaction"""
+        watcher_metric['POLL'].inc()
+        async for records in paginate_transactions(cursor, PAGE_LIMIT):
+            for record in records:
+                waiter = self._waiters.pop(record['hash'], None)
+                if waiter is not None and not waiter.future.done():
+                    waiter.future.set_result(record)
+                    watcher_metric['LANDED'].inc()
+            cursor = records[-1]['paging_token']
+        return cursor
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self._waiters = {}
+
+
+transaction_watcher = TransactionWatcher(settings['TRANSACTION_WATCH_INTERVAL'])
+
+
+async def close_transaction_watcher(app: web.Application) -> None:
+    """Stop transaction watcher when the application is cleaned up."""
+    await transaction_watcher.close()
@@ -0,0 +1,223 @@
+import asyncio
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from aiohttp import web
+from dateutil import parser
+
+from conf import settings
+from request_tracking.metrics import effects_store_metric
+from stellar.paginator import paginate_effects
+
+PAGE_SIZE = 200
+
+# Optional fields of effects which are stored in their own columns
+_COLUMN_FIELDS = ['amount', 'asset_type', 'asset_code', 'asset_issuer']
+# Fields which are stored in columns or dropped, the rest of an effect is stored as JSON details
+_STORED_FIELDS = {'_links', 'id', 'paging_token', 'account', 'type', 'type_i', 'created_at', *_COLUMN_FIELDS}
+
+
+class EffectsStore:
+    """Append-only local copy of effects of each account, stored in SQLite.
+
+    The store remembers paging token of the last stored effect of each account,
+    so syncing an account only reads effects which are newer than that token.
+    Locks and sync times are kept for at most max_accounts accounts, the least recently synced first forgotten.
+    SQLite is only used from one worker thread, run blocking methods with `run` from the event loop.
+    """
+
+    def __init__(self, path: str, max_age: float = 0, max_pages: int = None, max_accounts: int = None) -> None:
+        self.path = path
+        self.max_age = max_age
+        self.max_pages = max_pages if max_pages is not None else settings['EFFECTS_STORE_SYNC_MAX_PAGES']
+        self.max_accounts = max_accounts if max_accounts is not None else settings['EFFECTS_STORE_MAX_ACCOUNTS']
+        self._connection: Optional[sqlite3.Connection] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._locks: 'OrderedDict[str, asyncio.Lock]' = OrderedDict()
+        self._synced_at: 'OrderedDict[str, float]' = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            with self._connection:
+                self._connection.execute(
+                    '''CREATE TABLE IF NOT EXISTS effect (
+                        account TEXT NOT NULL,
+                        operation_id INTEGER NOT NULL,
+                        effect_index INTEGER NOT NULL,
+                        id TEXT NOT NULL,
+                        type TEXT NOT NULL,
+                        created_at INTEGER NOT NULL,
+                        amount TEXT,
+                        asset_type TEXT,
+                        asset_code TEXT,
+                        asset_issuer TEXT,
+                        details TEXT NOT NULL,
+                        PRIMARY KEY (account, operation_id, effect_index)
+                    )'''
+                )
+                self._connection.execute(
+                    'CREATE INDEX IF NOT EXISTS effect_created_at ON effect (account, created_at)'
+                )
+                self._connection.execute(
+                    '''CREATE TABLE IF NOT EXISTS cursor (
+                        account TEXT PRIMARY KEY,
+                        paging_token TEXT NOT NULL
+                    )'''
+                )
+        return self._connection
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        return self._executor
+
+    async def run(self, function: Callable, *args) -> Any:
+        """Run blocking method of the store in its worker thread"""
+        return await asyncio.get_event_loop().run_in_executor(self.executor, function, *args)
+
+    def get_cursor(self, account: str) -> Optional[str]:
+        """Get paging token of the last stored effect of the account"""
+        row = self.connection.execute('SELECT paging_token FROM cursor WHERE account = ?', (account,)).fetchone()
+        return row[0] if row else None
+
+    def add(self, account: str, effects: List[Dict]) -> None:
+        """Store effects which are sorted by ascending paging token"""
+        if not effects:
+            return
+        rows = []
+        for effect in effects:
+            operation_id, effect_index = parse_paging_token(effect['paging_token'])
+            details = {key: value for key, value in effect.items() if key not in _STORED_FIELDS}
+            created_at = int(parser.isoparse(effect['created_at']).timestamp())  # type: ignore
+            columns = [effect.get(field) for field in _COLUMN_FIELDS]
+            rows.append(
+                (account, operation_id, effect_index, effect['id'], effect['type'], created_at, *columns, json.dumps(details))
+            )
+        with self.connection:
+            self.connection.executemany('INSERT OR IGNORE INTO effect VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+            self.connection.execute('INSERT OR REPLACE INTO cursor VALUES (?, ?)', (account, effects[-1]['paging_token']))
+        effects_store_metric['STORED'].inc(len(rows))
+
+    async def sync(self, account: str) -> bool:
+        """Store at most max_pages pages of effects of the account which are newer than the last stored one
+
+            Return True when all effects of the account are stored. Accounts which are fully synced
+            within max_age seconds are not read from Horizon again.
+        """
+        async with self._get_lock(account):
+            if time.monotonic() - self._synced_at.get(account, float('-inf')) < self.max_age:
+                return True
+            pages = 0
+            effects: List[Dict] = []
+            cursor = await self.run(self.get_cursor, account)
+            async for effects in paginate_effects(account, 'asc', cursor, PAGE_SIZE, max_pages=self.max_pages):
+                pages += 1
+                effects_store_metric['SYNC_PAGE'].inc()
+                await self.run(self.add, account, effects)
+            if pages == self.max_pages and len(effects) == PAGE_SIZE:
+                return False
+            self._synced_at[account] = time.monotonic()
+            self._synced_at.move_to_end(account)
+            while len(self._synced_at) > self.max_accounts:
+                self._synced_at.popitem(last=False)
+            return True
+
+    def _get_lock(self, account: str) -> asyncio.Lock:
+        lock = self._locks.get(account)
+        if lock is None:
+            lock = self._locks[account] = asyncio.Lock()
+        self._locks.move_to_end(account)
+        if len(self._locks) > self.max_accounts:
+            # Locks which are held are kept until they are released
+            for other in list(self._locks):
+                if len(self._locks) <= self.max_accounts:
+                    break
+                if other != account and not self._locks[other].locked():
+                    del self._locks[other]
+        return lock
+
+    def history(
+        self,
+        account: str,
+        sort: str = 'asc',
+        limit: int = 10,
+        offset: str = None,
+        start_date: datetime = None,
+        end_date: datetime = None,
+        types: Set[str] = None,
+    ) -> List[Dict]:
+        """Get stored effects of the account in the same format as Horizon effects"""
+        conditions = ['account = ?']
+        parameters: list = [account]
+        if offset:
+            try:
+                operation_id, effect_index = parse_paging_token(offset)
+            except ValueError:
+                raise web.HTTPBadRequest(reason='Invalid. Parameter offset.')
+            comparison = '>' if sort == 'asc' else '<'
+            conditions.append(
+                f'(operation_id {comparison} ? OR (operation_id = ? AND effect_index {comparison} ?))'
+            )
+            parameters.extend([operation_id, operation_id, effect_index])
+        if start_date:
+            conditions.append('created_at >= ?')
+            parameters.append(int(start_date.timestamp()))
+        if end_date:
+            conditions.append('created_at <= ?')
+            parameters.append(int(end_date.timestamp()))
+        if types:
+            conditions.append(f'type IN ({", ".join("?" * len(types))})')
+            parameters.extend(sorted(types))
+        order = 'ASC' if sort == 'asc' else 'DESC'
+        rows = self.connection.execute(
+            f'''SELECT operation_id, effect_index, id, type, created_at, amount, asset_type, asset_code, asset_issuer,
+                details FROM effect
+                WHERE {' AND '.join(conditions)}
+                ORDER BY operation_id {order}, effect_index {order} LIMIT ?''',
+            parameters + [limit],
+        )
+        return [
+            {
+                'id': id,
+                'paging_token': f'{operation_id}-{effect_index}',
+                'account': account,
+                'type': type,
+                'created_at': datetime.utcfromtimestamp(created_at).strftime('%Y-%m-%dT%H:%M:%SZ'),
+                **{field: value for field, value in zip(_COLUMN_FIELDS, columns) if value is not None},
+                **json.loads(details),
+            }
+            for operation_id, effect_index, id, type, created_at, *columns, details in rows
+        ]
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+def parse_paging_token(paging_token: str) -> Tuple[int, int]:
+    """Split effect paging token into operation id and index of the effect in the operation"""
+    operation_id, _, effect_index = paging_token.partition('-')
+    return int(operation_id), int(effect_index or 0)
+
+
+async def close_effects_store(app) -> None:
+    effects_store.close()
+
+
+effects_store = EffectsStore(settings['EFFECTS_STORE_PATH'], settings['EFFECTS_STORE_MAX_AGE'])
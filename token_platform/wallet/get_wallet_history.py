@@ -1,12 +1,18 @@
 from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set
+from urllib.parse import urlencode
 
 from aiohttp import web
 from dateutil import parser
 from stellar_base.address import Address
 
 from conf import settings
+from request_tracking.metrics import effects_store_metric, wallet_history_metric
 from router import reverse
+from stellar.ledger_index import ledger_cursor, ledger_index
+from stellar.paginator import paginate_effects
 from stellar.wallet import get_wallet_effect
+from wallet.effects_store import effects_store
 
 
 async def get_wallet_history_from_request(request: web.Request) -> web.Response:
@@ -33,8 +39,13 @@ async def get_wallet_history_from_request(request: web.Request) -> web.Response:
         end_date = datetime_is_valid(end_date)
         end_date = end_date.astimezone(tz=timezone.utc)
 
-    history = await get_wallet_history(wallet_address, sort, limit, offset)
-    formatted_history = await format_history(history, wallet_address, limit, sort)
+    if start_date and end_date and start_date > end_date:
+        raise web.HTTPBadRequest(reason=f'Invalid. Parameter start-date must not be after end-date.')
+
+    types = {effect_type.strip() for effect_type in type.split(',') if effect_type.strip()} if type else None
+
+    history = await get_wallet_history(wallet_address, sort, limit, offset, start_date, end_date, types)
+    formatted_history = await format_history(history, wallet_address, limit, sort, start_date, end_date, offset, types)
 
     return web.json_response(formatted_history)
 
@@ -53,28 +64,104 @@ def datetime_is_valid(value: str) -> datetime:
     return date_time
 
 
-async def get_wallet_history(wallet_address: str, sort: str = 'asc', limit: int = 10, offset: str = None) -> dict:
+async def get_wallet_history(
+    wallet_address: str,
+    sort: str = 'asc',
+    limit: int = 10,
+    offset: str = None,
+    start_date: datetime = None,
+    end_date: datetime = None,
+    types: Set[str] = None,
+) -> dict:
     """
         Get wallet history from Stellar network.
-    """
-    effects = await get_wallet_effect(wallet_address, sort, limit, offset)
-    return effects
-
 
-async def format_history(history: dict, wallet_address: str, limit: int, sort: str) -> dict:
-    def _format_record(record):
-        result = record
-        result.pop('_links', None)
-        result.pop('type_i', None)
-        result['offset'] = result.pop('paging_token', None)
-        result['address'] = result.pop('account', None)
+        With start_date or end_date, history starts from the first effect in the range,
+        it is found by seeking the ledger of the date instead of paging from the beginning.
+        With types, only effects of those types are returned. Filtered history is read until
+        there are `limit` effects, the range ends or HISTORY_MAX_PAGES pages are read, and
+        `cursor` is the offset of the last effect which is read so the next page resumes there.
 
-        return result
-
-    records = [_format_record(record) for record in history['_embedded']['records']]
-
-    last_record_offset = records[-1]['offset']
-    first_record_offset = records[0]['offset']
+        When effects store is enabled, new effects of the wallet are stored first and history
+        is served from the store. Until all effects of the wallet are stored, each request stores
+        at most EFFECTS_STORE_SYNC_MAX_PAGES pages and history is read from Horizon.
+    """
+    if effects_store.enabled:
+        if await effects_store.sync(wallet_address):
+            stored = await effects_store.run(
+                effects_store.history, wallet_address, sort, limit, offset, start_date, end_date, types
+            )
+            return {'_embedded': {'records': stored}}
+        effects_store_metric['BACKFILL'].inc()
+
+    if not start_date and not end_date and not types:
+        effects = await get_wallet_effect(wallet_address, sort, limit, offset)
+        return effects
+
+    if not offset:
+        offset = await seek_history_offset(sort, start_date, end_date)
+
+    # Matching effects can be sparse, so read as many effects per request as Horizon allows
+    page_size = max(limit, settings['HISTORY_PAGE_SIZE']) if types else limit
+    records: List[dict] = []
+    cursor = offset
+    pages = 0
+    effects = paginate_effects(wallet_address, sort, offset, page_size, max_pages=settings['HISTORY_MAX_PAGES'])
+    try:
+        async for page_records in effects:
+            pages += 1
+            for record in page_records:
+                created_at = parser.isoparse(record['created_at'])  # type: ignore
+                if (sort == 'asc' and end_date and created_at > end_date) or (
+                    sort == 'desc' and start_date and created_at < start_date
+                ):
+                    return {'_embedded': {'records': records}, 'cursor': cursor}
+                cursor = record['paging_token']
+                if is_in_history_filter(record, created_at, start_date, end_date, types):
+                    records.append(record)
+                    if len(records) == limit:
+                        return {'_embedded': {'records': records}, 'cursor': cursor}
+            if pages == settings['HISTORY_MAX_PAGES'] and len(page_records) == page_size:
+                wallet_history_metric['PAGE_LIMIT_REACHED'].inc()
+    finally:
+        wallet_history_metric['UPSTREAM_PAGE'].inc(pages)
+        await effects.aclose()
+    return {'_embedded': {'records': records}, 'cursor': cursor}
+
+
+def is_in_history_filter(
+    record: dict, created_at: datetime, start_date: Optional[datetime], end_date: Optional[datetime], types: Optional[Set[str]]
+) -> bool:
+    if start_date and created_at < start_date:
+        return False
+    if end_date and created_at > end_date:
+        return False
+    return not types or record['type'] in types
+
+
+async def seek_history_offset(sort: str, start_date: Optional[datetime], end_date: Optional[datetime]) -> Optional[str]:
+    """Get offset of the first effect in date range, None means the first effect of the history"""
+    if sort == 'asc' and start_date:
+        return ledger_cursor(await ledger_index.find_ledger(start_date))
+    if sort == 'desc' and end_date:
+        return ledger_cursor(await ledger_index.find_ledger(end_date, after=True))
+    return None
+
+
+async def format_history(
+    history: dict,
+    wallet_address: str,
+    limit: int,
+    sort: str,
+    start_date: datetime = None,
+    end_date: datetime = None,
+    offset: str = None,
+    types: Set[str] = None,
+) -> dict:
+    records = [format_record(record) for record in history['_embedded']['records']]
+
+    last_record_offset = history.get('cursor') or (records[-1]['offset'] if records else offset) or ''
+    first_record_offset = records[0]['offset'] if records else offset or ''
 
     url = reverse('wallet-history', wallet_address=wallet_address)
 
@@ -88,6 +175,17 @@ async def format_history(history: dict, wallet_address: str, limit: int, sort: s
     next_history = f'{url}?offset={last_record_offset}&limit={limit}&sort={next_sort}'
     previous_history = f'{url}?offset={first_record_offset}&limit={limit}&sort={previous_sort}'
 
+    filters: Dict[str, str] = {}
+    if types:
+        filters['type'] = ','.join(sorted(types))
+    if start_date:
+        filters['start-date'] = start_date.isoformat()
+    if end_date:
+        filters['end-date'] = end_date.isoformat()
+    if filters:
+        next_history += f'&{urlencode(filters)}'
+        previous_history += f'&{urlencode(filters)}'
+
     result = {
         '@id': reverse('wallet-history', wallet_address=wallet_address),
         'history': records,
@@ -96,3 +194,14 @@ async def format_history(history: dict, wallet_address: str, limit: int, sort: s
     }
 
     return result
+
+
+def format_record(record: dict) -> dict:
+    """Format Horizon effect as wallet history record"""
+    result = record
+    result.pop('_links', None)
+    result.pop('type_i', None)
+    result['offset'] = result.pop('paging_token', None)
+    result['address'] = result.pop('account', None)
+
+    return result
@@ -0,0 +1,94 @@
+import asyncio
+import csv
+import io
+import json
+import logging
+from contextlib import suppress
+from typing import Dict, List
+
+from aiohttp import web
+
+from middlewares.exception import format_error
+from ndjson import NDJSON_CONTENT_TYPE, ndjson_line
+from stellar.paginator import paginate_effects
+from wallet.get_wallet_history import format_record
+
+CSV_CONTENT_TYPE = 'text/csv'
+CSV_COLUMNS = ['id', 'offset', 'address', 'type', 'created_at', 'amount', 'asset_type', 'asset_code', 'asset_issuer']
+EXPORT_FORMATS = {'csv': CSV_CONTENT_TYPE, 'ndjson': NDJSON_CONTENT_TYPE}
+
+
+async def get_wallet_history_export_from_request(request: web.Request) -> web.StreamResponse:
+    """Stream the whole wallet history as CSV or NDJSON
+
+        Effects are written as pages arrive from Horizon, so memory use doesn't grow with the history.
+        CSV has a column for each common field and the other fields of an effect as JSON in details column.
+        When Horizon fails after the export started, NDJSON ends with an error line and the connection
+        is closed without ending the body, so clients can tell the export is incomplete.
+    """
+    wallet_address = request.match_info.get('wallet_address')
+    export_format = request.query.get('format', 'csv').lower()
+    sort = request.query.get('sort', 'asc').lower()
+
+    if export_format not in EXPORT_FORMATS:
+        raise web.HTTPBadRequest(reason=f'Invalid. Parameter format should be csv or ndjson.')
+    if not (sort == 'asc' or sort == 'desc'):
+        raise web.HTTPBadRequest(reason=f'Invalid. Parameter sort.')
+
+    pages = paginate_effects(wallet_address, sort)
+    try:
+        # Read the first page before sending headers, so an unknown wallet is still answered with its error status
+        try:
+            first_page = await pages.__anext__()
+        except StopAsyncIteration:
+            first_page = []
+
+        response = web.StreamResponse(
+            headers={
+                'Content-Type': EXPORT_FORMATS[export_format],
+                'Content-Disposition': f'attachment; filename="{wallet_address}-history.{export_format}"',
+            }
+        )
+        await response.prepare(request)
+        write_page = _csv_page if export_format == 'csv' else _ndjson_page
+        if export_format == 'csv':
+            await response.write(_csv_rows([CSV_COLUMNS + ['details']]))
+        try:
+            if first_page:
+                await response.write(write_page(first_page))
+                async for page in pages:
+                    await response.write(write_page(page))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Status is already sent, so the error can't be answered by the error middleware
+            logging.getLogger('aiohttp.server').error(f'Wallet history export of {wallet_address} failed: {e!r}')
+            if export_format == 'ndjson':
+                with suppress(ConnectionError):
+                    await response.write(ndjson_line(format_error(e)))
+            # Closing the transport cancels the handler like a client disconnect
+            request.transport.close()
+            raise asyncio.CancelledError()
+        await response.write_eof()
+        return response
+    finally:
+        await pages.aclose()
+
+
+def _csv_page(records: List[Dict]) -> bytes:
+    rows = []
+    for record in records:
+        record = format_record(record)
+        details = {key: value for key, value in record.items() if key not in CSV_COLUMNS}
+        rows.append([record.get(column, '') for column in CSV_COLUMNS] + [json.dumps(details) if details else ''])
+    return _csv_rows(rows)
+
+
+def _csv_rows(rows: List[List]) -> bytes:
+    output = io.StringIO()
+    csv.writer(output).writerows(rows)
+    return output.getvalue().encode()
+
+
+def _ndjson_page(records: List[Dict]) -> bytes:
+    return b''.join(ndjson_line(format_record(record)) for record in records)
@@ -7,7 +7,8 @@ from aiohttp import web
 from decimal import Decimal, InvalidOperation
 from conf import settings
 from router import reverse
-from wallet.wallet import build_generate_trust_wallet_transaction, get_wallet, wallet_address_is_duplicate
+from stellar.sequence_allocator import reserve_sequence
+from wallet.wallet import build_generate_trust_wallet_transaction, wallet_address_is_duplicate
 
 
 async def post_generate_trust_wallet_from_request(request: web.Request) -> web.Response:
@@ -42,14 +43,14 @@ async def post_generate_trust_wallet_from_request(request: web.Request) -> web.R
     if duplicate:
         raise web.HTTPBadRequest(reason='Target address is already used.')
 
-    wallet = await get_wallet(transaction_source_address)
+    sequence = await reserve_sequence(transaction_source_address)
     unsigned_xdr_byte, tx_hash_byte = build_generate_trust_wallet_transaction(
         transaction_source_address,
         source_address,
         destination_address,
         xlm_amount,
         hot_amount,
-        sequence=wallet.sequence,
+        sequence=sequence,
     )
 
     unsigned_xdr: str = unsigned_xdr_byte.decode()
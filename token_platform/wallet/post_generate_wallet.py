@@ -1,13 +1,14 @@
 import binascii
 from decimal import Decimal, InvalidOperation
 from json import JSONDecodeError
+from typing import Optional
 
 from aiohttp import web
 from conf import settings
 from router import reverse
 from transaction.transaction import get_signers
-from wallet.wallet import (build_generate_wallet_transaction, get_wallet,
-                           wallet_address_is_duplicate)
+from stellar.channel_pool import get_transaction_source_address, reserve_channel
+from wallet.wallet import build_generate_wallet_transaction, wallet_address_is_duplicate
 
 async def post_generate_wallet_from_request(request: web.Request):
     """Aiohttp Request wallet address to get create wallet transaction."""
@@ -20,7 +21,7 @@ async def post_generate_wallet_from_request(request: web.Request):
 
     destination_address: str = json_response['target_address']
 
-    transaction_source_address: str = json_response['transaction_source_address']
+    requested_source_address: Optional[str] = get_transaction_source_address(json_response)
     try:
         balance: Decimal = Decimal(json_response.get('amount_xlm', 0))
     except InvalidOperation:
@@ -33,8 +34,8 @@ async def post_generate_wallet_from_request(request: web.Request):
     if duplicate:
         raise web.HTTPBadRequest(reason = 'Target address is already used.')
 
-    wallet = await get_wallet(transaction_source_address)
-    unsigned_xdr_byte, tx_hash_byte = build_generate_wallet_transaction(transaction_source_address, source_address, destination_address, balance, sequence=wallet.sequence)
+    transaction_source_address, sequence = await reserve_channel(requested_source_address)
+    unsigned_xdr_byte, tx_hash_byte = build_generate_wallet_transaction(transaction_source_address, source_address, destination_address, balance, sequence=sequence)
 
     unsigned_xdr: str = unsigned_xdr_byte.decode()
     tx_hash: str = binascii.hexlify(tx_hash_byte).decode()
@@ -46,6 +47,7 @@ async def post_generate_wallet_from_request(request: web.Request):
     result = {
         'source_address': source_address,
         'signers': signers,
+        'transaction_source_address': transaction_source_address,
         'xdr': unsigned_xdr,
         'transaction_url': f"{host}{reverse('transaction', transaction_hash=tx_hash)}",
         'transaction_hash': tx_hash,
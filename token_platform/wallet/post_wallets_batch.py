@@ -0,0 +1,47 @@
+import asyncio
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+from aiohttp import web
+
+from conf import settings
+from middlewares.exception import format_error
+from wallet.get_wallet import get_wallet_detail
+
+
+async def post_wallets_batch_from_request(request: web.Request) -> web.Response:
+    """Get wallet detail of every address in {"wallet_addresses": [...]}"""
+    body = await request.json()
+    wallet_addresses = body['wallet_addresses']
+
+    if not isinstance(wallet_addresses, list) or not all(isinstance(address, str) for address in wallet_addresses):
+        raise web.HTTPBadRequest(reason='Parameter wallet_addresses must be a list of wallet addresses.')
+    if len(wallet_addresses) > settings['WALLET_BATCH_MAX_SIZE']:
+        raise web.HTTPBadRequest(
+            reason=f"Parameter wallet_addresses must not have more than {settings['WALLET_BATCH_MAX_SIZE']} addresses."
+        )
+
+    result = await get_wallet_details(wallet_addresses)
+    return web.json_response({'wallets': result})
+
+
+async def get_wallet_details(wallet_addresses: List[str]) -> List[Dict[str, Any]]:
+    """Get wallet detail of each distinct address with at most WALLET_BATCH_CONCURRENCY lookups at the same time
+
+        Result of each address has its HTTP status and either wallet detail or error message,
+        results are in order of the first occurrence of each address.
+    """
+    semaphore = asyncio.Semaphore(settings['WALLET_BATCH_CONCURRENCY'])
+
+    async def _get_wallet_detail(wallet_address: str) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                wallet = await get_wallet_detail(wallet_address)
+            except web.HTTPException as e:
+                return {'wallet_address': wallet_address, 'status': e.status_code, 'error': format_error(e)['message']}
+            except Exception as e:
+                return {'wallet_address': wallet_address, 'status': 400, 'error': format_error(e)['message']}
+        return {'wallet_address': wallet_address, 'status': 200, 'wallet': wallet}
+
+    unique_addresses = list(OrderedDict.fromkeys(wallet_addresses))
+    return await asyncio.gather(*[_get_wallet_detail(address) for address in unique_addresses])
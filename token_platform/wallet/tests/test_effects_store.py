@@ -0,0 +1,175 @@
+import os
+import tempfile
+from datetime import datetime, timezone
+
+from aiohttp.test_utils import unittest_run_loop
+from asynctest import patch
+from tests.test_utils import BaseTestClass
+
+from wallet.effects_store import PAGE_SIZE, EffectsStore
+from wallet.get_wallet_history import get_wallet_history
+
+ADDRESS = 'GDHZCRVQP3W3GUSZMC3ECHRG3WVQQZXVDHY5TOQ5AB5JKRSSUUZ6XDUE'
+
+
+def make_effect(operation_id: int, effect_type: str = 'account_credited', day: int = 1) -> dict:
+    return {
+        '_links': {'operation': {'href': f'https://horizon-testnet.stellar.org/operations/{operation_id}'}},
+        'id': f'{operation_id:019d}-0000000001',
+        'paging_token': f'{operation_id}-1',
+        'account': ADDRESS,
+        'type': effect_type,
+        'type_i': 2,
+        'created_at': f'2018-05-{day:02d}T13:31:45Z',
+        'amount': '10.0000000',
+    }
+
+
+def make_page(effects: list) -> dict:
+    return {'_embedded': {'records': effects}}
+
+
+class TestEffectsStore(BaseTestClass):
+    async def setUpAsync(self):
+        self.store = EffectsStore(':memory:')
+
+    @unittest_run_loop
+    @patch('stellar.paginator.stellar.wallet.get_wallet_effect')
+    async def test_sync_all_pages(self, mock_effect):
+        first_page = [make_effect(i) for i in range(1, PAGE_SIZE + 1)]
+        mock_effect.side_effect = [make_page(first_page), make_page([make_effect(PAGE_SIZE + 1)])]
+
+        await self.store.sync(ADDRESS)
+
+        assert mock_effect.call_count == 2
+        mock_effect.assert_called_with(ADDRESS, 'asc', PAGE_SIZE, f'{PAGE_SIZE}-1')
+        assert self.store.get_cursor(ADDRESS) == f'{PAGE_SIZE + 1}-1'
+
+    @unittest_run_loop
+    @patch('stellar.paginator.stellar.wallet.get_wallet_effect')
+    async def test_sync_only_new_effects(self, mock_effect):
+        mock_effect.return_value = make_page([make_effect(1)])
+        await self.store.sync(ADDRESS)
+
+        mock_effect.return_value = make_page([])
+        await self.store.sync(ADDRESS)
+
+        mock_effect.assert_called_with(ADDRESS, 'asc', PAGE_SIZE, '1-1')
+        assert len(self.store.history(ADDRESS)) == 1
+
+    @unittest_run_loop
+    @patch('stellar.paginator.stellar.wallet.get_wallet_effect')
+    async def test_sync_stops_at_page_budget(self, mock_effect):
+        store = EffectsStore(':memory:', max_pages=1)
+        first_page = [make_effect(i) for i in range(1, PAGE_SIZE + 1)]
+        mock_effect.side_effect = [make_page(first_page), make_page([make_effect(PAGE_SIZE + 1)])]
+
+        assert await store.sync(ADDRESS) is False
+        assert mock_effect.call_count == 1
+        assert store.get_cursor(ADDRESS) == f'{PAGE_SIZE}-1'
+
+        assert await store.sync(ADDRESS) is True
+        assert store.get_cursor(ADDRESS) == f'{PAGE_SIZE + 1}-1'
+
+    @unittest_run_loop
+    @patch('stellar.paginator.stellar.wallet.get_wallet_effect')
+    async def test_sync_state_is_bounded(self, mock_effect):
+        store = EffectsStore(':memory:', max_age=60, max_accounts=1)
+        mock_effect.return_value = make_page([])
+
+        await store.sync(ADDRESS)
+        await store.sync('GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6')
+
+        assert list(store._locks) == ['GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6']
+        assert list(store._synced_at) == ['GABEAFZ7POCHDY4YCQMRAGVVXEEO4XWYKBY4LMHHJRHTC4MZQBWS6NL6']
+
+    @unittest_run_loop
+    @patch('stellar.paginator.stellar.wallet.get_wallet_effect')
+    async def test_recently_synced_account_is_not_read(self, mock_effect):
+        store = EffectsStore(':memory:', max_age=60)
+        mock_effect.return_value = make_page([make_effect(1)])
+
+        await store.sync(ADDRESS)
+        await store.sync(ADDRESS)
+
+        assert mock_effect.call_count == 1
+
+    def test_history_in_horizon_format(self):
+        self.store.add(ADDRESS, [make_effect(1)])
+
+        assert self.store.history(ADDRESS) == [{
+            'id': '0000000000000000001-0000000001',
+            'paging_token': '1-1',
+            'account': ADDRESS,
+            'type': 'account_credited',
+            'created_at': '2018-05-01T13:31:45Z',
+            'amount': '10.0000000',
+        }]
+
+    def test_asset_fields_stored_in_columns(self):
+        effect = dict(make_effect(1), asset_type='credit_alphanum4', asset_code='HOT', asset_issuer=ADDRESS)
+        self.store.add(ADDRESS, [effect])
+
+        row = self.store.connection.execute('SELECT amount, asset_type, asset_code, asset_issuer, details FROM effect').fetchone()
+        assert row == ('10.0000000', 'credit_alphanum4', 'HOT', ADDRESS, '{}')
+        assert self.store.history(ADDRESS)[0]['asset_code'] == 'HOT'
+
+    def test_history_filter(self):
+        self.store.add(ADDRESS, [
+            make_effect(1, 'account_credited', 1),
+            make_effect(2, 'trade', 2),
+            make_effect(3, 'account_credited', 3),
+            make_effect(4, 'account_debited', 4),
+            make_effect(5, 'account_credited', 5),
+        ])
+
+        def tokens(*args, **kwargs):
+            return [effect['paging_token'] for effect in self.store.history(ADDRESS, *args, **kwargs)]
+
+        assert tokens('asc', 2) == ['1-1', '2-1']
+        assert tokens('asc', 2, '2-1') == ['3-1', '4-1']
+        assert tokens('desc', 2, '4-1') == ['3-1', '2-1']
+        assert tokens('asc', 10, types={'account_credited'}) == ['1-1', '3-1', '5-1']
+        assert tokens(
+            'desc', 10,
+            start_date=datetime(2018, 5, 2, tzinfo=timezone.utc),
+            end_date=datetime(2018, 5, 4, tzinfo=timezone.utc),
+            types={'account_credited', 'trade'},
+        ) == ['3-1', '2-1']
+
+    def test_store_survive_restart(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'effects.sqlite3')
+            store = EffectsStore(path)
+            store.add(ADDRESS, [make_effect(1)])
+            store.close()
+
+            store = EffectsStore(path)
+            assert store.get_cursor(ADDRESS) == '1-1'
+            assert len(store.history(ADDRESS)) == 1
+            store.close()
+
+
+class TestGetWalletHistoryFromStore(BaseTestClass):
+    @unittest_run_loop
+    @patch('wallet.get_wallet_history.effects_store', new_callable=lambda: EffectsStore(':memory:'))
+    @patch('stellar.paginator.stellar.wallet.get_wallet_effect')
+    async def test_history_served_from_store(self, mock_effect, mock_store):
+        mock_effect.return_value = make_page([make_effect(1), make_effect(2, 'trade')])
+
+        history = await get_wallet_history(ADDRESS, 'asc', 10, types={'trade'})
+
+        assert [effect['paging_token'] for effect in history['_embedded']['records']] == ['2-1']
+
+    @unittest_run_loop
+    @patch('wallet.get_wallet_history.effects_store', new_callable=lambda: EffectsStore(':memory:', max_pages=1))
+    @patch('wallet.get_wallet_history.get_wallet_effect')
+    @patch('stellar.paginator.stellar.wallet.get_wallet_effect')
+    async def test_history_served_from_horizon_until_stored(self, mock_effect, mock_horizon, mock_store):
+        mock_effect.return_value = make_page([make_effect(i) for i in range(1, PAGE_SIZE + 1)])
+        mock_horizon.return_value = make_page([make_effect(1)])
+
+        history = await get_wallet_history(ADDRESS, 'asc', 10)
+
+        assert history == make_page([make_effect(1)])
+        mock_horizon.assert_called_once_with(ADDRESS, 'asc', 10, None)
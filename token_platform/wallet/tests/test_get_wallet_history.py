@@ -1,7 +1,10 @@
+from datetime import datetime, timezone
+
 from aiohttp.test_utils import unittest_run_loop
 from asynctest import patch
 from tests.test_utils import BaseTestClass
 
+from conf import settings
 from router import reverse
 from wallet.get_wallet_history import get_wallet_history, format_history
 
@@ -74,6 +77,128 @@ class TestGetWalletHistoryFromRequest(BaseTestClass):
         resp = await self.client.request("GET", get_wallet_history_url, params=params)
         assert resp.status == 400
 
+    @unittest_run_loop
+    async def test_get_wallet_history_from_request_fail_start_date_after_end_date(self):
+        params = {'start-date': '2019-06-12T02:38:34Z', 'end-date': '2018-06-12T02:38:34Z'}
+        get_wallet_history_url = reverse('wallet-history', wallet_address=self.wallet_address)
+        resp = await self.client.request("GET", get_wallet_history_url, params=params)
+        assert resp.status == 400
+
+
+class TestGetWalletHistoryDateRange(BaseTestClass):
+    async def setUpAsync(self):
+        self.wallet_address = 'GDHZCRVQP3W3GUSZMC3ECHRG3WVQQZXVDHY5TOQ5AB5JKRSSUUZ6XDUE'
+        self.start_date = datetime(2018, 5, 2, tzinfo=timezone.utc)
+        self.end_date = datetime(2018, 5, 4, tzinfo=timezone.utc)
+
+    def _page(self, *days):
+        return {'_embedded': {'records': [
+            {'paging_token': f'{day}-1', 'created_at': f'2018-05-{day:02d}T00:00:00Z'} for day in days
+        ]}}
+
+    @unittest_run_loop
+    @patch('wallet.get_wallet_history.ledger_index.find_ledger')
+    @patch('stellar.paginator.stellar.wallet.get_wallet_effect')
+    async def test_seek_start_date_and_stop_after_end_date(self, mock_effect, mock_find_ledger):
+        mock_find_ledger.return_value = 10
+        mock_effect.side_effect = [self._page(1, 2, 3), self._page(4, 5, 6), self._page(7)]
+
+        history = await get_wallet_history(self.wallet_address, 'asc', 3, None, self.start_date, self.end_date)
+
+        assert [record['paging_token'] for record in history['_embedded']['records']] == ['2-1', '3-1', '4-1']
+        assert history['cursor'] == '4-1'
+        mock_find_ledger.assert_called_once_with(self.start_date)
+        assert mock_effect.call_args_list[0][0] == (self.wallet_address, 'asc', 3, str(10 << 32))
+        assert mock_effect.call_args_list[1][0] == (self.wallet_address, 'asc', 3, '3-1')
+
+    @unittest_run_loop
+    @patch('wallet.get_wallet_history.ledger_index.find_ledger')
+    @patch('stellar.paginator.stellar.wallet.get_wallet_effect')
+    async def test_seek_end_date_when_sort_desc(self, mock_effect, mock_find_ledger):
+        mock_find_ledger.return_value = 10
+        mock_effect.side_effect = [self._page(5, 4, 3, 2), self._page(1)]
+
+        history = await get_wallet_history(self.wallet_address, 'desc', 4, None, self.start_date, self.end_date)
+
+        assert [record['paging_token'] for record in history['_embedded']['records']] == ['4-1', '3-1', '2-1']
+        mock_find_ledger.assert_called_once_with(self.end_date, after=True)
+        assert mock_effect.call_count == 2
+
+    @unittest_run_loop
+    @patch('wallet.get_wallet_history.ledger_index.find_ledger')
+    @patch('stellar.paginator.stellar.wallet.get_wallet_effect')
+    async def test_offset_is_not_seeked(self, mock_effect, mock_find_ledger):
+        mock_effect.return_value = self._page(3)
+
+        history = await get_wallet_history(self.wallet_address, 'asc', 2, '2-1', self.start_date, self.end_date)
+
+        assert len(history['_embedded']['records']) == 1
+        mock_find_ledger.assert_not_called()
+        assert mock_effect.call_args[0] == (self.wallet_address, 'asc', 2, '2-1')
+
+    @unittest_run_loop
+    @patch('stellar.paginator.stellar.wallet.get_wallet_effect')
+    async def test_filter_type_fill_page(self, mock_effect):
+        settings['HISTORY_PAGE_SIZE'], page_size = 3, settings['HISTORY_PAGE_SIZE']
+        pages = [self._page(1, 2, 3), self._page(4, 5, 6), self._page(7, 8)]
+        for page in pages:
+            for record in page['_embedded']['records']:
+                record['type'] = 'account_credited' if record['paging_token'] in ('2-1', '5-1', '8-1') else 'trade'
+        mock_effect.side_effect = pages
+
+        try:
+            history = await get_wallet_history(self.wallet_address, 'asc', 2, None, types={'account_credited'})
+        finally:
+            settings['HISTORY_PAGE_SIZE'] = page_size
+
+        assert [record['paging_token'] for record in history['_embedded']['records']] == ['2-1', '5-1']
+        assert history['cursor'] == '5-1'
+        assert mock_effect.call_args_list[0][0] == (self.wallet_address, 'asc', 3, None)
+        assert mock_effect.call_args_list[1][0] == (self.wallet_address, 'asc', 3, '3-1')
+
+    @unittest_run_loop
+    @patch('stellar.paginator.stellar.wallet.get_wallet_effect')
+    async def test_filter_type_stop_at_max_pages(self, mock_effect):
+        settings['HISTORY_PAGE_SIZE'], page_size = 3, settings['HISTORY_PAGE_SIZE']
+        settings['HISTORY_MAX_PAGES'], max_pages = 2, settings['HISTORY_MAX_PAGES']
+        pages = [self._page(1, 2, 3), self._page(4, 5, 6), self._page(7, 8, 9)]
+        for page in pages:
+            for record in page['_embedded']['records']:
+                record['type'] = 'trade'
+        mock_effect.side_effect = pages
+
+        try:
+            history = await get_wallet_history(self.wallet_address, 'asc', 2, None, types={'account_credited'})
+        finally:
+            settings['HISTORY_PAGE_SIZE'] = page_size
+            settings['HISTORY_MAX_PAGES'] = max_pages
+
+        assert history['_embedded']['records'] == []
+        assert history['cursor'] == '6-1'
+        assert mock_effect.call_count == 2
+
+    @unittest_run_loop
+    async def test_format_history_resume_from_cursor(self):
+        url = reverse('wallet-history', wallet_address=self.wallet_address)
+        history = {'_embedded': {'records': []}, 'cursor': '6-1'}
+
+        actual = await format_history(history, self.wallet_address, 10, 'asc', offset='1-1', types={'trade', 'account_credited'})
+
+        assert actual['next'] == f'{url}?offset=6-1&limit=10&sort=asc&type=account_credited%2Ctrade'
+        assert actual['previous'] == f'{url}?offset=1-1&limit=10&sort=desc&type=account_credited%2Ctrade'
+
+    @unittest_run_loop
+    async def test_format_history_keep_date_range(self):
+        url = reverse('wallet-history', wallet_address=self.wallet_address)
+        history = {'_embedded': {'records': []}}
+
+        actual = await format_history(history, self.wallet_address, 10, 'asc', self.start_date, self.end_date, '2-1')
+
+        date_range = 'start-date=2018-05-02T00%3A00%3A00%2B00%3A00&end-date=2018-05-04T00%3A00%3A00%2B00%3A00'
+        assert actual['history'] == []
+        assert actual['next'] == f'{url}?offset=2-1&limit=10&sort=asc&{date_range}'
+        assert actual['previous'] == f'{url}?offset=2-1&limit=10&sort=desc&{date_range}'
+
 
 class TestGetWalletHistory(BaseTestClass):
     async def setUpAsync(self):
@@ -0,0 +1,116 @@
+import csv
+import io
+import json
+
+from aiohttp import ClientPayloadError, web
+from aiohttp.test_utils import unittest_run_loop
+from asynctest import patch
+from tests.test_utils import BaseTestClass
+
+from conf import settings
+from router import reverse
+
+
+class TestGetWalletHistoryExport(BaseTestClass):
+    async def setUpAsync(self):
+        self.wallet_address = 'GDHZCRVQP3W3GUSZMC3ECHRG3WVQQZXVDHY5TOQ5AB5JKRSSUUZ6XDUE'
+        self.url = reverse('wallet-history-export', wallet_address=self.wallet_address)
+        settings['HISTORY_PAGE_SIZE'], self.page_size = 2, settings['HISTORY_PAGE_SIZE']
+
+    async def tearDownAsync(self):
+        settings['HISTORY_PAGE_SIZE'] = self.page_size
+
+    def _page(self, *tokens):
+        return {'_embedded': {'records': [
+            {
+                '_links': {},
+                'id': f'{token}',
+                'paging_token': f'{token}-1',
+                'account': self.wallet_address,
+                'type': 'account_credited',
+                'type_i': 2,
+                'created_at': '2018-05-03T13:31:45Z',
+                'amount': '10.0000000',
+                'asset_type': 'native',
+            } for token in tokens
+        ]}}
+
+    @unittest_run_loop
+    @patch('stellar.paginator.stellar.wallet.get_wallet_effect')
+    async def test_export_csv(self, mock_effect):
+        mock_effect.side_effect = [self._page(1, 2), self._page(3)]
+
+        resp = await self.client.request('GET', self.url)
+
+        assert resp.status == 200
+        assert resp.headers['Content-Type'].startswith('text/csv')
+        rows = list(csv.DictReader(io.StringIO(await resp.text())))
+        assert [row['offset'] for row in rows] == ['1-1', '2-1', '3-1']
+        assert rows[0]['amount'] == '10.0000000'
+        assert rows[0]['asset_code'] == ''
+        assert rows[0]['details'] == ''
+
+    @unittest_run_loop
+    @patch('stellar.paginator.stellar.wallet.get_wallet_effect')
+    async def test_export_ndjson(self, mock_effect):
+        mock_effect.side_effect = [self._page(2, 1), self._page()]
+
+        resp = await self.client.request('GET', self.url, params={'format': 'ndjson', 'sort': 'desc'})
+
+        assert resp.status == 200
+        lines = [json.loads(line) for line in (await resp.text()).splitlines()]
+        assert [line['offset'] for line in lines] == ['2-1', '1-1']
+        assert lines[0]['address'] == self.wallet_address
+        assert '_links' not in lines[0]
+
+    @unittest_run_loop
+    @patch('stellar.paginator.stellar.wallet.get_wallet_effect')
+    async def test_export_empty_history(self, mock_effect):
+        mock_effect.return_value = self._page()
+
+        resp = await self.client.request('GET', self.url)
+
+        assert resp.status == 200
+        assert (await resp.text()).splitlines() == [
+            'id,offset,address,type,created_at,amount,asset_type,asset_code,asset_issuer,details'
+        ]
+
+    @unittest_run_loop
+    @patch('stellar.paginator.stellar.wallet.get_wallet_effect')
+    async def test_export_unknown_wallet(self, mock_effect):
+        mock_effect.side_effect = web.HTTPNotFound(reason='Resource Missing')
+
+        resp = await self.client.request('GET', self.url)
+
+        assert resp.status == 404
+
+    @unittest_run_loop
+    @patch('stellar.paginator.stellar.wallet.get_wallet_effect')
+    async def test_export_ndjson_fail_on_second_page(self, mock_effect):
+        mock_effect.side_effect = [self._page(1, 2), web.HTTPServiceUnavailable(reason='Horizon is not available')]
+
+        resp = await self.client.request('GET', self.url, params={'format': 'ndjson'})
+
+        assert resp.status == 200
+        lines = []
+        with self.assertRaises(ClientPayloadError):
+            async for line in resp.content:
+                lines.append(json.loads(line))
+        assert [line.get('offset') for line in lines] == ['1-1', '2-1', None]
+        assert lines[-1] == {'message': 'Horizon is not available'}
+
+    @unittest_run_loop
+    @patch('stellar.paginator.stellar.wallet.get_wallet_effect')
+    async def test_export_csv_fail_on_second_page(self, mock_effect):
+        mock_effect.side_effect = [self._page(1, 2), web.HTTPServiceUnavailable(reason='Horizon is not available')]
+
+        resp = await self.client.request('GET', self.url)
+
+        assert resp.status == 200
+        with self.assertRaises(ClientPayloadError):
+            await resp.text()
+
+    @unittest_run_loop
+    async def test_export_invalid_format(self):
+        resp = await self.client.request('GET', self.url, params={'format': 'xml'})
+        assert resp.status == 400
@@ -30,23 +30,15 @@ class TestCreateWallet(BaseTestClass):
 
     @unittest_run_loop
     @patch('wallet.post_generate_wallet.get_signers')
-    @patch('wallet.post_generate_wallet.get_wallet')
+    @patch('wallet.post_generate_wallet.reserve_channel')
     @patch('wallet.post_generate_wallet.wallet_address_is_duplicate')
     @patch('wallet.post_generate_wallet.build_generate_wallet_transaction')
-    async def test_post_generate_wallet_from_request_success(self, mock_xdr, mock_check, mock_get_wallet, mock_signers):
+    async def test_post_generate_wallet_from_request_success(self, mock_xdr, mock_check, mock_reserve_channel, mock_signers):
         mock_signers.return_value = [{
             "public_key": "GDHH7XOUKIWA2NTMGBRD3P245P7SV2DAANU2RIONBAH6DGDLR5WISZZI",
             "weight": 1
         }]
-        mock_get_wallet.return_value = Wallet(
-                "1",
-                [],
-                "1",
-                {},
-                [],
-                {},
-                {}
-            )
+        mock_reserve_channel.return_value = (self.transaction_source_address, "1")
         mock_xdr.return_value = (b'test-xdr', b'test-transaction-envelop')
         mock_check.return_value = False
 
@@ -70,6 +62,7 @@ class TestCreateWallet(BaseTestClass):
                 "weight": 1
                 }
             ],
+            'transaction_source_address': self.transaction_source_address,
             'xdr': expect_unsigned_xdr,
             'transaction_url': f"{self.host}{reverse('transaction', transaction_hash=expect_tx_hash)}",
             'transaction_hash': expect_tx_hash,
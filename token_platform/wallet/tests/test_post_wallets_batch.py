@@ -0,0 +1,68 @@
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import unittest_run_loop
+from asynctest import patch
+from tests.test_utils import BaseTestClass
+
+from conf import settings
+from router import reverse
+
+
+class TestPostWalletsBatch(BaseTestClass):
+    async def setUpAsync(self):
+        self.first = 'GBVJJJH6VS5NNM5B4FZ3JQHWN6ANEAOSCEU4STPXPB24BHD5JO5VTGAD'
+        self.second = 'GDHH7XOUKIWA2NTMGBRD3P245P7SV2DAANU2RIONBAH6DGDLR5WISZZI'
+
+    @unittest_run_loop
+    @patch('wallet.post_wallets_batch.get_wallet_detail')
+    async def test_post_wallets_batch(self, mock_detail):
+        async def detail(wallet_address):
+            if wallet_address == self.second:
+                raise web.HTTPNotFound(reason='Resource Missing')
+            return {'wallet_address': wallet_address}
+
+        mock_detail.side_effect = detail
+        data = {'wallet_addresses': [self.first, self.second, self.first]}
+
+        resp = await self.client.request('POST', reverse('wallets-batch'), json=data)
+
+        assert resp.status == 200
+        assert await resp.json() == {
+            'wallets': [
+                {'wallet_address': self.first, 'status': 200, 'wallet': {'wallet_address': self.first}},
+                {'wallet_address': self.second, 'status': 404, 'error': 'Resource Missing'},
+            ]
+        }
+        assert mock_detail.call_count == 2
+
+    @unittest_run_loop
+    @patch('wallet.post_wallets_batch.get_wallet_detail')
+    async def test_post_wallets_batch_bounded_fan_out(self, mock_detail):
+        running = 0
+        max_running = 0
+
+        async def detail(wallet_address):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {}
+
+        mock_detail.side_effect = detail
+        data = {'wallet_addresses': [f'address-{i}' for i in range(10)]}
+
+        with patch.dict(settings, {'WALLET_BATCH_CONCURRENCY': 3}):
+            resp = await self.client.request('POST', reverse('wallets-batch'), json=data)
+
+        assert resp.status == 200
+        assert max_running == 3
+
+    @unittest_run_loop
+    async def test_post_wallets_batch_invalid_addresses(self):
+        resp = await self.client.request('POST', reverse('wallets-batch'), json={'wallet_addresses': 'address'})
+        assert resp.status == 400
+
+        resp = await self.client.request('POST', reverse('wallets-batch'), json={})
+        assert resp.status == 400